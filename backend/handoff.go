@@ -0,0 +1,90 @@
+package main
+
+import (
+	"encoding/json"
+	"fmt"
+	"os"
+
+	"main/utils/ampapi"
+)
+
+// --metadata-file hands the download the metadata the GUI already fetched
+// with --json-output, so the album lookup and per-track manifest lookups are
+// not repeated. The file uses the same shape as the probe output:
+//
+//	{"albumData": {...}, "tracks": [{"trackData": {"id": "..."}, "m3u8": "..."}]}
+//
+// Anything missing from it is fetched as usual.
+
+type metadataHandoff struct {
+	AlbumData json.RawMessage `json:"albumData"`
+	Tracks    []struct {
+		TrackData struct {
+			ID string `json:"id"`
+		} `json:"trackData"`
+		M3u8 string `json:"m3u8"`
+	} `json:"tracks"`
+
+	manifests map[string]string
+}
+
+var handoff *metadataHandoff
+
+func loadMetadataHandoff(path string) (*metadataHandoff, error) {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return nil, err
+	}
+	h := &metadataHandoff{}
+	if err := json.Unmarshal(data, h); err != nil {
+		return nil, fmt.Errorf("invalid metadata file: %w", err)
+	}
+	h.manifests = make(map[string]string, len(h.Tracks))
+	for _, t := range h.Tracks {
+		if t.TrackData.ID != "" && t.M3u8 != "" {
+			h.manifests[t.TrackData.ID] = t.M3u8
+		}
+	}
+	return h, nil
+}
+
+// manifestURL returns the enhancedHls URL probed for trackID, if one was handed over.
+func (h *metadataHandoff) manifestURL(trackID string) (string, bool) {
+	if h == nil {
+		return "", false
+	}
+	m3u8Url, ok := h.manifests[trackID]
+	return m3u8Url, ok
+}
+
+// albumResp returns the handed-over album response when it is the full
+// catalog response for albumID.
+func (h *metadataHandoff) albumResp(albumID string) (*ampapi.AlbumResp, bool) {
+	if h == nil || len(h.AlbumData) == 0 {
+		return nil, false
+	}
+	var data ampapi.AlbumRespData
+	if err := json.Unmarshal(h.AlbumData, &data); err != nil {
+		return nil, false
+	}
+	if data.Type != "albums" || data.ID != albumID || len(data.Relationships.Tracks.Data) == 0 {
+		return nil, false
+	}
+	return &ampapi.AlbumResp{Data: []ampapi.AlbumRespData{data}}, true
+}
+
+// songManifestURL returns the enhancedHls master playlist for a track,
+// preferring the handed-over probe result over a catalog lookup.
+func songManifestURL(storefront, trackID, language, token string) (string, error) {
+	if m3u8Url, ok := handoff.manifestURL(trackID); ok {
+		return m3u8Url, nil
+	}
+	manifest, err := ampapi.GetSongResp(storefront, trackID, language, token)
+	if err != nil {
+		return "", err
+	}
+	if len(manifest.Data) == 0 {
+		return "", fmt.Errorf("no song data for %s", trackID)
+	}
+	return manifest.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls, nil
+}
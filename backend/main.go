@@ -42,12 +42,13 @@ var (
 	dl_mv             bool
 	json_output       bool
 	resolve_artist    string
+	selectedTracks    []string
 	Config            structs.ConfigSet
 	counter           structs.Counter
 	okDict            = make(map[string][]int)
 	progressWriter    *bufio.Writer
 	httpClient        *http.Client
-	makeCuratorFolder = flag.Bool("make-curator-folder", false, "Create curator folder structure")
+	makeCuratorFolder = new(bool)
 )
 
 type ArtistMediaItem struct {
@@ -100,6 +101,7 @@ type TrackProbe struct {
 	TrackData          ampapi.TrackRespData `json:"trackData"`
 	AvailableQualities []QualityInfo        `json:"availableQualities"`
 	AvailableCodecs    []string             `json:"availableCodecs"`
+	M3u8               string               `json:"m3u8,omitempty"`
 }
 
 type ProbeJob struct {
@@ -363,13 +365,56 @@ func ripSong(songId string, token string, storefront string, mediaUserToken stri
 	albumId := songData.Relationships.Albums.Data[0].ID
 
 	dl_song = true
-	err = ripAlbum(albumId, token, storefront, mediaUserToken, songId)
+	err = ripAlbum(albumId, token, storefront, mediaUserToken, songId, nil)
 	if err != nil {
 		fmt.Fprintf(os.Stderr, "Failed to rip song: %v\n", err)
 	}
 	return err
 }
 
+// reportSelectionSkip tells the GUI a selected track will not be downloaded,
+// so the job's track count still adds up.
+func reportSelectionSkip(trackID string, reason string) {
+	jsonData, err := json.Marshal(map[string]string{
+		"type":   "track_skip",
+		"name":   "Track " + trackID,
+		"reason": reason,
+	})
+	if err == nil {
+		fmt.Fprintf(progressWriter, "AMDL_PROGRESS::%s\n", string(jsonData))
+		progressWriter.Flush()
+	}
+}
+
+// ripSelectedSongs downloads tracks picked from a playlist into their album
+// folders, where single-song downloads put them. Tracks from the same album
+// share one album lookup.
+func ripSelectedSongs(trackIDs []string, token string, storefront string, mediaUserToken string) {
+	var albumOrder []string
+	byAlbum := make(map[string][]string)
+	for _, songId := range trackIDs {
+		manifest, err := ampapi.GetSongResp(storefront, songId, Config.Language, token)
+		if err != nil || len(manifest.Data) == 0 || len(manifest.Data[0].Relationships.Albums.Data) == 0 {
+			fmt.Fprintf(os.Stderr, "Failed to find album for song %s: %v\n", songId, err)
+			reportSelectionSkip(songId, "Album not found")
+			continue
+		}
+		albumId := manifest.Data[0].Relationships.Albums.Data[0].ID
+		if _, ok := byAlbum[albumId]; !ok {
+			albumOrder = append(albumOrder, albumId)
+		}
+		byAlbum[albumId] = append(byAlbum[albumId], songId)
+	}
+	for _, albumId := range albumOrder {
+		if err := ripAlbum(albumId, token, storefront, mediaUserToken, "", byAlbum[albumId]); err != nil {
+			fmt.Fprintf(os.Stderr, "Failed to process album %s: %v\n", albumId, err)
+			for _, songId := range byAlbum[albumId] {
+				reportSelectionSkip(songId, "Album not available")
+			}
+		}
+	}
+}
+
 func resolveArtistToJSON(artistUrl string, token string) (string, error) {
 	storefront, artistId := checkUrlArtist(artistUrl)
 	if storefront == "" || artistId == "" {
@@ -1084,6 +1129,7 @@ func probeTrack(track ampapi.TrackRespData, index int, storefront, language, tok
 		TrackData:          track,
 		AvailableQualities: qualities,
 		AvailableCodecs:    codecs,
+		M3u8:               m3u8Url,
 	}
 }
 
@@ -1258,11 +1304,11 @@ func ripPlaylist(playlistId string, token string, storefront string, mediaUserTo
 			Quality = "256Kbps"
 		} else {
 			if len(meta.Data[0].Relationships.Tracks.Data) > 0 {
-				manifest1, err := ampapi.GetSongResp(storefront, meta.Data[0].Relationships.Tracks.Data[0].ID, playlist.Language, token)
+				firstManifest, err := songManifestURL(storefront, meta.Data[0].Relationships.Tracks.Data[0].ID, playlist.Language, token)
 				if err != nil {
 					fmt.Fprintf(os.Stderr, "Failed to get manifest.\n %v\n", err)
 				} else {
-					if manifest1.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls == "" {
+					if firstManifest == "" {
 						Codec = "AAC"
 						Quality = "256Kbps"
 					} else {
@@ -1276,10 +1322,10 @@ func ripPlaylist(playlistId string, token string, storefront string, mediaUserTo
 						if needCheck {
 							EnhancedHls_m3u8, _ = checkM3u8(meta.Data[0].Relationships.Tracks.Data[0].ID, "album")
 							if strings.HasSuffix(EnhancedHls_m3u8, ".m3u8") {
-								manifest1.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls = EnhancedHls_m3u8
+								firstManifest = EnhancedHls_m3u8
 							}
 						}
-						_, Quality, err = extractMedia(manifest1.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls, true)
+						_, Quality, err = extractMedia(firstManifest, true)
 						if err != nil {
 							fmt.Fprintf(os.Stderr, "Failed to extract quality from manifest.\n %v\n", err)
 							if Codec == "AAC" {
@@ -1365,6 +1411,10 @@ func ripPlaylist(playlistId string, token string, storefront string, mediaUserTo
 	}
 
 	for i := range playlist.Tracks {
+		if m3u8Url, ok := handoff.manifestURL(playlist.Tracks[i].ID); ok {
+			playlist.Tracks[i].M3u8 = m3u8Url
+			continue
+		}
 		manifest, err := ampapi.GetSongResp(storefront, playlist.Tracks[i].ID, playlist.Language, token)
 		if err != nil {
 			continue
@@ -1392,9 +1442,14 @@ func ripPlaylist(playlistId string, token string, storefront string, mediaUserTo
 	return nil
 }
 
-func ripAlbum(albumId string, token string, storefront string, mediaUserToken string, urlArg_i string) error {
+func ripAlbum(albumId string, token string, storefront string, mediaUserToken string, urlArg_i string, selected []string) error {
 	album := task.NewAlbum(storefront, albumId)
-	err := album.GetResp(token, Config.Language)
+	var err error
+	if resp, ok := handoff.albumResp(albumId); ok && !json_output {
+		album.SetResp(*resp, Config.Language)
+	} else {
+		err = album.GetResp(token, Config.Language)
+	}
 	if err != nil {
 		return err
 	}
@@ -1494,8 +1549,7 @@ func ripAlbum(albumId string, token string, storefront string, mediaUserToken st
 		probe := AlbumProbe{AlbumData: meta.Data[0], Tracks: probedTracks}
 		jsonBytes, err := json.Marshal(probe)
 		if err != nil {
-			log.Fatalf("FATAL: Failed to marshal album probe to JSON: %v", err)
-			return err
+			return fmt.Errorf("failed to marshal album probe to JSON: %w", err)
 		}
 		fmt.Println("AMDL_JSON_START")
 		fmt.Println(string(jsonBytes))
@@ -1540,11 +1594,11 @@ func ripAlbum(albumId string, token string, storefront string, mediaUserToken st
 		} else if Codec == "AAC" && (Config.AacType == "aac-lc" || Config.AacType == "aac") {
 			Quality = "256Kbps"
 		} else {
-			manifest1, err := ampapi.GetSongResp(storefront, meta.Data[0].Relationships.Tracks.Data[0].ID, album.Language, token)
+			firstManifest, err := songManifestURL(storefront, meta.Data[0].Relationships.Tracks.Data[0].ID, album.Language, token)
 			if err != nil {
 				fmt.Fprintf(os.Stderr, "Failed to get manifest.\n %v\n", err)
 			} else {
-				if manifest1.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls == "" {
+				if firstManifest == "" {
 					Codec = "AAC"
 					Quality = "256Kbps"
 				} else {
@@ -1558,10 +1612,10 @@ func ripAlbum(albumId string, token string, storefront string, mediaUserToken st
 					if needCheck {
 						EnhancedHls_m3u8, _ = checkM3u8(meta.Data[0].Relationships.Tracks.Data[0].ID, "album")
 						if strings.HasSuffix(EnhancedHls_m3u8, ".m3u8") {
-							manifest1.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls = EnhancedHls_m3u8
+							firstManifest = EnhancedHls_m3u8
 						}
 					}
-					_, Quality, err = extractMedia(manifest1.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls, true)
+					_, Quality, err = extractMedia(firstManifest, true)
 					if err != nil {
 						fmt.Fprintf(os.Stderr, "Failed to extract quality from manifest.\n %v\n", err)
 						if Codec == "AAC" {
@@ -1648,42 +1702,45 @@ func ripAlbum(albumId string, token string, storefront string, mediaUserToken st
 		album.Tracks[i].Codec = Codec
 	}
 
-	if dl_song {
+	if dl_song || len(selected) > 0 {
+		// A single song (?i=) or a track selection: each is numbered by its
+		// place on the album, exactly as a one-song download would be.
+		wanted := make(map[string]bool, len(selected)+1)
 		if urlArg_i != "" {
-			for i := range album.Tracks {
-				if urlArg_i == album.Tracks[i].ID {
-					album.Tracks[i].TaskNum = album.Tracks[i].Resp.Attributes.TrackNumber
-					album.Tracks[i].TaskTotal = meta.Data[0].Attributes.TrackCount
-
-					manifest, err := ampapi.GetSongResp(storefront, album.Tracks[i].ID, album.Language, token)
-					if err == nil {
-						var m3u8Url string
-						if manifest.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls != "" {
-							m3u8Url = manifest.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls
-						}
+			wanted[urlArg_i] = true
+		}
+		for _, id := range selected {
+			wanted[id] = true
+		}
+		for i := range album.Tracks {
+			if !wanted[album.Tracks[i].ID] {
+				continue
+			}
+			delete(wanted, album.Tracks[i].ID)
+			album.Tracks[i].TaskNum = album.Tracks[i].Resp.Attributes.TrackNumber
+			album.Tracks[i].TaskTotal = meta.Data[0].Attributes.TrackCount
 
-						album.Tracks[i].M3u8 = m3u8Url
-					}
+			m3u8Url, err := songManifestURL(storefront, album.Tracks[i].ID, album.Language, token)
+			if err == nil {
+				album.Tracks[i].M3u8 = m3u8Url
+			}
 
-					ripTrack(&album.Tracks[i], token, mediaUserToken, discTrackCounts)
-					return nil
-				}
+			ripTrack(&album.Tracks[i], token, mediaUserToken, discTrackCounts)
+		}
+		for _, id := range selected {
+			if wanted[id] {
+				reportSelectionSkip(id, "Not on this album")
 			}
 		}
 		return nil
 	}
 
 	for i := range album.Tracks {
-		manifest, err := ampapi.GetSongResp(storefront, album.Tracks[i].ID, album.Language, token)
+		m3u8Url, err := songManifestURL(storefront, album.Tracks[i].ID, album.Language, token)
 		if err != nil {
 			continue
 		}
 
-		var m3u8Url string
-		if manifest.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls != "" {
-			m3u8Url = manifest.Data[0].Attributes.ExtendedAssetUrls.EnhancedHls
-		}
-
 		album.Tracks[i].M3u8 = m3u8Url
 
 		ripTrack(&album.Tracks[i], token, mediaUserToken, discTrackCounts)
@@ -2390,90 +2447,141 @@ func main() {
 		fmt.Fprintf(os.Stderr, "load Config failed: %v\n", err)
 		return
 	}
-	token, err := ampapi.GetToken()
+	token, err := fetchToken()
 	if err != nil {
-		if Config.AuthorizationToken != "" && Config.AuthorizationToken != "your-authorization-token" {
-			token = strings.Replace(Config.AuthorizationToken, "Bearer ", "", -1)
-		} else {
-			fmt.Fprintln(os.Stderr, "Failed to get token.")
-			return
-		}
+		fmt.Fprintln(os.Stderr, "Failed to get token.")
+		return
 	}
 
-	codecPreferenceFlag := flag.String("codec-preference", "", "Codec preference")
-	songFlag := flag.Bool("song", false, "Download a single song")
-	mvFlag := flag.Bool("music-video", false, "Download a music video")
-	jsonOutputFlag := flag.Bool("json-output", false, "Output metadata as JSON")
-	resolveArtistFlag := flag.String("resolve-artist", "", "Resolve artist discography")
-
-	flag.StringVar(&Config.AlacSaveFolder, "alac-save-folder", Config.AlacSaveFolder, "Overrides alac-save-folder from config")
-	flag.StringVar(&Config.AtmosSaveFolder, "atmos-save-folder", Config.AtmosSaveFolder, "Overrides atmos-save-folder from config")
-	flag.StringVar(&Config.AacSaveFolder, "aac-save-folder", Config.AacSaveFolder, "Overrides aac-save-folder from config")
-	flag.StringVar(&Config.MvSaveFolder, "mv-save-folder", Config.MvSaveFolder, "Overrides mv-save-folder from config")
-	flag.StringVar(&Config.LrcType, "lrc-type", Config.LrcType, "Lyrics type")
-	flag.StringVar(&Config.LrcFormat, "lrc-format", Config.LrcFormat, "Lyrics format")
-	flag.BoolVar(&Config.EmbedLrc, "embed-lrc", Config.EmbedLrc, "Embed lyrics")
-	flag.BoolVar(&Config.SaveLrcFile, "save-lrc-file", Config.SaveLrcFile, "Save lyrics file")
-	flag.BoolVar(&Config.EmbedCover, "embed-cover", Config.EmbedCover, "Embed cover art")
-	flag.StringVar(&Config.CoverSize, "cover-size", Config.CoverSize, "Cover art size")
-	flag.StringVar(&Config.CoverFormat, "cover-format", Config.CoverFormat, "Cover art format")
-	flag.IntVar(&Config.AlacMax, "alac-max", Config.AlacMax, "Max sample rate for ALAC")
-	flag.IntVar(&Config.AtmosMax, "atmos-max", Config.AtmosMax, "Max bitrate for Atmos")
-	flag.StringVar(&Config.AacType, "aac-type", Config.AacType, "AAC type")
-	flag.StringVar(&Config.MVAudioType, "mv-audio-type", Config.MVAudioType, "Music video audio type")
-	flag.IntVar(&Config.MVMax, "mv-max", Config.MVMax, "Max resolution for music videos")
-	flag.StringVar(&Config.AlbumFolderFormat, "album-folder-format", Config.AlbumFolderFormat, "Album folder format")
-	flag.StringVar(&Config.PlaylistFolderFormat, "playlist-folder-format", Config.PlaylistFolderFormat, "Playlist folder format")
-	flag.StringVar(&Config.SongFileFormat, "song-file-format", Config.SongFileFormat, "Song file format")
-	flag.StringVar(&Config.MvFileFormat, "mv-file-format", Config.MvFileFormat, "Music video file format")
-	flag.StringVar(&Config.ArtistFolderFormat, "artist-folder-format", Config.ArtistFolderFormat, "Artist folder format")
-	flag.StringVar(&Config.MediaUserToken, "media-user-token", Config.MediaUserToken, "Media user token")
-	flag.StringVar(&Config.AuthorizationToken, "authorization-token", Config.AuthorizationToken, "Authorization token")
-	flag.StringVar(&Config.Language, "language", Config.Language, "Language")
-	flag.BoolVar(&Config.SaveArtistCover, "save-artist-cover", Config.SaveArtistCover, "Save artist cover")
-	flag.BoolVar(&Config.SaveAnimatedArtwork, "save-animated-artwork", Config.SaveAnimatedArtwork, "Save animated artwork")
-	flag.BoolVar(&Config.EmbyAnimatedArtwork, "emby-animated-artwork", Config.EmbyAnimatedArtwork, "Save animated artwork for Emby")
-	flag.IntVar(&Config.MaxMemoryLimit, "max-memory-limit", Config.MaxMemoryLimit, "Max memory limit")
-	flag.StringVar(&Config.DecryptM3u8Port, "decrypt-m3u8-port", Config.DecryptM3u8Port, "Decrypt M3U8 port")
-	flag.StringVar(&Config.GetM3u8Port, "get-m3u8-port", Config.GetM3u8Port, "Get M3U8 port")
-	flag.BoolVar(&Config.GetM3u8FromDevice, "get-m3u8-from-device", Config.GetM3u8FromDevice, "Get M3U8 from device")
-	flag.StringVar(&Config.GetM3u8Mode, "get-m3u8-mode", Config.GetM3u8Mode, "Get M3U8 mode")
-	flag.IntVar(&Config.LimitMax, "limit-max", Config.LimitMax, "Limit max characters in filename")
-	flag.StringVar(&Config.ExplicitChoice, "explicit-choice", Config.ExplicitChoice, "Explicit tag")
-	flag.StringVar(&Config.CleanChoice, "clean-choice", Config.CleanChoice, "Clean tag")
-	flag.StringVar(&Config.AppleMasterChoice, "apple-master-choice", Config.AppleMasterChoice, "Apple Master tag")
-	flag.BoolVar(&Config.UseSongInfoForPlaylist, "use-songinfo-for-playlist", Config.UseSongInfoForPlaylist, "Use song info for playlist")
-	flag.BoolVar(&Config.DlAlbumcoverForPlaylist, "dl-albumcover-for-playlist", Config.DlAlbumcoverForPlaylist, "Download album cover for playlist")
-	flag.StringVar(&Config.Storefront, "storefront", Config.Storefront, "Storefront")
-
-	flag.Parse()
+	if len(os.Args) > 1 && os.Args[1] == "--serve" {
+		serve(token)
+		return
+	}
+	code := run(os.Args[1:], token)
+	progressWriter.Flush()
+	if code != 0 {
+		os.Exit(code)
+	}
+}
+
+// fetchToken scrapes a developer token, falling back to the one in config.
+func fetchToken() (string, error) {
+	token, err := ampapi.GetToken()
+	if err == nil {
+		return token, nil
+	}
+	if Config.AuthorizationToken != "" && Config.AuthorizationToken != "your-authorization-token" {
+		return strings.Replace(Config.AuthorizationToken, "Bearer ", "", -1), nil
+	}
+	return "", err
+}
+
+// parseFlags binds one invocation's command line onto Config and the mode globals.
+// Defaults come from the current Config, so call it after Config has been reset.
+func parseFlags(args []string) ([]string, error) {
+	fs := flag.NewFlagSet("downloader", flag.ContinueOnError)
+	codecPreferenceFlag := fs.String("codec-preference", "", "Codec preference")
+	songFlag := fs.Bool("song", false, "Download a single song")
+	mvFlag := fs.Bool("music-video", false, "Download a music video")
+	jsonOutputFlag := fs.Bool("json-output", false, "Output metadata as JSON")
+	resolveArtistFlag := fs.String("resolve-artist", "", "Resolve artist discography")
+	metadataFileFlag := fs.String("metadata-file", "", "Reuse metadata already fetched with --json-output")
+	selectTracksFlag := fs.String("select-tracks", "", "Comma-separated track IDs to download from the album or playlist")
+
+	fs.StringVar(&Config.AlacSaveFolder, "alac-save-folder", Config.AlacSaveFolder, "Overrides alac-save-folder from config")
+	fs.StringVar(&Config.AtmosSaveFolder, "atmos-save-folder", Config.AtmosSaveFolder, "Overrides atmos-save-folder from config")
+	fs.StringVar(&Config.AacSaveFolder, "aac-save-folder", Config.AacSaveFolder, "Overrides aac-save-folder from config")
+	fs.StringVar(&Config.MvSaveFolder, "mv-save-folder", Config.MvSaveFolder, "Overrides mv-save-folder from config")
+	fs.StringVar(&Config.LrcType, "lrc-type", Config.LrcType, "Lyrics type")
+	fs.StringVar(&Config.LrcFormat, "lrc-format", Config.LrcFormat, "Lyrics format")
+	fs.BoolVar(&Config.EmbedLrc, "embed-lrc", Config.EmbedLrc, "Embed lyrics")
+	fs.BoolVar(&Config.SaveLrcFile, "save-lrc-file", Config.SaveLrcFile, "Save lyrics file")
+	fs.BoolVar(&Config.EmbedCover, "embed-cover", Config.EmbedCover, "Embed cover art")
+	fs.StringVar(&Config.CoverSize, "cover-size", Config.CoverSize, "Cover art size")
+	fs.StringVar(&Config.CoverFormat, "cover-format", Config.CoverFormat, "Cover art format")
+	fs.IntVar(&Config.AlacMax, "alac-max", Config.AlacMax, "Max sample rate for ALAC")
+	fs.IntVar(&Config.AtmosMax, "atmos-max", Config.AtmosMax, "Max bitrate for Atmos")
+	fs.StringVar(&Config.AacType, "aac-type", Config.AacType, "AAC type")
+	fs.StringVar(&Config.MVAudioType, "mv-audio-type", Config.MVAudioType, "Music video audio type")
+	fs.IntVar(&Config.MVMax, "mv-max", Config.MVMax, "Max resolution for music videos")
+	fs.StringVar(&Config.AlbumFolderFormat, "album-folder-format", Config.AlbumFolderFormat, "Album folder format")
+	fs.StringVar(&Config.PlaylistFolderFormat, "playlist-folder-format", Config.PlaylistFolderFormat, "Playlist folder format")
+	fs.StringVar(&Config.SongFileFormat, "song-file-format", Config.SongFileFormat, "Song file format")
+	fs.StringVar(&Config.MvFileFormat, "mv-file-format", Config.MvFileFormat, "Music video file format")
+	fs.StringVar(&Config.ArtistFolderFormat, "artist-folder-format", Config.ArtistFolderFormat, "Artist folder format")
+	fs.StringVar(&Config.MediaUserToken, "media-user-token", Config.MediaUserToken, "Media user token")
+	fs.StringVar(&Config.AuthorizationToken, "authorization-token", Config.AuthorizationToken, "Authorization token")
+	fs.StringVar(&Config.Language, "language", Config.Language, "Language")
+	fs.BoolVar(&Config.SaveArtistCover, "save-artist-cover", Config.SaveArtistCover, "Save artist cover")
+	fs.BoolVar(&Config.SaveAnimatedArtwork, "save-animated-artwork", Config.SaveAnimatedArtwork, "Save animated artwork")
+	fs.BoolVar(&Config.EmbyAnimatedArtwork, "emby-animated-artwork", Config.EmbyAnimatedArtwork, "Save animated artwork for Emby")
+	fs.IntVar(&Config.MaxMemoryLimit, "max-memory-limit", Config.MaxMemoryLimit, "Max memory limit")
+	fs.StringVar(&Config.DecryptM3u8Port, "decrypt-m3u8-port", Config.DecryptM3u8Port, "Decrypt M3U8 port")
+	fs.StringVar(&Config.GetM3u8Port, "get-m3u8-port", Config.GetM3u8Port, "Get M3U8 port")
+	fs.BoolVar(&Config.GetM3u8FromDevice, "get-m3u8-from-device", Config.GetM3u8FromDevice, "Get M3U8 from device")
+	fs.StringVar(&Config.GetM3u8Mode, "get-m3u8-mode", Config.GetM3u8Mode, "Get M3U8 mode")
+	fs.IntVar(&Config.LimitMax, "limit-max", Config.LimitMax, "Limit max characters in filename")
+	fs.StringVar(&Config.ExplicitChoice, "explicit-choice", Config.ExplicitChoice, "Explicit tag")
+	fs.StringVar(&Config.CleanChoice, "clean-choice", Config.CleanChoice, "Clean tag")
+	fs.StringVar(&Config.AppleMasterChoice, "apple-master-choice", Config.AppleMasterChoice, "Apple Master tag")
+	fs.BoolVar(&Config.UseSongInfoForPlaylist, "use-songinfo-for-playlist", Config.UseSongInfoForPlaylist, "Use song info for playlist")
+	fs.BoolVar(&Config.DlAlbumcoverForPlaylist, "dl-albumcover-for-playlist", Config.DlAlbumcoverForPlaylist, "Download album cover for playlist")
+	fs.StringVar(&Config.Storefront, "storefront", Config.Storefront, "Storefront")
+
+	fs.BoolVar(makeCuratorFolder, "make-curator-folder", false, "Create curator folder structure")
+	if err := fs.Parse(args); err != nil {
+		return nil, err
+	}
 
 	codecPreference = *codecPreferenceFlag
 	dl_song = *songFlag
 	dl_mv = *mvFlag
 	json_output = *jsonOutputFlag
 	resolve_artist = *resolveArtistFlag
+	selectedTracks = nil
+	for _, id := range strings.Split(*selectTracksFlag, ",") {
+		if id = strings.TrimSpace(id); id != "" {
+			selectedTracks = append(selectedTracks, id)
+		}
+	}
+	handoff = nil
+	if *metadataFileFlag != "" {
+		h, err := loadMetadataHandoff(*metadataFileFlag)
+		if err != nil {
+			fmt.Fprintf(os.Stderr, "Ignoring metadata file: %v\n", err)
+		} else {
+			handoff = h
+		}
+	}
+	return fs.Args(), nil
+}
 
-	args := flag.Args()
+// run executes one CLI invocation (everything after the program name) and
+// returns its exit code. It is shared by the one-shot CLI and --serve mode.
+func run(argv []string, token string) int {
+	args, err := parseFlags(argv)
+	if err != nil {
+		return 2
+	}
 
 	if resolve_artist != "" {
 		if !json_output {
 			fmt.Fprintln(os.Stderr, "Error: --resolve-artist requires --json-output flag.")
-			os.Exit(1)
+			return 1
 		}
 		jsonResult, err := resolveArtistToJSON(resolve_artist, token)
 		if err != nil {
 			fmt.Fprintf(os.Stderr, "Error resolving artist: %v\n", err)
-			os.Exit(1)
+			return 1
 		}
 		fmt.Println("AMDL_JSON_START")
 		fmt.Println(jsonResult)
 		fmt.Println("AMDL_JSON_END")
-		return
+		return 0
 	}
 
 	if len(args) == 0 {
-		return
+		return 0
 	}
 
 	urlRaw := args[0]
@@ -2489,13 +2597,13 @@ func main() {
 		} else {
 			fmt.Fprintf(os.Stderr, "Invalid song URL\n")
 		}
-		return
+		return 0
 	}
 
 	parse, err := url.Parse(urlRaw)
 	if err != nil {
 		log.Printf("Invalid URL: %v\n", err)
-		return
+		return 0
 	}
 	urlArg_i := parse.Query().Get("i")
 
@@ -2503,14 +2611,14 @@ func main() {
 		storefront, mvId := checkUrlMv(urlRaw)
 		if mvId == "" {
 			fmt.Fprintf(os.Stderr, "Invalid music video URL\n")
-			return
+			return 0
 		}
 
 		if json_output {
 			mvInfo, err := ampapi.GetMusicVideoResp(storefront, mvId, Config.Language, token)
 			if err != nil || len(mvInfo.Data) == 0 {
 				fmt.Fprintf(os.Stderr, "Failed to get MV info: %v\n", err)
-				return
+				return 0
 			}
 
 			albumData := map[string]interface{}{
@@ -2547,20 +2655,20 @@ func main() {
 			jsonBytes, err := json.Marshal(probe)
 			if err != nil {
 				fmt.Fprintf(os.Stderr, "Failed to marshal music video data: %v\n", err)
-				return
+				return 0
 			}
 
 			fmt.Println("AMDL_JSON_START")
 			fmt.Println(string(jsonBytes))
 			fmt.Println("AMDL_JSON_END")
-			return
+			return 0
 		}
 
 		if dl_mv {
 			mvInfo, err := ampapi.GetMusicVideoResp(storefront, mvId, Config.Language, token)
 			if err != nil {
 				fmt.Fprintf(os.Stderr, "Failed to get MV info: %v\n", err)
-				return
+				return 0
 			}
 			artistName := mvInfo.Data[0].Attributes.ArtistName
 			var singerFoldername string
@@ -2590,14 +2698,16 @@ func main() {
 			if urlArg_i != "" {
 				dl_song = true
 			}
-			err := ripAlbum(albumId, token, storefront, mediaUserToken, urlArg_i)
+			err := ripAlbum(albumId, token, storefront, mediaUserToken, urlArg_i, selectedTracks)
 			if err != nil {
 				fmt.Fprintf(os.Stderr, "Failed to process album %s: %v\n", albumId, err)
 			}
 		}
 	} else if strings.Contains(urlRaw, "/playlist/") {
 		storefront, playlistId := checkUrlPlaylist(urlRaw)
-		if playlistId != "" {
+		if playlistId != "" && len(selectedTracks) > 0 && !json_output {
+			ripSelectedSongs(selectedTracks, token, storefront, mediaUserToken)
+		} else if playlistId != "" {
 			err := ripPlaylist(playlistId, token, storefront, mediaUserToken)
 			if err != nil {
 				fmt.Fprintf(os.Stderr, "Failed to process playlist %s: %v\n", playlistId, err)
@@ -2606,4 +2716,5 @@ func main() {
 	} else {
 		fmt.Fprintf(os.Stderr, "URL type not supported by this bridge: %s\n", urlRaw)
 	}
-}
\ No newline at end of file
+	return 0
+}
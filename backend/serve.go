@@ -0,0 +1,251 @@
+package main
+
+import (
+	"bufio"
+	"bytes"
+	"encoding/base64"
+	"encoding/json"
+	"fmt"
+	"io"
+	"log"
+	"os"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	"main/utils/structs"
+)
+
+// --serve keeps one backend process alive for many operations. The GUI writes
+// newline-delimited JSON requests to stdin:
+//
+//	{"id": 7, "method": "run", "params": {"args": ["--json-output", "<url>"]}}
+//
+// args are exactly what would follow the program name on a one-shot command
+// line. Requests run one at a time in arrival order. Everything the operation
+// prints is streamed back on stdout, tagged with the request id:
+//
+//	{"id": 7, "event": "stdout", "data": "AMDL_PROGRESS::{...}"}
+//	{"id": 7, "event": "stderr", "data": "Fetching album details..."}
+//	{"id": 7, "result": {"code": 0}}
+//
+// A {"id": 0, "event": "ready"} line is sent once the token has been fetched.
+// The token is fetched again before a request once its JWT exp is near, or
+// after tokenMaxAge when the token carries no readable exp.
+
+const rpcSyncMarker = "\x00AMDL_RPC_SYNC"
+
+const (
+	tokenMaxAge        = 6 * time.Hour
+	tokenRefreshMargin = 10 * time.Minute
+)
+
+type servedToken struct {
+	value     string
+	fetchedAt time.Time
+	expires   time.Time
+}
+
+func newServedToken(value string) *servedToken {
+	return &servedToken{value: value, fetchedAt: time.Now(), expires: jwtExpiry(value)}
+}
+
+// jwtExpiry reads the exp claim of a JWT; the zero time if there is none.
+func jwtExpiry(token string) time.Time {
+	parts := strings.Split(token, ".")
+	if len(parts) != 3 {
+		return time.Time{}
+	}
+	payload, err := base64.RawURLEncoding.DecodeString(strings.TrimRight(parts[1], "="))
+	if err != nil {
+		return time.Time{}
+	}
+	var claims struct {
+		Exp int64 `json:"exp"`
+	}
+	if json.Unmarshal(payload, &claims) != nil || claims.Exp == 0 {
+		return time.Time{}
+	}
+	return time.Unix(claims.Exp, 0)
+}
+
+func (t *servedToken) stale(now time.Time) bool {
+	if !t.expires.IsZero() {
+		return now.After(t.expires.Add(-tokenRefreshMargin))
+	}
+	return now.Sub(t.fetchedAt) > tokenMaxAge
+}
+
+// current returns the token to run the next request with, refreshing it
+// first if it is stale. A failed refresh keeps the old token and is retried
+// before the following request.
+func (t *servedToken) current() string {
+	if !t.stale(time.Now()) {
+		return t.value
+	}
+	fresh, err := fetchToken()
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "Developer token refresh failed, keeping the current one: %v\n", err)
+		return t.value
+	}
+	*t = *newServedToken(fresh)
+	return t.value
+}
+
+type rpcRequest struct {
+	ID     int64  `json:"id"`
+	Method string `json:"method"`
+	Params struct {
+		Args []string `json:"args"`
+	} `json:"params"`
+}
+
+type rpcResult struct {
+	Code int `json:"code"`
+}
+
+type rpcMessage struct {
+	ID     int64      `json:"id"`
+	Event  string     `json:"event,omitempty"`
+	Data   string     `json:"data,omitempty"`
+	Result *rpcResult `json:"result,omitempty"`
+	Error  string     `json:"error,omitempty"`
+}
+
+type rpcWriter struct {
+	mu  sync.Mutex
+	enc *json.Encoder
+}
+
+func (w *rpcWriter) send(msg rpcMessage) {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+	if err := w.enc.Encode(msg); err != nil {
+		// The GUI has gone away; nothing is left to report to.
+		os.Exit(0)
+	}
+}
+
+// scanOutputLines splits on \n and on bare \r, the same way the GUI's
+// universal-newline readers split a one-shot process's output.
+func scanOutputLines(data []byte, atEOF bool) (advance int, token []byte, err error) {
+	if atEOF && len(data) == 0 {
+		return 0, nil, nil
+	}
+	if i := bytes.IndexAny(data, "\r\n"); i >= 0 {
+		if data[i] == '\r' && i+1 < len(data) && data[i+1] == '\n' {
+			return i + 2, data[:i], nil
+		}
+		if data[i] == '\r' && i+1 == len(data) && !atEOF {
+			return 0, nil, nil
+		}
+		return i + 1, data[:i], nil
+	}
+	if atEOF {
+		return len(data), data, nil
+	}
+	return 0, nil, nil
+}
+
+// pumpOutput forwards one redirected stream to the GUI as events for the
+// request currently running, and acknowledges sync markers on synced.
+func pumpOutput(r io.Reader, event string, current *atomic.Int64, out *rpcWriter, synced chan<- struct{}) {
+	scanner := bufio.NewScanner(r)
+	scanner.Buffer(make([]byte, 64*1024), 16*1024*1024)
+	scanner.Split(scanOutputLines)
+	for scanner.Scan() {
+		line := scanner.Text()
+		if line == rpcSyncMarker {
+			synced <- struct{}{}
+			continue
+		}
+		if line == "" {
+			continue
+		}
+		out.send(rpcMessage{ID: current.Load(), Event: event, Data: line})
+	}
+}
+
+func serve(initialToken string) {
+	out := &rpcWriter{enc: json.NewEncoder(os.Stdout)}
+	token := newServedToken(initialToken)
+
+	// Operations print with fmt, log and progress bars straight to the
+	// process's stdout/stderr; point those at pipes so every line can be
+	// tagged with its request id instead of corrupting the protocol stream.
+	outR, outW, err := os.Pipe()
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "serve: %v\n", err)
+		return
+	}
+	errR, errW, err := os.Pipe()
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "serve: %v\n", err)
+		return
+	}
+	os.Stdout = outW
+	os.Stderr = errW
+	log.SetOutput(errW)
+	progressWriter = bufio.NewWriter(outW)
+
+	var current atomic.Int64
+	outSynced := make(chan struct{})
+	errSynced := make(chan struct{})
+	go pumpOutput(outR, "stdout", &current, out, outSynced)
+	go pumpOutput(errR, "stderr", &current, out, errSynced)
+
+	out.send(rpcMessage{Event: "ready"})
+
+	requests := bufio.NewScanner(os.Stdin)
+	requests.Buffer(make([]byte, 64*1024), 4*1024*1024)
+	for requests.Scan() {
+		line := bytes.TrimSpace(requests.Bytes())
+		if len(line) == 0 {
+			continue
+		}
+		var req rpcRequest
+		if err := json.Unmarshal(line, &req); err != nil {
+			out.send(rpcMessage{Error: fmt.Sprintf("invalid request: %v", err)})
+			continue
+		}
+		if req.Method != "run" {
+			out.send(rpcMessage{ID: req.ID, Error: fmt.Sprintf("unknown method %q", req.Method)})
+			continue
+		}
+
+		current.Store(req.ID)
+		code := serveRequest(req.Params.Args, token)
+		progressWriter.Flush()
+
+		// Wait until both pumps have forwarded everything this request
+		// printed, so no line is attributed to the next request.
+		fmt.Fprint(outW, "\n"+rpcSyncMarker+"\n")
+		fmt.Fprint(errW, "\n"+rpcSyncMarker+"\n")
+		<-outSynced
+		<-errSynced
+
+		out.send(rpcMessage{ID: req.ID, Result: &rpcResult{Code: code}})
+	}
+}
+
+// serveRequest gives each request the same starting state a fresh process
+// would have: config re-read from disk, then counters and mode flags reset.
+func serveRequest(args []string, token *servedToken) (code int) {
+	defer func() {
+		if r := recover(); r != nil {
+			fmt.Fprintf(os.Stderr, "Backend operation failed: %v\n", r)
+			code = 1
+		}
+	}()
+
+	Config = structs.ConfigSet{}
+	if err := loadConfig(); err != nil {
+		fmt.Fprintf(os.Stderr, "load Config failed: %v\n", err)
+		return 1
+	}
+	counter = structs.Counter{}
+	okDict = make(map[string][]int)
+	*makeCuratorFolder = false
+	return run(args, token.current())
+}
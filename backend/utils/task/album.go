@@ -46,7 +46,16 @@ func (a *Album) GetResp(token, l string) error {
 	if err != nil {
 		return errors.New("error getting album response")
 	}
-	a.Resp = *resp
+	a.SetResp(*resp, l)
+	return nil
+}
+
+// SetResp fills the album and its tracks from an album response that was
+// already fetched.
+func (a *Album) SetResp(resp ampapi.AlbumResp, l string) {
+	a.Language = l
+	a.Resp = resp
+	a.Tracks = nil
 	//简化高频调用名称
 	a.Name = a.Resp.Data[0].Attributes.Name
 	//fmt.Println("Getting album response")
@@ -75,7 +84,6 @@ func (a *Album) GetResp(token, l string) error {
 			AlbumData: a.Resp.Data[0],
 		})
 	}
-	return nil
 }
 
 func (a *Album) GetArtwork() string {
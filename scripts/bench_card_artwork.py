@@ -0,0 +1,94 @@
+"""GUI-thread cost of putting artwork on a card, old path vs pre-rendered path.
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen python scripts/bench_card_artwork.py [cards]
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from PyQt6.QtWidgets import QApplication, QLabel
+from PyQt6.QtCore import Qt, QBuffer, QByteArray, QIODevice, QSize
+from PyQt6.QtGui import QImage, QPixmap, QLinearGradient, QPainter, QColor
+
+from ui.search_widgets import round_pixmap, render_artwork
+
+SOURCE_SIZE = 600
+CARD_SIZE = QSize(180, 180)
+
+
+def make_jpeg(size):
+    image = QImage(size, size, QImage.Format.Format_RGB32)
+    painter = QPainter(image)
+    gradient = QLinearGradient(0, 0, size, size)
+    gradient.setColorAt(0, QColor('#d60117'))
+    gradient.setColorAt(1, QColor('#1f1f1f'))
+    painter.fillRect(image.rect(), gradient)
+    painter.end()
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buf, 'JPG', 90)
+    return bytes(data)
+
+
+def legacy_slot(label, image_data):
+    # What SearchResultCard._set_artwork did before decoding moved off the GUI thread.
+    pixmap = QPixmap()
+    pixmap.loadFromData(image_data)
+    scaled = pixmap.scaled(label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    label.setPixmap(round_pixmap(scaled, 12))
+
+
+def prerendered_slot(label, image):
+    label.setPixmap(QPixmap.fromImage(image))
+
+
+def time_ms(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples):
+    print(f"{name:<28} mean {statistics.mean(samples):7.3f} ms   "
+          f"p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:7.3f} ms   "
+          f"total {sum(samples):8.1f} ms")
+
+
+def main():
+    cards = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    app = QApplication(sys.argv)
+    dpr = app.primaryScreen().devicePixelRatio() if app.primaryScreen() else 1.0
+
+    jpeg = make_jpeg(SOURCE_SIZE)
+    labels = [QLabel() for _ in range(cards)]
+    for label in labels:
+        label.setFixedSize(CARD_SIZE)
+
+    it = iter(labels)
+    before = time_ms(lambda: legacy_slot(next(it), jpeg), cards)
+
+    # Worker-side work, measured separately so the GUI-thread share is clear.
+    decoded = QImage.fromData(jpeg)
+    worker_samples = time_ms(lambda: render_artwork(decoded, CARD_SIZE, dpr, radius=12), cards)
+    rendered = render_artwork(decoded, CARD_SIZE, dpr, radius=12)
+
+    it = iter(labels)
+    after = time_ms(lambda: prerendered_slot(next(it), rendered), cards)
+
+    print(f"{cards} cards, {SOURCE_SIZE}px JPEG source, {CARD_SIZE.width()}px label, dpr {dpr}")
+    report("GUI thread, before", before)
+    report("GUI thread, after", after)
+    report("worker thread, after", worker_samples)
+    print(f"GUI-thread speedup per card: {statistics.mean(before) / max(statistics.mean(after), 1e-6):.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Artwork throughput for a 200-card grid against a local server.
+
+Compares the old one-connection-per-image urlopen path with the pooled
+keep-alive client. The server sleeps on every new connection to stand in for
+the TCP+TLS handshake a real CDN costs.
+
+Run from the repository root:
+    python scripts/bench_image_http.py [cards] [handshake_ms]
+"""
+import os
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from core.image_http import ImageHttpClient, USER_AGENT
+
+WORKERS = 4  # matches QThreadPool.globalInstance().setMaxThreadCount(4)
+PAYLOAD = os.urandom(30 * 1024)
+
+
+class ArtworkHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    handshake_delay = 0.0
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with ArtworkHandler.lock:
+            ArtworkHandler.connections += 1
+        time.sleep(self.handshake_delay)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/jpeg')
+        self.send_header('Content-Length', str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def fetch_urlopen(url):
+    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    with urllib.request.urlopen(req, timeout=8) as response:
+        return response.read()
+
+
+def run(name, fetch, urls):
+    ArtworkHandler.connections = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        total = sum(len(data) for data in pool.map(fetch, urls))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<22} {elapsed:6.2f} s   {len(urls) / elapsed:7.1f} img/s   "
+          f"{total / elapsed / 1024 / 1024:6.2f} MiB/s   {ArtworkHandler.connections:4d} connections")
+
+
+def main():
+    cards = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    ArtworkHandler.handshake_delay = (float(sys.argv[2]) if len(sys.argv) > 2 else 30.0) / 1000
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ArtworkHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    urls = [f"{base}/image/thumb/{i}/256x256bb.jpg" for i in range(cards)]
+
+    print(f"{cards} images of {len(PAYLOAD) // 1024} KiB, {WORKERS} workers, "
+          f"{ArtworkHandler.handshake_delay * 1000:.0f} ms simulated handshake")
+    run("urlopen per image", fetch_urlopen, urls)
+
+    client = ImageHttpClient(connections_per_host=WORKERS)
+    run("pooled keep-alive", client.fetch, urls)
+    client.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -2,16 +2,15 @@ import json
 import logging
 import os
 import re
-import subprocess
 import sys
 import requests
 import threading
+import time
 import traceback
 import base64
 import concurrent.futures
 import asyncio
 import aiohttp
-import time
 import yaml
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QRunnable, QThreadPool, QEventLoop
 from requests.adapters import HTTPAdapter
@@ -26,6 +25,18 @@ except ImportError:
     Opus = None
 
 from models.track import Album, Track
+from core.artwork_urls import sized_artwork_url
+from core.artwork_export import stream_to_file
+from core.async_loop import AsyncLoopService
+from core.catalog_client import CatalogClient, CatalogError
+from core.response_cache import load_quality_cache, load_response_cache, quality_key, search_key
+from core.token_store import TokenStore
+from core.lookup_batcher import LookupBatcher
+from core.backend_client import BackendClient, load_backend_settings
+from core.fetch_pipeline import FetchFailed, FetchPipeline, load_fetch_settings
+from core.rate_limiter import BACKGROUND, INTERACTIVE, rate_limiter
+from core.image_http import image_http
+from core import startup_metrics
 from xml.dom import minidom
 from xml.etree import ElementTree
 import datetime
@@ -33,6 +44,22 @@ import datetime
 if not logging.getLogger().handlers:
     logging.basicConfig(level=logging.INFO, format='[PYTHON] %(asctime)s - %(levelname)s - %(message)s')
 
+# Hosts the first search and its artwork will hit; opened during startup prewarm.
+PREWARM_API_URLS = ("https://amp-api.music.apple.com/", "https://music.apple.com/")
+PREWARM_ARTWORK_URLS = tuple(f"https://is{n}-ssl.mzstatic.com/" for n in range(1, 6))
+
+DEFAULT_PROBE_CONCURRENCY = 8
+
+# Backend errors a retry cannot fix: a malformed URL, or an item the catalog
+# does not have (in this storefront or quality). The backend reports catalog
+# lookups that failed with the bare HTTP status.
+PERMANENT_FETCH_ERRORS = re.compile(
+    r"not available in the selected quality|Invalid (?:song |music video )?URL|URL type not supported"
+    r"|\b(?:400 Bad Request|404 Not Found|410 Gone)\b"
+)
+# The backend exits with 2 when it cannot parse its arguments.
+BAD_ARGUMENTS_EXIT_CODE = 2
+
 def _resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -47,17 +74,25 @@ class SearchWorkerSignals(QObject):
     status_updated = pyqtSignal(str, str)
     artwork_results_appended = pyqtSignal(list)
 
-class SearchWorker(QRunnable):
+class SearchWorker:
+    """Runs one catalog coroutine on the controller loop; cancel() aborts it mid-request."""
+
     def __init__(self, fn, *args, **kwargs):
-        super().__init__()
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
         self.signals = SearchWorkerSignals()
         self._cancelled = False
+        self._future = None
+
+    def start(self, async_loop):
+        self._future = async_loop.submit(self.run())
+        return self
 
     def cancel(self):
         self._cancelled = True
+        if self._future is not None:
+            self._future.cancel()
 
     def is_cancelled(self):
         return self._cancelled
@@ -70,13 +105,14 @@ class SearchWorker(QRunnable):
                 
                 pass
 
-    @pyqtSlot()
-    def run(self):
+    async def run(self):
         try:
             if self._cancelled:
                 return
            
-            self.fn(self, self.signals, *self.args, **self.kwargs)
+            await self.fn(self, self.signals, *self.args, **self.kwargs)
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             if not self._cancelled:
                 logging.error(f"Error in worker function {self.fn.__name__}:\n{traceback.format_exc()}")
@@ -118,11 +154,7 @@ class Worker(QRunnable):
 
     @pyqtSlot()
     def run(self):
-       
-        if asyncio.iscoroutinefunction(self.fn):
-            asyncio.run(self.fn(*self.args, **self.kwargs))
-        else:
-            self.fn(*self.args, **self.kwargs)
+        self.fn(*self.args, **self.kwargs)
 
 class AppController(QObject):
     media_details_loaded = pyqtSignal(int, dict, str)
@@ -140,6 +172,8 @@ class AppController(QObject):
     media_fetch_progress = pyqtSignal(int, int, int)
     token_fetch_failed = pyqtSignal(str)
     track_qualities_loaded = pyqtSignal(list)
+    track_quality_loaded = pyqtSignal(int, dict)
+    track_quality_progress = pyqtSignal(int, int)
     force_clear_all_jobs = pyqtSignal()
     video_details_for_preview_loaded = pyqtSignal(dict)
     artwork_search_results_loaded = pyqtSignal(list)
@@ -151,6 +185,7 @@ class AppController(QObject):
     lyrics_download_started = pyqtSignal(str)
     artwork_download_started = pyqtSignal(str)
     artwork_download_finished = pyqtSignal(str, bool, str)
+    artwork_download_progress = pyqtSignal(str, int, int)
     updatecheckfinished = pyqtSignal(str, str, str)
 
     CHROME_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/536"
@@ -159,6 +194,7 @@ class AppController(QObject):
         super().__init__()
         self.thread_pool = QThreadPool()
         self.downloader_executable = self._find_downloader()
+        self.backend = BackendClient(self.downloader_executable, **load_backend_settings())
         
         self.session = requests.Session()
         adapter = HTTPAdapter(pool_connections=30, pool_maxsize=30)
@@ -166,12 +202,29 @@ class AppController(QObject):
         self.session.mount('http://', adapter)
         
         self.session.headers.update({"User-Agent": self.CHROME_USER_AGENT})
+        self.async_loop = AsyncLoopService(headers={"User-Agent": self.CHROME_USER_AGENT})
         self.storefront = storefront.lower()
         
-        self.dev_token = None
-        self.token_lock = threading.Lock()
+        self.catalog = CatalogClient(
+            lambda: self.async_loop.session, self.storefront, self.CHROME_USER_AGENT,
+            on_token_failure=self._on_token_failure, token_store=TokenStore(),
+        )
+        self.lookup_batcher = LookupBatcher(self.catalog)
+        self.fetch_pipeline = FetchPipeline(
+            self._fetch_media_worker,
+            lambda job_id, url, message: self.media_fetch_failed.emit(job_id, url, message),
+            lambda fn: self.thread_pool.start(Worker(fn)),
+            **load_fetch_settings(),
+        )
+        self.search_cache = load_response_cache()
+        self.quality_cache = load_quality_cache()
+        self._inflight_searches = {}
+        # (query, category) pairs whose last page came back without a next link.
+        self._exhausted_searches = set()
+        self._quality_probe_task = None
         
         self.active_workers = []
+        self._prewarm_task = None
         self._shutdown = False
         self.active_processes = []
         self.fetching_processes = {}
@@ -191,9 +244,11 @@ class AppController(QObject):
         try:
             new_sf = (config.get('storefront') or '').lower()
             if new_sf and new_sf != self.storefront:
-                with self.token_lock:
-                    self.storefront = new_sf
-                    self.dev_token = None
+                old_sf = self.storefront
+                self.storefront = new_sf
+                self.catalog.storefront = new_sf
+                self.catalog.reset_token()
+                self.search_cache.invalidate(old_sf)
                 self.update_status_and_log(
                     f"Storefront switched to '{new_sf}'. New searches will use this region."
                 )
@@ -207,14 +262,22 @@ class AppController(QObject):
         self._shutdown = True
         self.cancel_all_fetches()
         self.session.close()
+        self.backend.shutdown()
+        self.async_loop.shutdown()
+        self.search_cache.save()
+        self.quality_cache.save()
         self.thread_pool.clear()
 
     def cancel_all_fetches(self):
         logging.info("Cancelling all in-flight fetch operations...")
+        dropped = self.fetch_pipeline.cancel_all()
+        if dropped:
+            logging.info(f"Dropped {len(dropped)} queued fetches.")
         for worker in self.active_workers[:]:
             if hasattr(worker, 'cancel'):
                 worker.cancel()
         self.active_workers.clear()
+        self.async_loop.cancel_all()
 
         
         with self.process_lock:
@@ -250,10 +313,10 @@ class AppController(QObject):
         elif level == 'error': logging.error(message)
         self.status_updated.emit(message)
 
-    def fetch_media_for_download(self, url: str, job_id: int):
+    def fetch_media_for_download(self, url: str, job_id: int, priority: int = INTERACTIVE):
+        """Queues a metadata fetch; BACKGROUND items (batches) wait behind INTERACTIVE ones."""
         self.update_status_and_log(f"Fetching... for: {url}...")
-        worker = Worker(self._fetch_media_worker, url, job_id)
-        self.thread_pool.start(worker)
+        self.fetch_pipeline.submit(url, job_id, priority)
 
     def fetch_media_for_track_selection(self, url: str):
         self.update_status_and_log(f"Fetching... for: {url}...")
@@ -267,25 +330,32 @@ class AppController(QObject):
 
     def fetch_album_for_info(self, url: str):
         self.update_status_and_log("Fetching... full album details for info...")
-        worker = Worker(self._fetch_album_for_info_worker_async, url)
-        self.thread_pool.start(worker)
+        self.async_loop.run(self._fetch_album_for_info_worker_async(url))
 
     def fetch_song_for_info(self, song_data: dict):
         self.update_status_and_log("Fetching... quality details for song...")
-        worker = Worker(self._fetch_song_for_info_worker_async, song_data)
-        self.thread_pool.start(worker)
+        self.async_loop.run(self._fetch_song_for_info_worker_async(song_data))
 
     def fetch_video_for_preview(self, video_data: dict):
         self.update_status_and_log("Fetching... video details for preview...")
-        worker = Worker(self._fetch_video_for_preview_worker, video_data)
-        self.thread_pool.start(worker)
+        self.async_loop.run(self._fetch_video_for_preview_worker(video_data))
 
     def fetch_qualities_for_dialog(self, tracks: list):
         self.update_status_and_log(f"Fetching... quality details for {len(tracks)} tracks...")
-        worker = Worker(self._fetch_qualities_for_dialog_async, tracks)
-        self.thread_pool.start(worker)
+        self.cancel_quality_probe()
+        self._quality_probe_task = self.async_loop.run(self._fetch_qualities_for_dialog_async(tracks))
+
+    def cancel_quality_probe(self):
+        if self._quality_probe_task is not None:
+            self._quality_probe_task.cancel()
+            self._quality_probe_task = None
 
     def cancel_fetch(self, job_id: int):
+        url = self.fetch_pipeline.cancel(job_id)
+        if url is not None:
+            logging.info(f"Removed fetch for job {job_id} before it started.")
+            self.media_fetch_failed.emit(job_id, url, "Cancelled by user during fetch.")
+            return True
         with self.process_lock:
             if job_id in self.fetching_processes:
                 process, url = self.fetching_processes.pop(job_id)
@@ -348,45 +418,95 @@ class AppController(QObject):
         info["audioTraits"] = list(traits)
         return info
 
+    async def _probe_track_quality(self, session, track: dict, priority: int = BACKGROUND) -> dict:
+        """Quality details parsed from a track's enhancedHls manifest, served from the probe cache when known."""
+        manifest_url = track.get('attributes', {}).get('extendedAssetUrls', {}).get('enhancedHls')
+        if not manifest_url:
+            return {}
+        key = quality_key(self.storefront, track.get('id')) if track.get('id') else None
+        if key is not None and (cached := self.quality_cache.get(key)) is not None:
+            return cached
+
+        async with rate_limiter().request_async(manifest_url, priority) as permit, \
+                session.get(manifest_url, timeout=aiohttp.ClientTimeout(total=20)) as response:
+            permit.record(response.status, response.headers)
+            response.raise_for_status()
+            manifest_data = await response.text()
+        quality_info = self._parse_qualities_from_manifest(manifest_data)
+        if key is not None:
+            self.quality_cache.put(key, quality_info)
+        return quality_info
+
     async def _fetch_manifest_async(self, session, index, track):
         try:
-            manifest_url = track.get('attributes', {}).get('extendedAssetUrls', {}).get('enhancedHls')
-            if not manifest_url:
-                return index, {}
-            
-            async with session.get(manifest_url, timeout=20) as response:
-                response.raise_for_status()
-                manifest_data = await response.text()
-                quality_info = self._parse_qualities_from_manifest(manifest_data)
-                return index, quality_info
+            return index, await self._probe_track_quality(session, track)
         except Exception as e:
             logging.warning(f"Failed to fetch manifest for track {index} (async): {e}")
             return index, {}
 
+    @staticmethod
+    def _probe_concurrency() -> int:
+        try:
+            with open('config.yaml', 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+            return max(1, int(config.get('manifest-probe-concurrency', DEFAULT_PROBE_CONCURRENCY)))
+        except FileNotFoundError:
+            return DEFAULT_PROBE_CONCURRENCY
+        except Exception as e:
+            logging.warning(f"Could not read manifest-probe-concurrency from config.yaml: {e}")
+            return DEFAULT_PROBE_CONCURRENCY
+
+    async def _iter_manifests_async(self, tracks):
+        """Yield (index, quality_info) as each probe finishes, with a bounded number in flight.
+
+        Closing the generator early cancels the probes that have not finished yet.
+        """
+        session = self.async_loop.session
+        semaphore = asyncio.Semaphore(self._probe_concurrency())
+
+        async def probe(index, track):
+            async with semaphore:
+                return await self._fetch_manifest_async(session, index, track)
+
+        tasks = [asyncio.ensure_future(probe(i, track)) for i, track in enumerate(tracks)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def _fetch_all_manifests_async(self, tracks):
-        async with aiohttp.ClientSession(headers={"User-Agent": self.CHROME_USER_AGENT}) as session:
-            tasks = [self._fetch_manifest_async(session, i, track) for i, track in enumerate(tracks)]
-            results = await asyncio.gather(*tasks)
-            return results
+        results = [None] * len(tracks)
+        async for index, quality_info in self._iter_manifests_async(tracks):
+            results[index] = (index, quality_info)
+        return results
 
     async def _fetch_qualities_for_dialog_async(self, tracks: list):
         try:
-            manifest_results = await self._fetch_all_manifests_async(tracks)
-            
-            updated_tracks = []
-            for index, quality_info in manifest_results:
+            updated_tracks = list(tracks)
+            done = 0
+            self.track_quality_progress.emit(done, len(tracks))
+            async for index, quality_info in self._iter_manifests_async(tracks):
                 track_copy = tracks[index].copy()
                 if quality_info:
-                    tr_attrs = track_copy.setdefault('attributes', {})
+                    tr_attrs = track_copy.setdefault('attributes', {}).copy()
+                    track_copy['attributes'] = tr_attrs
                     if 'audioTraits' in quality_info:
                         tr_attrs['audioTraits'] = list(set(tr_attrs.get('audioTraits', [])) | set(quality_info['audioTraits']))
                     for k in ['codec','bitrate','avgBitrate','sampleRateHz','bitDepth','channels']:
                         if quality_info.get(k) is not None:
                             tr_attrs[k] = quality_info[k]
-                updated_tracks.append(track_copy)
-            
+                updated_tracks[index] = track_copy
+                done += 1
+                self.track_quality_loaded.emit(index, track_copy)
+                self.track_quality_progress.emit(done, len(tracks))
+
             self.track_qualities_loaded.emit(updated_tracks)
             self.update_status_and_log("Quality details loaded.")
+        except asyncio.CancelledError:
+            logging.info("Quality check cancelled.")
+            raise
         except Exception as e:
             logging.error(f"Error fetching qualities for dialog:\n{traceback.format_exc()}")
             self.update_status_and_log(f"Failed to fetch quality details: {e}", 'error')
@@ -400,7 +520,7 @@ class AppController(QObject):
             item_type, item_id = match.group(1), match.group(2)
             item_type_plural = f"{item_type}s" if not item_type.endswith('s') else item_type
             
-            api_result = self._lookup_api_item(item_type_plural, item_id)
+            api_result = await self._lookup_api_item(item_type_plural, item_id)
             item_data = api_result.get('data', [{}])[0]
             
             if not item_data: 
@@ -444,23 +564,17 @@ class AppController(QObject):
             if not song_id:
                 raise ValueError("Song data is missing an ID.")
 
-            api_result = self._lookup_api_item('songs', song_id)
+            api_result = await self._lookup_api_item('songs', song_id)
             item_data = api_result.get('data', [{}])[0]
 
             if not item_data:
                 raise ValueError("API response did not contain song data.")
 
-            manifest_url = item_data.get('attributes', {}).get('extendedAssetUrls', {}).get('enhancedHls')
-            if not manifest_url:
+            quality_info = await self._probe_track_quality(self.async_loop.session, item_data, priority=INTERACTIVE)
+            if not quality_info:
                 self.song_details_for_info_loaded.emit(self._parse_api_item(item_data))
                 return
 
-            async with aiohttp.ClientSession(headers={"User-Agent": self.CHROME_USER_AGENT}) as session:
-                async with session.get(manifest_url, timeout=20) as response:
-                    response.raise_for_status()
-                    manifest_data = await response.text()
-                    quality_info = self._parse_qualities_from_manifest(manifest_data)
-
             tr_attrs = item_data.setdefault('attributes', {})
             if 'audioTraits' in quality_info:
                 tr_attrs['audioTraits'] = list(set(tr_attrs.get('audioTraits', [])) | set(quality_info['audioTraits']))
@@ -480,13 +594,13 @@ class AppController(QObject):
             self.update_status_and_log(f"Failed to fetch song details: {e}", 'error')
             self.song_details_for_info_loaded.emit(song_data)
 
-    def _fetch_video_for_preview_worker(self, video_data: dict):
+    async def _fetch_video_for_preview_worker(self, video_data: dict):
         try:
             video_id = video_data.get('id')
             if not video_id:
                 raise ValueError("Video data is missing an ID.")
             
-            api_result = self._lookup_api_item('music-videos', video_id)
+            api_result = await self._lookup_api_item('music-videos', video_id)
             item_data = api_result.get('data', [{}])[0]
 
             if not item_data:
@@ -503,19 +617,10 @@ class AppController(QObject):
             self.video_details_for_preview_loaded.emit(video_data)
 
     def _fetch_media_generic_worker(self, url: str, signal_to_emit):
-        command = [self.downloader_executable, "--json-output", url]
+        command = ["--json-output", url]
         process = None
         try:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                bufsize=1,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            )
+            process = self.backend.popen(command)
             with self.process_lock:
                 self.active_processes.append(process)
 
@@ -580,25 +685,18 @@ class AppController(QObject):
                     self.active_processes.remove(process)
 
     def _fetch_media_worker(self, url: str, job_id: int):
-        command = [self.downloader_executable, "--json-output", url]
+        """Runs one --json-output fetch for the pipeline; raises FetchFailed so it can be retried."""
+        command = ["--json-output", url]
         process = None
         try:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                bufsize=1,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            )
+            process = self.backend.popen(command)
             with self.process_lock:
                 self.active_processes.append(process)
                 if job_id > 0:
                     self.fetching_processes[job_id] = (process, url)
 
             stdout_buf = []
+            stderr_buf = []
             probe_total = None
 
             def stdout_reader():
@@ -624,6 +722,7 @@ class AppController(QObject):
             def stderr_reader():
                 for line in iter(process.stderr.readline, ''):
                     if not line: break
+                    stderr_buf.append(line.strip())
                     self.status_updated.emit(line.strip())
 
             t_out = threading.Thread(target=stdout_reader, daemon=True)
@@ -640,29 +739,38 @@ class AppController(QObject):
                     logging.info(f"Fetch for job {job_id} was cancelled. Aborting post-processing.")
                     return
 
+            permanent_error = next((line for line in stderr_buf if PERMANENT_FETCH_ERRORS.search(line)), None)
+
             if return_code != 0:
-                error_message = f"Failed to fetch media. See console for details."
                 self.update_status_and_log(f"Error fetching metadata for {url}. Check console for details.", 'error')
-                self.media_fetch_failed.emit(job_id, url, error_message)
-                return
+                raise FetchFailed(permanent_error or "Failed to fetch media. See console for details.",
+                                  retryable=permanent_error is None and return_code != BAD_ARGUMENTS_EXIT_CODE)
 
             full_out = "".join(stdout_buf)
             json_match = re.search(r'AMDL_JSON_START(.*)AMDL_JSON_END', full_out, re.DOTALL)
             if not json_match:
                 self.update_status_and_log(f"Error: Could not find metadata JSON for {url}.", 'error')
                 logging.error(f"Backend output for {url} did not contain valid JSON block:\n{full_out}")
-                self.media_fetch_failed.emit(job_id, url, "Could not parse backend response.")
-                return
-            
-            media_data = json.loads(json_match.group(1))
+                raise FetchFailed(permanent_error or "Could not parse backend response.",
+                                  retryable=permanent_error is None)
+
+            try:
+                media_data = json.loads(json_match.group(1))
+            except json.JSONDecodeError as e:
+                # The backend finished and printed both markers; asking again prints the same block.
+                self.update_status_and_log(f"Error: Could not parse metadata JSON for {url}.", 'error')
+                raise FetchFailed(f"Could not parse backend response: {e}", retryable=False) from e
+            media_data['_fetched_at'] = time.monotonic()
             
             self.media_details_loaded.emit(job_id, media_data, url)
             
             name = media_data.get('albumData', {}).get('attributes', {}).get('name', 'Unknown')
             self.update_status_and_log(f"Added '{name}' to queue.")
+        except FetchFailed:
+            raise
         except Exception as e:
             self.update_status_and_log(f"Failed to execute Go backend for {url}: {e}", 'error')
-            self.media_fetch_failed.emit(job_id, url, f"Execution error: {e}")
+            raise FetchFailed(f"Execution error: {e}") from e
         finally:
             with self.process_lock:
                 if job_id > 0:
@@ -672,6 +780,7 @@ class AppController(QObject):
 
     def search(self, query: str):
         self.update_status_and_log(f"Searching for: '{query}'...")
+        self._exhausted_searches.clear()
         worker = SearchWorker(self._initial_search_worker, query)
         worker.signals.search_results_loaded.connect(self.search_results_loaded)
         worker.signals.status_updated.connect(self.update_status_and_log)
@@ -683,7 +792,7 @@ class AppController(QObject):
                 self.active_workers.remove(worker)
         
         worker.signals.search_results_loaded.connect(cleanup)
-        self.thread_pool.start(worker)
+        worker.start(self.async_loop)
 
     def search_for_albums(self, query: str):
         self.update_status_and_log(f"Searching for albums: '{query}'...")
@@ -698,7 +807,7 @@ class AppController(QObject):
                 self.active_workers.remove(worker)
         
         worker.signals.category_search_results_loaded.connect(cleanup)
-        self.thread_pool.start(worker)
+        worker.start(self.async_loop)
 
     def search_for_music_videos(self, query: str):
         self.update_status_and_log(f"Searching for music videos: '{query}'...")
@@ -713,7 +822,7 @@ class AppController(QObject):
                 self.active_workers.remove(worker)
         
         worker.signals.category_search_results_loaded.connect(cleanup)
-        self.thread_pool.start(worker)
+        worker.start(self.async_loop)
 
     def search_for_playlists(self, query: str):
         self.update_status_and_log(f"Searching for playlists: '{query}'...")
@@ -727,17 +836,18 @@ class AppController(QObject):
                 self.active_workers.remove(worker)
         
         worker.signals.category_search_results_loaded.connect(cleanup)
-        self.thread_pool.start(worker)
+        worker.start(self.async_loop)
 
-    def _search_for_playlists_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
+    async def _search_for_playlists_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
         try:
             if worker.is_cancelled():
                 return
             
-            api_results = self._search_api(query, "playlists", 30)
+            api_results = await self._search_api(query, "playlists", 30)
             
             if worker.is_cancelled():
                 return
+            self._note_search_page(query, api_results, ('playlists',))
             
             playlists_data = api_results.get('results', {}).get('playlists', {}).get('data', [])
             all_playlists = [p for item in playlists_data if (p := self._parse_api_item(item))]
@@ -760,7 +870,7 @@ class AppController(QObject):
             if worker in self.active_workers:
                 self.active_workers.remove(worker)
         worker.signals.category_search_results_loaded.connect(cleanup)
-        self.thread_pool.start(worker)
+        worker.start(self.async_loop)
 
     @pyqtSlot(str, list)
     def _on_artwork_search_results(self, category, results):
@@ -777,7 +887,7 @@ class AppController(QObject):
             if worker in self.active_workers:
                 self.active_workers.remove(worker)
         worker.signals.artwork_results_appended.connect(cleanup)
-        self.thread_pool.start(worker)
+        worker.start(self.async_loop)
 
     def load_more_results(self, query: str, category: str, offset: int):
         self.update_status_and_log(f"Loading more {category} for '{query}'...")
@@ -792,47 +902,21 @@ class AppController(QObject):
                 self.active_workers.remove(worker)
         
         worker.signals.search_results_appended.connect(cleanup)
-        self.thread_pool.start(worker)
+        worker.start(self.async_loop)
 
-    def _get_apple_music_dev_token(self) -> str | None:
-        with self.token_lock:
-            if self.dev_token:
-                return self.dev_token
-            
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    logging.info(f"No cached token found. Fetching new developer token (Attempt {attempt + 1}/{max_retries})...")
-                    homepage_res = self.session.get(f'https://music.apple.com/{self.storefront}/browse', timeout=20)
-                    homepage_res.raise_for_status()
-                    match = re.search(r'/assets/index-legacy[~-][^/"]+\.js', homepage_res.text)
-                    if not match: raise ValueError("Could not find core JS file.")
-                    js_url = f"https://music.apple.com{match.group(0)}"
-                    js_res = self.session.get(js_url, timeout=20)
-                    js_res.raise_for_status()
-                    token_match = re.search(r'eyJh[a-zA-Z0-9\._-]+', js_res.text)
-                    if not token_match: raise ValueError("Could not find bearer token.")
-                    self.dev_token = token_match.group(0)
-                    logging.info("Successfully fetched and cached new developer token.")
-                    return self.dev_token
-                except (requests.RequestException, ValueError) as e:
-                    logging.error(f"Failed to get developer token on attempt {attempt + 1}: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(1)
-                    else:
-                        error_msg = "Failed to get developer token after multiple attempts.\n\nPlease check your network connection, retry searching, or restart the app."
-                        self.update_status_and_log(f"Failed to get developer token after {max_retries} attempts: {e}", 'error')
-                        self.token_fetch_failed.emit(error_msg)
-                        return None
-        return None
+    def prefetch_results(self, query: str, category: str, offset: int, limit: int = 30):
+        """Warm the search cache with a page the UI is likely to ask for next."""
+        async def prefetch():
+            try:
+                await self._search_api(query, category, limit, offset, priority=BACKGROUND)
+            except (CatalogError, ValueError) as e:
+                logging.info(f"Prefetch of {category} @ {offset} for '{query}' skipped: {e}")
+        self.async_loop.submit(prefetch())
 
     def _parse_api_item(self, item: dict, size: int = 600) -> dict | None:
         if not item or not item.get('attributes'): return None
         attrs = item['attributes']
-        artwork_url = attrs.get('artwork', {}).get('url', '')
-        
-        if artwork_url and '{w}' in artwork_url:
-            artwork_url = artwork_url.replace('{w}', str(size)).replace('{h}', str(size))
+        artwork_url = sized_artwork_url(attrs.get('artwork', {}).get('url', ''), size)
 
         duration_ms = attrs.get('durationInMillis', 0)
         seconds = duration_ms // 1000
@@ -873,107 +957,65 @@ class AppController(QObject):
                 
         return parsed
 
-    def _search_api(self, query: str, types: str, limit: int, offset: int = 0) -> dict:
+    async def _search_api(self, query: str, types: str, limit: int, offset: int = 0,
+                          priority: int = INTERACTIVE) -> dict:
         if self._shutdown:
             raise ValueError("Controller is shutting down")
-            
-        token = self._get_apple_music_dev_token()
-        if not token:
-            raise ValueError("Could not retrieve developer token for search.")
-            
-        headers = {"Authorization": f"Bearer {token}", "Origin": "https://music.apple.com", "Referer": "https://music.apple.com/"}
-        
-        api_call_types = types.replace('_', '-')
-        params = {"term": query, "types": api_call_types, "limit": limit, "offset": offset}
-        
-        if types not in ["music_videos", "artists"]:
-            params["include"] = "relationships.tracks"
+        key = search_key(self.storefront, CatalogClient.search_params(query, types, limit, offset))
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            return cached
+        # A prefetch for the same page may already be on the wire; ride along instead of re-asking.
+        # Entries are [task, waiters]; the request is only aborted once every waiter has given up.
+        entry = self._inflight_searches.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self.catalog.search(query, types, limit, offset, priority=priority))
+            entry = self._inflight_searches[key] = [task, 0]
+
+            def settle(t, key=key):
+                self._inflight_searches.pop(key, None)
+                if not t.cancelled() and t.exception() is None:
+                    self.search_cache.put(key, t.result())
+            task.add_done_callback(settle)
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if entry[1] == 1:
+                task.cancel()
+            raise
+        finally:
+            entry[1] -= 1
 
-        api_url = f"https://amp-api.music.apple.com/v1/catalog/{self.storefront}/search"
-        
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = self.session.get(api_url, headers=headers, params=params, timeout=20)
-                response.raise_for_status()
-                return response.json()
-            except requests.HTTPError as e:
-                if self._shutdown:
-                    raise ValueError("Controller is shutting down")
-                if e.response.status_code in [401, 403]:
-                    logging.warning("Developer token expired or invalid. Fetching a new one and retrying.")
-                    self.dev_token = None
-                    new_token = self._get_apple_music_dev_token()
-                    if not new_token:
-                        raise ValueError("Failed to refresh developer token.")
-                    
-                    headers["Authorization"] = f"Bearer {new_token}"
-                    continue
-                else:
-                    logging.error(f"API search request failed with HTTP error on attempt {attempt + 1}: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(1)
-                        continue
-                    else:
-                        raise e
-            except requests.RequestException as e:
-                logging.error(f"API search request failed on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                else:
-                    raise e
-        
-        raise ValueError("API search failed after multiple retries.")
+    def _note_search_page(self, query: str, api_results: dict, categories):
+        """Record which categories of a raw search page have no further page."""
+        results = api_results.get('results', {})
+        for category in categories:
+            if 'next' not in results.get(category.replace('_', '-'), {}):
+                self._exhausted_searches.add((query, category.replace('-', '_')))
 
-    def _lookup_api_item(self, item_type_plural: str, item_id: str) -> dict:
-        token = self._get_apple_music_dev_token()
-        if not token:
-            raise ValueError("Could not retrieve developer token for lookup.")
-            
-        headers = {"Authorization": f"Bearer {token}", "Origin": "https://music.apple.com", "Referer": "https://music.apple.com/"}
-        params = {"extend": "extendedAssetUrls,relationships.tracks"}
-        
-        api_url = f"https://amp-api.music.apple.com/v1/catalog/{self.storefront}/{item_type_plural}/{item_id}"
-        
-        max_retries = 3
-        last_exception = None
+    def search_exhausted(self, query: str, category: str) -> bool:
+        return (query, category.replace('-', '_')) in self._exhausted_searches
 
-        for attempt in range(max_retries):
-            try:
-                response = self.session.get(api_url, headers=headers, params=params, timeout=20)
-                response.raise_for_status()
-                return response.json()
-            except requests.HTTPError as e:
-                last_exception = e
-                if self._shutdown:
-                    raise ValueError("Controller is shutting down")
-                
-                if e.response.status_code in [401, 403]:
-                    logging.warning(f"Token expired on attempt {attempt + 1}. Refreshing...")
-                    self.dev_token = None
-                    new_token = self._get_apple_music_dev_token()
-                    if not new_token:
-                        raise ValueError("Failed to refresh developer token.")
-                    headers["Authorization"] = f"Bearer {new_token}"
-                else:
-                    logging.error(f"API lookup failed with HTTP error on attempt {attempt + 1}/{max_retries}: {e}")
-            
-            except requests.RequestException as e:
-                last_exception = e
-                logging.error(f"API lookup failed with network error on attempt {attempt + 1}/{max_retries}: {e}")
+    async def _lookup_api_item(self, item_type_plural: str, item_id: str) -> dict:
+        if self._shutdown:
+            raise ValueError("Controller is shutting down")
+        return await self.lookup_batcher.lookup(item_type_plural, item_id)
 
-            if attempt < max_retries - 1:
-                time.sleep(1 + attempt)
-            
-        raise ValueError(f"API lookup failed for {item_type_plural}/{item_id} after {max_retries} attempts.") from last_exception
+    def _on_token_failure(self, error):
+        error_msg = "Failed to get developer token after multiple attempts.\n\nPlease check your network connection, retry searching, or restart the app."
+        self.update_status_and_log(f"Failed to get developer token: {error}", 'error')
+        self.token_fetch_failed.emit(error_msg)
 
-    def _initial_search_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
+    async def _initial_search_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
         try:
             if worker.is_cancelled(): return
 
-            api_results = self._search_api(query, "songs,albums,artists,music-videos,playlists", 30)
+            api_results = await self._search_api(query, "songs,albums,artists,music-videos,playlists", 30)
             
             if worker.is_cancelled(): return
+            self._note_search_page(query, api_results, ('songs', 'albums', 'artists', 'music-videos', 'playlists'))
             
             songs_data = api_results.get('results', {}).get('songs', {}).get('data', [])
             all_songs = [p for item in songs_data if (p := self._parse_api_item(item))]
@@ -1021,11 +1063,12 @@ class AppController(QObject):
             worker.safe_emit(signals.status_updated, "Failed to process search results. See console for details.", 'error')
             worker.safe_emit(signals.search_results_loaded, {})
 
-    def _search_for_albums_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
+    async def _search_for_albums_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
         try:
             if worker.is_cancelled(): return
-            api_results = self._search_api(query, "albums", 30)
+            api_results = await self._search_api(query, "albums", 30)
             if worker.is_cancelled(): return
+            self._note_search_page(query, api_results, ('albums',))
             albums_data = api_results.get('results', {}).get('albums', {}).get('data', [])
             all_albums = [p for item in albums_data if (p := self._parse_api_item(item))]
             worker.safe_emit(signals.category_search_results_loaded, 'albums', all_albums)
@@ -1035,11 +1078,12 @@ class AppController(QObject):
             worker.safe_emit(signals.status_updated, f"API album search request failed: {e}", 'error')
             worker.safe_emit(signals.category_search_results_loaded, 'albums', [])
 
-    def _search_for_music_videos_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
+    async def _search_for_music_videos_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
         try:
             if worker.is_cancelled(): return
-            api_results = self._search_api(query, "music-videos", 30)
+            api_results = await self._search_api(query, "music-videos", 30)
             if worker.is_cancelled(): return
+            self._note_search_page(query, api_results, ('music-videos',))
             videos_data = api_results.get('results', {}).get('music-videos', {}).get('data', [])
             all_videos = [p for item in videos_data if (p := self._parse_api_item(item))]
             worker.safe_emit(signals.category_search_results_loaded, 'music_videos', all_videos)
@@ -1049,10 +1093,10 @@ class AppController(QObject):
             worker.safe_emit(signals.status_updated, f"API music video search request failed: {e}", 'error')
             worker.safe_emit(signals.category_search_results_loaded, 'music_videos', [])
 
-    def _search_for_artwork_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
+    async def _search_for_artwork_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str):
         try:
             if worker.is_cancelled(): return
-            api_results = self._search_api(query, "albums", 50)
+            api_results = await self._search_api(query, "albums", 50)
             if worker.is_cancelled(): return
             albums_data = api_results.get('results', {}).get('albums', {}).get('data', [])
             all_albums = [p for item in albums_data if (p := self._parse_api_item(item, size=5000))]
@@ -1063,10 +1107,10 @@ class AppController(QObject):
             worker.safe_emit(signals.status_updated, f"API artwork search request failed: {e}", 'error')
             worker.safe_emit(signals.category_search_results_loaded, 'albums', [])
 
-    def _load_more_artwork_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str, offset: int):
+    async def _load_more_artwork_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str, offset: int):
         try:
             if worker.is_cancelled(): return
-            api_results = self._search_api(query, "albums", 50, offset)
+            api_results = await self._search_api(query, "albums", 50, offset)
             if worker.is_cancelled(): return
             
             new_items_data = api_results.get('results', {}).get('albums', {}).get('data', [])
@@ -1079,11 +1123,12 @@ class AppController(QObject):
             worker.safe_emit(signals.status_updated, f"API 'load more' artwork request failed: {e}", 'error')
             worker.safe_emit(signals.artwork_results_appended, [])
 
-    def _load_more_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str, category: str, offset: int):
+    async def _load_more_worker(self, worker: SearchWorker, signals: SearchWorkerSignals, query: str, category: str, offset: int):
         try:
             if worker.is_cancelled(): return
-            api_results = self._search_api(query, category, 30, offset)
+            api_results = await self._search_api(query, category, 30, offset)
             if worker.is_cancelled(): return
+            self._note_search_page(query, api_results, (category,))
             
             api_category_key = category.replace('_', '-')
             new_items_data = api_results.get('results', {}).get(api_category_key, {}).get('data', [])
@@ -1102,18 +1147,10 @@ class AppController(QObject):
         self.thread_pool.start(worker)
 
     def _resolve_artist_worker(self, url: str):
-        command = [self.downloader_executable, "--resolve-artist", url, "--json-output"]
+        command = ["--resolve-artist", url, "--json-output"]
         process = None
         try:
-            process = subprocess.Popen(
-                command, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                text=True, 
-                encoding='utf-8',
-                errors='replace',
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            )
+            process = self.backend.popen(command)
             with self.process_lock:
                 self.active_processes.append(process)
 
@@ -1143,8 +1180,7 @@ class AppController(QObject):
 
     def search_for_lyrics(self, query: str):
         self.update_status_and_log(f"Searching for tracks: '{query}'...")
-        worker = Worker(self._search_for_lyrics_worker, query)
-        self.thread_pool.start(worker)
+        self.async_loop.run(self._search_for_lyrics_worker(query))
 
     def scan_local_directory(self, path: str):
         self.update_status_and_log(f"Scanning folder: '{path}'...")
@@ -1153,15 +1189,13 @@ class AppController(QObject):
 
     @pyqtSlot(dict, str)
     def download_lyrics_for_track(self, track_data: dict, local_filepath: str):
-        worker = Worker(self._download_lyrics_for_track_worker, track_data, local_filepath)
-        self.thread_pool.start(worker)
+        self.async_loop.run(self._download_lyrics_for_track_worker(track_data, local_filepath))
 
     def download_lyrics(self, item_data: dict):
         self.update_status_and_log(f"Downloading lyrics for {item_data.get('name', 'item')}...", "info")
-        worker = Worker(self.download_lyrics_worker, item_data)
-        self.thread_pool.start(worker)
+        self.async_loop.run(self.download_lyrics_worker(item_data))
 
-    def download_lyrics_worker(self, item_data: dict):
+    async def download_lyrics_worker(self, item_data: dict):
         try:
             item_id = item_data.get('id')
             item_name = item_data.get('name', 'Unknown')
@@ -1171,7 +1205,7 @@ class AppController(QObject):
             
             self.lyrics_download_started.emit(item_id)
             
-            ttml_content = self._fetch_lyrics_for_song(item_id)
+            ttml_content = await self._fetch_lyrics_for_song(item_id)
             if not ttml_content:
                 raise Exception("No synced lyrics available")
             
@@ -1197,12 +1231,12 @@ class AppController(QObject):
             self.lyrics_content_ready_for_save.emit(item_data.get('id', ''), False, error_msg)
             self.update_status_and_log(f"Failed to download lyrics: {error_msg}", "error")
 
-    def download_artwork(self, item_data: dict):
+    def download_artwork(self, item_data: dict, save_path: str):
         self.update_status_and_log(f"Downloading artwork for {item_data.get('name', 'item')}...", "info")
-        worker = Worker(self.download_artwork_worker, item_data)
+        worker = Worker(self.download_artwork_worker, item_data, save_path)
         self.thread_pool.start(worker)
 
-    def download_artwork_worker(self, item_data: dict):
+    def download_artwork_worker(self, item_data: dict, save_path: str):
         try:
             import yaml  
             
@@ -1227,30 +1261,16 @@ class AppController(QObject):
             except Exception:
                 width, height = 5000, 5000  
 
-            if '{w}' in artwork_url and '{h}' in artwork_url:
-            
-                artwork_url = artwork_url.replace('{w}', str(width)).replace('{h}', str(height))
-            elif 'w=600' in artwork_url or 'h=600' in artwork_url:
-             
-                artwork_url = artwork_url.replace('w=600', f'w={width}').replace('h=600', f'h={height}')
-            elif 'w=' in artwork_url and 'h=' in artwork_url:
-             
-                import re
-                artwork_url = re.sub(r'w=\d+', f'w={width}', artwork_url)
-                artwork_url = re.sub(r'h=\d+', f'h={height}', artwork_url)
-            elif 'x' in artwork_url:
-             
-                import re
-                artwork_url = re.sub(r'/(\d{2,4})x(\d{2,4})', f'/{width}x{height}', artwork_url)
-          
-
-            response = self.session.get(artwork_url, timeout=30)
-            response.raise_for_status()
-            
-            artwork_data = response.content
+            artwork_url = sized_artwork_url(artwork_url, width, height)
+
+            # Chunks go straight to disk on this thread; only the final path is signalled.
+            written = stream_to_file(
+                self.session, artwork_url, save_path,
+                progress=lambda received, total: self.artwork_download_progress.emit(item_id, received, total),
+            )
             
-            self.artwork_download_finished.emit(item_id, True, artwork_data.decode('latin1'))
-            self.update_status_and_log(f"Artwork ready for {item_name}", "info")
+            self.artwork_download_finished.emit(item_id, True, save_path)
+            self.update_status_and_log(f"Artwork saved for {item_name} ({written / 1024 / 1024:.1f} MB)", "info")
             
         except Exception as e:
             error_msg = str(e)
@@ -1258,9 +1278,9 @@ class AppController(QObject):
             self.artwork_download_finished.emit(item_data.get('id', ''), False, error_msg)
             self.update_status_and_log(f"Failed to download artwork: {error_msg}", "error")
 
-    def _search_for_lyrics_worker(self, query: str):
+    async def _search_for_lyrics_worker(self, query: str):
         try:
-            api_results = self._search_api(query, "songs,albums", 25)
+            api_results = await self._search_api(query, "songs,albums", 25)
             
             all_tracks = []
             songs_data = api_results.get('results', {}).get('songs', {}).get('data', [])
@@ -1328,12 +1348,8 @@ class AppController(QObject):
             self.update_status_and_log(f"Local scan failed: {e}", "error")
             self.local_scan_results.emit({'type': 'error', 'data': str(e)})
 
-    def _fetch_lyrics_for_song(self, song_id: str) -> str | None:
+    async def _fetch_lyrics_for_song(self, song_id: str) -> str | None:
         try:
-            token = self._get_apple_music_dev_token()
-            if not token:
-                raise ValueError("Could not retrieve developer token for lyrics.")
-            
             config = {}
             try:
                 with open('config.yaml', 'r') as f:
@@ -1347,20 +1363,13 @@ class AppController(QObject):
                 logging.error("media-user-token not found in config.yaml")
                 return None
 
-            url = f"https://amp-api.music.apple.com/v1/catalog/{self.storefront}/songs/{song_id}/lyrics?l=en&extend=ttmlLocalizations"
-            headers = {
-                "Authorization": f"Bearer {token}", "Origin": "https://music.apple.com", "Referer": "https://music.apple.com/",
-                "User-Agent": self.CHROME_USER_AGENT, "Accept": "application/json", "Accept-Language": "en-US,en;q=0.9"
-            }
-            cookies = {'media-user-token': media_user_token}
-            
             logging.info(f"Requesting lyrics for song {song_id}")
-            response = self.session.get(url, headers=headers, cookies=cookies, timeout=30)
-            
-            if response.status_code == 404: raise ValueError("No lyrics available for this song")
-            response.raise_for_status()
+            try:
+                data = await self.catalog.lyrics(song_id, media_user_token, deadline=30, priority=BACKGROUND)
+            except CatalogError as e:
+                if e.status == 404: raise ValueError("No lyrics available for this song")
+                raise
             
-            data = response.json()
             if 'data' in data and len(data['data']) > 0 and 'attributes' in data['data'][0]:
                 attributes = data['data'][0]['attributes']
                 ttml = attributes.get('ttml')
@@ -1430,7 +1439,7 @@ class AppController(QObject):
             logging.error(f"Failed to convert TTML to LRC: {e}")
             return None
 
-    def _download_lyrics_for_track_worker(self, track_data: dict, local_filepath: str):
+    async def _download_lyrics_for_track_worker(self, track_data: dict, local_filepath: str):
         try:
             if not os.path.isfile(local_filepath):
                 raise ValueError(f"Invalid path: '{local_filepath}' is not a file.")
@@ -1439,7 +1448,7 @@ class AppController(QObject):
             if not search_term.strip():
                 raise ValueError("Not enough metadata to search for lyrics.")
 
-            api_results = self._search_api(search_term, "songs", 5)
+            api_results = await self._search_api(search_term, "songs", 5, priority=BACKGROUND)
             songs_data = api_results.get('results', {}).get('songs', {}).get('data', [])
             if not songs_data:
                 raise ValueError("No match found on Apple Music.")
@@ -1465,7 +1474,7 @@ class AppController(QObject):
                 self.lyrics_download_finished.emit(local_filepath, True, "Exists")
                 return
 
-            ttml_content = self._fetch_lyrics_for_song(track_id_for_download)
+            ttml_content = await self._fetch_lyrics_for_song(track_id_for_download)
             if not ttml_content:
                 raise Exception("No synced lyrics available")
 
@@ -1489,6 +1498,38 @@ class AppController(QObject):
             
             self.lyrics_download_finished.emit(local_filepath, False, final_status)
 
+    def start_prewarm(self):
+        """Open connections and load the developer token in the background."""
+        if self._prewarm_task is not None:
+            return
+        startup_metrics.mark("prewarm started")
+        self.thread_pool.start(Worker(self._prewarm_artwork_pool), -1)
+        self._prewarm_task = self.async_loop.run(self._prewarm_async())
+
+    def _prewarm_artwork_pool(self):
+        client = image_http()
+        for url in PREWARM_ARTWORK_URLS:
+            if self._shutdown:
+                return
+            try:
+                client.head(url).close()
+            except requests.RequestException as e:
+                logging.info(f"Artwork prewarm of {url} skipped: {e}")
+        startup_metrics.mark("artwork connections warm")
+
+    async def _prewarm_async(self):
+        async def touch(url):
+            try:
+                async with self.async_loop.session.head(url, timeout=aiohttp.ClientTimeout(total=10)):
+                    pass
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logging.info(f"Prewarm of {url} skipped: {e}")
+
+        await asyncio.gather(*(touch(url) for url in PREWARM_API_URLS))
+        startup_metrics.mark("api connections warm")
+        if await self.catalog.prewarm_token():
+            startup_metrics.mark("developer token ready")
+
     def checkforupdates(self):
         worker = Worker(self._check_for_updates_worker)
         self.thread_pool.start(worker)
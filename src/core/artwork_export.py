@@ -0,0 +1,273 @@
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+import yaml
+
+from core.artwork_urls import sized_artwork_url
+
+CHUNK_SIZE = 256 * 1024
+
+DEFAULT_EXPORT_CONCURRENCY = 6
+DEFAULT_EXPORT_RETRIES = 3
+# How often a retry backoff checks whether the export was cancelled.
+ABORT_POLL_INTERVAL = 0.1
+
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+
+class DownloadCancelled(Exception):
+    pass
+
+
+def stream_to_file(session, url: str, dest_path: str, progress=None, should_abort=None,
+                   timeout=30, chunk_size: int = CHUNK_SIZE, resume: bool = False) -> int:
+    """Stream url into dest_path via a sibling .part file and an atomic rename.
+
+    progress(received, total) is called after every chunk; total is 0 when the
+    server sends no Content-Length. Returns the number of bytes written by this call.
+    With resume=True a leftover .part file is continued with a Range request
+    and kept on failure so the next attempt can pick it up again.
+    """
+    directory = os.path.dirname(os.path.abspath(dest_path))
+    os.makedirs(directory, exist_ok=True)
+    part_path = dest_path + '.part'
+    received = 0
+    offset = 0
+    headers = {}
+    if resume:
+        try:
+            offset = os.path.getsize(part_path)
+        except OSError:
+            offset = 0
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+    try:
+        with session.get(url, stream=True, timeout=timeout, headers=headers or None) as response:
+            if response.status_code == 416 and offset:
+                # The .part no longer matches the remote file; start over next time.
+                os.remove(part_path)
+                raise IOError(f"Stale partial download for {url}")
+            response.raise_for_status()
+            if response.status_code != 206:
+                offset = 0
+            try:
+                total = int(response.headers.get('Content-Length') or 0)
+            except ValueError:
+                total = 0
+            if total:
+                total += offset
+            received = offset
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if should_abort is not None and should_abort():
+                        raise DownloadCancelled(url)
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    received += len(chunk)
+                    if progress is not None:
+                        progress(received, total)
+        if total and received != total:
+            raise IOError(f"Incomplete download: {received} of {total} bytes")
+        os.replace(part_path, dest_path)
+    except BaseException:
+        if not resume:
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+        raise
+    return received - offset
+
+
+def export_filename(item: dict, ext: str = 'jpg') -> str:
+    """'<Artist> - <Name> [<id>].<ext>', stripped of characters no filesystem accepts."""
+    artist = item.get('artist') or 'Unknown Artist'
+    name = item.get('name') or 'Unknown'
+    stem = f"{artist} - {name}"
+    item_id = item.get('id')
+    if item_id:
+        stem += f" [{item_id}]"
+    stem = ' '.join(_INVALID_FILENAME_CHARS.sub('', stem).split()).strip('. ')
+    return f"{stem[:180] or 'cover'}.{ext}"
+
+
+class ExportSummary:
+    """Running totals for a batch export; safe to update from worker threads."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.saved = 0
+        self.skipped = 0
+        self.failed = 0
+        self.bytes = 0
+        self.errors = []
+        self.started = time.monotonic()
+        self.finished = None
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> int:
+        return self.saved + self.skipped + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second actually transferred; skipped files do not count."""
+        elapsed = self.elapsed
+        return self.bytes / elapsed if elapsed > 0 else 0.0
+
+    def describe(self) -> str:
+        parts = [f"{self.saved} saved"]
+        if self.skipped:
+            parts.append(f"{self.skipped} already present")
+        if self.failed:
+            parts.append(f"{self.failed} failed")
+        return (f"{', '.join(parts)} - {self.bytes / 1024 / 1024:.1f} MB in {self.elapsed:.1f}s "
+                f"({self.throughput / 1024 / 1024:.1f} MB/s)")
+
+
+def _backoff(delay: float, url: str, should_abort=None):
+    """Sleep before a retry, raising DownloadCancelled as soon as should_abort() turns true."""
+    deadline = time.monotonic() + delay
+    while True:
+        if should_abort is not None and should_abort():
+            raise DownloadCancelled(url)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(ABORT_POLL_INTERVAL, remaining))
+
+
+def _remote_size(session, url: str, timeout) -> int:
+    try:
+        response = session.head(url, timeout=timeout, allow_redirects=True)
+        if response.ok:
+            return int(response.headers.get('Content-Length') or 0)
+    except (requests.RequestException, ValueError):
+        pass
+    return 0
+
+
+def _export_one(session, item: dict, directory: str, width: int, height: int, retries: int,
+                summary: ExportSummary, should_abort, timeout):
+    if should_abort is not None and should_abort():
+        raise DownloadCancelled(item.get('artworkUrl'))
+    url = item.get('artworkUrl') or ''
+    if not url:
+        raise ValueError("No artwork URL available")
+    url = sized_artwork_url(url, width, height)
+    ext = 'png' if url.lower().endswith('.png') else 'jpg'
+    dest_path = os.path.join(directory, export_filename(item, ext))
+
+    if os.path.exists(dest_path):
+        local_size = os.path.getsize(dest_path)
+        if local_size and local_size == _remote_size(session, url, timeout):
+            return False
+
+    for attempt in range(retries + 1):
+        if should_abort is not None and should_abort():
+            raise DownloadCancelled(url)
+        try:
+            last_received = [os.path.getsize(dest_path + '.part')]
+        except OSError:
+            last_received = [0]
+
+        def count(received, total):
+            # A server that ignores Range restarts the count from zero.
+            delta = received - last_received[0] if received >= last_received[0] else received
+            with summary._lock:
+                summary.bytes += delta
+            last_received[0] = received
+
+        try:
+            stream_to_file(session, url, dest_path, progress=count, should_abort=should_abort,
+                           timeout=timeout, resume=True)
+            return True
+        except DownloadCancelled:
+            raise
+        except (requests.RequestException, IOError) as e:
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            if attempt == retries or (status is not None and 400 <= status < 500 and status != 429):
+                raise
+            logging.info(f"Retrying artwork export for {item.get('name', 'item')} ({e})")
+            _backoff(min(8.0, 0.5 * 2 ** attempt), url, should_abort)
+
+
+def load_export_settings() -> dict:
+    """Cover size and worker count for batch exports, read from config.yaml."""
+    try:
+        with open('config.yaml', 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        config = {}
+    except Exception as e:
+        logging.warning(f"Could not read artwork export settings from config.yaml: {e}")
+        config = {}
+    settings = {'width': 5000, 'height': 5000, 'concurrency': DEFAULT_EXPORT_CONCURRENCY}
+    try:
+        settings['width'], settings['height'] = map(int, str(config.get('cover-size', '5000x5000')).split('x'))
+    except ValueError:
+        pass
+    try:
+        settings['concurrency'] = max(1, int(config.get('artwork-export-concurrency', DEFAULT_EXPORT_CONCURRENCY)))
+    except (TypeError, ValueError):
+        pass
+    return settings
+
+
+def export_artwork_batch(session, items: list, directory: str, width: int = 5000, height: int | None = None,
+                         concurrency: int = DEFAULT_EXPORT_CONCURRENCY, retries: int = DEFAULT_EXPORT_RETRIES,
+                         progress=None, should_abort=None, timeout=30) -> ExportSummary:
+    """Download full-size covers for items into directory with a bounded worker pool.
+
+    Files already on disk with the server's size are skipped and interrupted
+    .part files are resumed, so re-running an export only fetches what is missing.
+    progress(summary) is called from worker threads after each item settles.
+    """
+    seen = set()
+    unique = []
+    for item in items:
+        key = item.get('id') or item.get('artworkUrl')
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(item)
+
+    summary = ExportSummary(len(unique))
+    os.makedirs(directory, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max(1, int(concurrency))) as pool:
+        futures = {
+            pool.submit(_export_one, session, item, directory, width, height or width,
+                        retries, summary, should_abort, timeout): item
+            for item in unique
+        }
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                saved = future.result()
+                with summary._lock:
+                    if saved:
+                        summary.saved += 1
+                    else:
+                        summary.skipped += 1
+            except DownloadCancelled:
+                continue
+            except Exception as e:
+                logging.warning(f"Artwork export failed for {item.get('name', 'item')}: {e}")
+                with summary._lock:
+                    summary.failed += 1
+                    summary.errors.append((item.get('name', 'item'), str(e)))
+            if progress is not None:
+                progress(summary)
+    summary.finished = time.monotonic()
+    summary.cancelled = should_abort is not None and should_abort()
+    return summary
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import threading
+
+import aiohttp
+from PyQt6.QtCore import QObject, pyqtSignal
+
+DEFAULT_CONNECTION_LIMIT = 32
+DNS_CACHE_TTL = 300
+
+
+class AsyncTask(QObject):
+    """Qt-side handle for a coroutine running on the controller loop."""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, future, parent=None):
+        super().__init__(parent)
+        self.future = future
+
+    def cancel(self):
+        self.future.cancel()
+
+
+class AsyncLoopService:
+    """One event loop thread and one aiohttp session for the lifetime of the controller.
+
+    Coroutines submitted from any thread run on the loop and share the session's
+    connector, so DNS results, TLS sessions and keep-alive connections stay warm
+    between requests.
+    """
+
+    def __init__(self, headers: dict | None = None, connection_limit: int = DEFAULT_CONNECTION_LIMIT):
+        self._headers = headers or {}
+        self._connection_limit = connection_limit
+        self._tasks = set()
+        self._tasks_lock = threading.Lock()
+        self.session = None
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="apmyx-async-loop", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._open_session(), self.loop).result()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _open_session(self):
+        connector = aiohttp.TCPConnector(
+            limit=self._connection_limit,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=60,
+        )
+        self.session = aiohttp.ClientSession(connector=connector, headers=self._headers)
+
+    def submit(self, coro):
+        """Schedule coro on the loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro) -> AsyncTask:
+        """Schedule coro and report its outcome through the returned task's signals."""
+        task = AsyncTask(self.submit(coro))
+        with self._tasks_lock:
+            self._tasks.add(task)
+        task.future.add_done_callback(lambda future, t=task: self._settle(t, future))
+        return task
+
+    def _settle(self, task, future):
+        with self._tasks_lock:
+            self._tasks.discard(task)
+        if future.cancelled():
+            return
+        try:
+            error = future.exception()
+            if error is not None:
+                task.failed.emit(str(error))
+            else:
+                task.finished.emit(future.result())
+        except RuntimeError:
+            # The receiving widget went away before the result arrived.
+            pass
+
+    def cancel_all(self):
+        with self._tasks_lock:
+            tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+
+    def shutdown(self, timeout: float = 5.0):
+        if not self.loop.is_running():
+            return
+        self.cancel_all()
+
+        async def close_session():
+            current = asyncio.current_task()
+            pending = [t for t in asyncio.all_tasks() if t is not current]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if self.session is not None:
+                await self.session.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close_session(), self.loop).result(timeout)
+        except Exception as e:
+            logging.warning(f"Could not close async HTTP session cleanly: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
@@ -0,0 +1,390 @@
+import collections
+import json
+import logging
+import queue
+import subprocess
+import sys
+import threading
+
+import yaml
+
+DEFAULT_POOL_SIZE = 3
+# The serve pool is opt-in until it has been exercised against release builds.
+DEFAULT_SERVE = False
+READY_TIMEOUT = 60.0
+SHUTDOWN_TIMEOUT = 3.0
+
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+_TERMINATED = -15
+
+
+class _LineStream:
+    """Read side of a request's stdout or stderr; readline() returns '' once the request ends."""
+
+    def __init__(self):
+        self._lines = queue.Queue()
+        self._ended = False
+
+    def _put(self, line: str):
+        if not self._ended:
+            self._lines.put(line + '\n')
+
+    def _end(self):
+        if not self._ended:
+            self._ended = True
+            self._lines.put('')
+
+    def readline(self) -> str:
+        line = self._lines.get()
+        if line == '':
+            # Leave the marker for any other reader of this stream.
+            self._lines.put('')
+        return line
+
+    def __iter__(self):
+        return iter(self.readline, '')
+
+    def close(self):
+        pass
+
+
+class BackendCall:
+    """Popen-compatible handle for one operation run by the backend.
+
+    Callers keep their existing process code: read stdout/stderr line by line,
+    wait() for the exit code, poll(), and terminate() to cancel.
+    """
+
+    def __init__(self, client, args: list):
+        self.args = args
+        self.stdout = _LineStream()
+        self.stderr = _LineStream()
+        self.returncode = None
+        self._client = client
+        self._done = threading.Event()
+        self._process = None
+        self.cancelled = False
+
+    @property
+    def pid(self):
+        return self._process.pid if self._process is not None else None
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        if not self._done.wait(timeout):
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def communicate(self, timeout: float | None = None) -> tuple[str, str]:
+        self.wait(timeout)
+        return ''.join(self.stdout), ''.join(self.stderr)
+
+    def terminate(self):
+        self._client.cancel(self)
+
+    kill = terminate
+
+    def _finish(self, code: int):
+        if self._done.is_set():
+            return
+        self.returncode = code
+        self.stdout._end()
+        self.stderr._end()
+        self._done.set()
+
+
+class _BackendProcess:
+    """One `downloader --serve` process running at most one call at a time."""
+
+    def __init__(self, client, executable: str):
+        self._client = client
+        self._next_id = 0
+        self.call = None
+        self.call_id = None
+        self.ready = threading.Event()
+        self.dead = threading.Event()
+        self._write_lock = threading.Lock()
+        self._startup_errors = collections.deque(maxlen=20)
+        self.process = subprocess.Popen(
+            [executable, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            creationflags=_CREATION_FLAGS,
+        )
+        threading.Thread(target=self._read_events, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+    @property
+    def busy(self) -> bool:
+        return self.call is not None
+
+    def start(self, call: BackendCall) -> bool:
+        self._next_id += 1
+        self.call, self.call_id = call, self._next_id
+        call._process = self.process
+        request = {"id": self.call_id, "method": "run", "params": {"args": call.args}}
+        try:
+            with self._write_lock:
+                self.process.stdin.write(json.dumps(request) + '\n')
+                self.process.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            self.call, self.call_id = None, None
+            call._process = None
+            return False
+
+    def _read_events(self):
+        for line in iter(self.process.stdout.readline, ''):
+            try:
+                message = json.loads(line)
+            except ValueError:
+                logging.info(f"[Go Backend] {line.rstrip()}")
+                continue
+            if message.get('event') == 'ready':
+                self.ready.set()
+                continue
+            call = self.call
+            if call is None or message.get('id') != self.call_id:
+                continue
+            event = message.get('event')
+            if event == 'stdout':
+                call.stdout._put(message.get('data', ''))
+            elif event == 'stderr':
+                call.stderr._put(message.get('data', ''))
+            elif 'result' in message or 'error' in message:
+                if message.get('error'):
+                    call.stderr._put(message['error'])
+                code = (message.get('result') or {}).get('code', 1)
+                self.call, self.call_id = None, None
+                call._finish(code)
+                self._client._on_idle(self)
+        self.process.wait()
+        self.dead.set()
+        self.ready.set()
+        self._client._on_exit(self)
+
+    def _read_stderr(self):
+        # Only startup failures reach the real stderr; operation output is forwarded as events.
+        for line in iter(self.process.stderr.readline, ''):
+            line = line.rstrip()
+            if line:
+                self._startup_errors.append(line)
+                logging.info(f"[Go Backend ERR] {line}")
+
+    def startup_errors(self) -> list:
+        return list(self._startup_errors)
+
+    def stop(self, timeout: float = SHUTDOWN_TIMEOUT):
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self):
+        if self.process.poll() is None:
+            self.process.terminate()
+
+
+class BackendClient:
+    """Runs downloader operations on a small pool of long-lived backend processes.
+
+    Each process loads its config, fetches a developer token and opens its
+    connections once, then serves operations over newline-delimited JSON on
+    stdin/stdout. Calls queue when every process is busy. Cancelling a running
+    call stops its process; a replacement is started on demand. If the
+    executable cannot serve (an older build, or startup fails), calls fall back
+    to a one-shot process each, exactly as before.
+
+    The pool is only used when serve is true (the `backend-serve-mode` config
+    key); otherwise every call gets its own one-shot process.
+    """
+
+    def __init__(self, executable: str, pool_size: int = DEFAULT_POOL_SIZE, serve: bool = DEFAULT_SERVE):
+        self.executable = executable
+        self.pool_size = max(1, int(pool_size))
+        self.supported = bool(serve)
+        self._processes = []
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def popen(self, args: list) -> BackendCall:
+        """Start `downloader <args>`; returns a Popen-like handle."""
+        call = BackendCall(self, list(args))
+        with self._lock:
+            if self._closed:
+                call._finish(_TERMINATED)
+                return call
+            if not self.supported:
+                self._run_standalone(call)
+                return call
+            self._queue.append(call)
+        self._dispatch()
+        return call
+
+    def ensure_capacity(self, size: int):
+        """Grow the pool to at least size processes; it is never shrunk while running."""
+        with self._lock:
+            if size <= self.pool_size:
+                return
+            self.pool_size = int(size)
+        self._dispatch()
+
+    def cancel(self, call: BackendCall):
+        call.cancelled = True
+        with self._lock:
+            if call in self._queue:
+                self._queue.remove(call)
+                call._finish(_TERMINATED)
+                return
+            owner = next((p for p in self._processes if p.call is call), None)
+        if owner is not None:
+            logging.info(f"Stopping backend process {owner.process.pid} to cancel its current operation.")
+            owner.kill()
+        elif call._process is not None and call.returncode is None:
+            # A one-shot fallback process.
+            call._process.terminate()
+
+    def _dispatch(self):
+        while True:
+            with self._lock:
+                if not self._queue or self._closed:
+                    return
+                idle = next((p for p in self._processes if not p.busy and not p.dead.is_set()), None)
+                if idle is None:
+                    if len(self._processes) >= self.pool_size:
+                        return
+                    try:
+                        idle = _BackendProcess(self, self.executable)
+                    except OSError as e:
+                        logging.error(f"Could not start backend process: {e}")
+                        self._fall_back()
+                        return
+                    self._processes.append(idle)
+                    # Reserve it while the token handshake runs.
+                    idle.call = self._queue.popleft()
+                    threading.Thread(target=self._start_when_ready, args=(idle, idle.call), daemon=True).start()
+                    continue
+                call = self._queue.popleft()
+            if not idle.start(call):
+                with self._lock:
+                    self._queue.appendleft(call)
+                # Its exit handler dispatches the call again on a fresh process.
+                idle.kill()
+                return
+
+    def _start_when_ready(self, process: _BackendProcess, call: BackendCall):
+        process.ready.wait(READY_TIMEOUT)
+        if call.cancelled:
+            process.call = None
+            call._finish(_TERMINATED)
+            self._on_idle(process)
+            return
+        if process.dead.is_set() or not process.ready.is_set():
+            process.call = None
+            errors = process.startup_errors()
+            logging.warning(f"Backend serve mode unavailable ({errors[-1] if errors else 'no response'}); "
+                            "running each operation in its own process.")
+            process.kill()
+            with self._lock:
+                self._queue.appendleft(call)
+                self._fall_back()
+            return
+        if not process.start(call):
+            with self._lock:
+                self._queue.appendleft(call)
+            process.kill()
+
+    def _fall_back(self):
+        """Switch to one process per call and hand every queued call to it. Caller holds the lock."""
+        self.supported = False
+        while self._queue:
+            self._run_standalone(self._queue.popleft())
+
+    def _on_idle(self, process: _BackendProcess):
+        self._dispatch()
+
+    def _on_exit(self, process: _BackendProcess):
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+            call, process.call = process.call, None
+        if call is not None and call._process is process.process:
+            if not call.cancelled:
+                call.stderr._put(f"Backend process exited unexpectedly (code {process.process.returncode}).")
+            call._finish(_TERMINATED if call.cancelled else 1)
+        self._dispatch()
+
+    def _run_standalone(self, call: BackendCall):
+        def forward(stream, sink):
+            for line in iter(stream.readline, ''):
+                sink._put(line.rstrip('\r\n'))
+
+        def run():
+            try:
+                process = subprocess.Popen(
+                    [self.executable] + call.args,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    bufsize=1,
+                    creationflags=_CREATION_FLAGS,
+                )
+            except OSError as e:
+                call.stderr._put(f"Failed to start backend: {e}")
+                call._finish(1)
+                return
+            call._process = process
+            if call.cancelled:
+                process.terminate()
+            readers = [
+                threading.Thread(target=forward, args=(process.stdout, call.stdout), daemon=True),
+                threading.Thread(target=forward, args=(process.stderr, call.stderr), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+            code = process.wait()
+            for reader in readers:
+                reader.join()
+            call._finish(code)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            queued = list(self._queue)
+            self._queue.clear()
+            processes = list(self._processes)
+        for call in queued:
+            call._finish(_TERMINATED)
+        for process in processes:
+            process.stop()
+
+
+def load_backend_settings() -> dict:
+    try:
+        with open('config.yaml', 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        config = {}
+    except Exception as e:
+        logging.warning(f"Could not read backend settings from config.yaml: {e}")
+        config = {}
+    settings = {}
+    try:
+        settings['pool_size'] = int(config.get('backend-pool-size', DEFAULT_POOL_SIZE))
+    except (TypeError, ValueError):
+        pass
+    settings['serve'] = bool(config.get('backend-serve-mode', DEFAULT_SERVE))
+    return settings
@@ -0,0 +1,261 @@
+import asyncio
+import logging
+import random
+import re
+import time
+
+import aiohttp
+
+from core.rate_limiter import INTERACTIVE, RateLimiter, rate_limiter
+from core.token_store import TokenStore, jwt_expiry
+
+API_ROOT = "https://amp-api.music.apple.com/v1/catalog"
+LOOKUP_PARAMS = {"extend": "extendedAssetUrls,relationships.tracks"}
+
+DEFAULT_DEADLINE = 20.0
+DEFAULT_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Refresh this long before the token's exp so no request ever sees it lapse.
+TOKEN_REFRESH_MARGIN = 6 * 3600
+TOKEN_RETRY_DELAY = 300
+
+
+class CatalogError(ValueError):
+    """A catalog request that could not be completed; status is the last HTTP status, if any."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+class TokenUnavailable(CatalogError):
+    pass
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CatalogClient:
+    """Async Apple Music catalog client running on the controller's event loop.
+
+    Every call shares one aiohttp session. Token refreshes are single-flight:
+    concurrent 401/403 responses wait on the same refresh instead of each
+    scraping music.apple.com. The token is kept in a TokenStore across restarts
+    and replaced in the background shortly before its JWT exp. Every request
+    passes through the shared per-host RateLimiter.
+    """
+
+    def __init__(self, session_provider, storefront: str, user_agent: str, on_token_failure=None,
+                 token_store: TokenStore | None = None, limiter: RateLimiter | None = None):
+        self._session_provider = session_provider
+        self.storefront = storefront
+        self.user_agent = user_agent
+        self.on_token_failure = on_token_failure
+        self.token_store = token_store
+        self.limiter = limiter or rate_limiter()
+        self._token = None
+        self._token_expires = None
+        self._refresh_task = None
+        self._refresh_handle = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self._session_provider()
+
+    def reset_token(self):
+        self._token = None
+        self._token_expires = None
+        if self.token_store is not None:
+            self.token_store.clear()
+
+    # --- Developer token ---
+
+    async def token(self) -> str:
+        if self._token and (self._token_expires is None or self._token_expires > time.time()):
+            return self._token
+        if self.token_store is not None and (stored := self.token_store.load(min_validity=60)):
+            self._set_token(*stored)
+            return self._token
+        # Shield the shared refresh so one cancelled caller does not abort it for the rest.
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._fetch_token())
+        return self._refresh_task
+
+    async def _refresh_token(self, stale: str | None) -> str:
+        if self._token == stale:
+            self._token = None
+            self._token_expires = None
+            if self.token_store is not None:
+                self.token_store.clear()
+        return await self.token()
+
+    def _set_token(self, token: str, expires: float | None):
+        self._token = token
+        self._token_expires = expires
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if expires is not None:
+            delay = max(60.0, expires - time.time() - TOKEN_REFRESH_MARGIN)
+            self._refresh_handle = asyncio.get_running_loop().call_later(delay, self._refresh_in_background)
+
+    def _refresh_in_background(self):
+        """Fetch a replacement while the current token keeps serving requests."""
+        self._refresh_handle = None
+        task = self._start_refresh()
+
+        def done(t):
+            if t.cancelled() or t.exception() is not None:
+                logging.info("Background developer token refresh failed; retrying later.")
+                if self._token_expires is not None and self._token_expires > time.time():
+                    self._refresh_handle = asyncio.get_running_loop().call_later(TOKEN_RETRY_DELAY, self._refresh_in_background)
+        task.add_done_callback(done)
+
+    async def _fetch_token(self) -> str:
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                logging.info(f"No cached token found. Fetching new developer token (Attempt {attempt + 1}/{max_retries})...")
+                timeout = aiohttp.ClientTimeout(total=DEFAULT_DEADLINE)
+                headers = {"User-Agent": self.user_agent}
+                homepage = await self._get_text(f'https://music.apple.com/{self.storefront}/browse', headers, timeout)
+                match = re.search(r'/assets/index-legacy[~-][^/"]+\.js', homepage)
+                if not match:
+                    raise ValueError("Could not find core JS file.")
+                script = await self._get_text(f"https://music.apple.com{match.group(0)}", headers, timeout)
+                token_match = re.search(r'eyJh[a-zA-Z0-9\._-]+', script)
+                if not token_match:
+                    raise ValueError("Could not find bearer token.")
+                token = token_match.group(0)
+                self._set_token(token, jwt_expiry(token))
+                if self.token_store is not None:
+                    self.token_store.save(token)
+                logging.info("Successfully fetched and cached new developer token.")
+                return token
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logging.error(f"Failed to get developer token on attempt {attempt + 1}: {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(backoff_delay(attempt + 1))
+                else:
+                    # A failed background refresh is silent while the current token still works.
+                    if self.on_token_failure is not None and not self._token:
+                        self.on_token_failure(e)
+                    raise TokenUnavailable(f"Could not retrieve developer token: {e}") from e
+        raise TokenUnavailable("Could not retrieve developer token.")
+
+    async def _get_text(self, url: str, headers: dict, timeout: aiohttp.ClientTimeout) -> str:
+        async with self.limiter.request_async(url) as permit:
+            async with self.session.get(url, headers=headers, timeout=timeout) as response:
+                permit.record(response.status, response.headers)
+                response.raise_for_status()
+                return await response.text()
+
+    async def prewarm_token(self) -> str | None:
+        """Load or fetch the token ahead of the first request; failures are left for that request to report."""
+        try:
+            return await self.token()
+        except CatalogError:
+            return None
+
+    # --- Requests ---
+
+    async def get_json(self, url: str, params: dict | None = None, headers: dict | None = None,
+                       cookies: dict | None = None, deadline: float = DEFAULT_DEADLINE,
+                       retries: int = DEFAULT_RETRIES, priority: int = INTERACTIVE) -> dict:
+        """GET an authorised catalog URL with backoff, token refresh and an overall deadline.
+
+        priority orders this request against other queued work for the same host.
+        """
+        loop = asyncio.get_running_loop()
+        expires = loop.time() + deadline
+        refreshed = False
+        last_status = None
+        attempt = 0
+        while True:
+            token = await self.token()
+            request_headers = {
+                "Authorization": f"Bearer {token}",
+                "Origin": "https://music.apple.com",
+                "Referer": "https://music.apple.com/",
+                "User-Agent": self.user_agent,
+            }
+            if headers:
+                request_headers.update(headers)
+
+            remaining = expires - loop.time()
+            if remaining <= 0:
+                raise CatalogError(f"Catalog request timed out after {deadline:.0f}s", last_status)
+
+            retry_after = None
+            stale_token = False
+            try:
+                async with self.limiter.request_async(url, priority) as permit, \
+                        self.session.get(url, params=params, headers=request_headers, cookies=cookies,
+                                         timeout=aiohttp.ClientTimeout(total=remaining)) as response:
+                    last_status = response.status
+                    permit.record(response.status, response.headers)
+                    if response.status in (401, 403) and not refreshed:
+                        stale_token = True
+                    elif response.status in _RETRYABLE_STATUS:
+                        retry_after = permit.retry_after
+                        raise CatalogError(f"HTTP {response.status} from catalog", response.status)
+                    elif response.status >= 400:
+                        raise CatalogError(f"HTTP {response.status} for {url}", response.status)
+                    else:
+                        return await response.json(content_type=None)
+            except CatalogError as e:
+                if e.status not in _RETRYABLE_STATUS or attempt >= retries - 1:
+                    raise
+                logging.warning(f"Catalog request failed on attempt {attempt + 1}/{retries}: {e}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= retries - 1:
+                    raise CatalogError(f"Catalog request failed after {retries} attempts: {e}", last_status) from e
+                logging.warning(f"Catalog request failed on attempt {attempt + 1}/{retries}: {e}")
+
+            if stale_token:
+                # Refresh outside the permit: the token scrape is slow and sends nothing to this host.
+                logging.warning("Developer token expired or invalid. Fetching a new one and retrying.")
+                refreshed = True
+                await self._refresh_token(token)
+                continue
+
+            delay = backoff_delay(attempt)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            await asyncio.sleep(min(delay, max(0.0, expires - loop.time())))
+            attempt += 1
+
+    @staticmethod
+    def search_params(term: str, types: str, limit: int, offset: int = 0) -> dict:
+        params = {"term": term, "types": types.replace('_', '-'), "limit": limit, "offset": offset}
+        if types not in ["music_videos", "artists"]:
+            params["include"] = "relationships.tracks"
+        return params
+
+    async def search(self, term: str, types: str, limit: int, offset: int = 0, **kwargs) -> dict:
+        params = self.search_params(term, types, limit, offset)
+        return await self.get_json(f"{API_ROOT}/{self.storefront}/search", params=params, **kwargs)
+
+    async def lookup(self, item_type_plural: str, item_id: str, **kwargs) -> dict:
+        return await self.get_json(f"{API_ROOT}/{self.storefront}/{item_type_plural}/{item_id}", params=LOOKUP_PARAMS, **kwargs)
+
+    async def lookup_many(self, item_type_plural: str, item_ids: list, **kwargs) -> dict:
+        params = dict(LOOKUP_PARAMS, ids=','.join(item_ids))
+        return await self.get_json(f"{API_ROOT}/{self.storefront}/{item_type_plural}", params=params, **kwargs)
+
+    async def lyrics(self, song_id: str, media_user_token: str, **kwargs) -> dict:
+        params = {"l": "en", "extend": "ttmlLocalizations"}
+        headers = {"Accept": "application/json", "Accept-Language": "en-US,en;q=0.9"}
+        return await self.get_json(
+            f"{API_ROOT}/{self.storefront}/songs/{song_id}/lyrics", params=params, headers=headers,
+            cookies={'media-user-token': media_user_token}, **kwargs,
+        )
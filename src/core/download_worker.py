@@ -2,17 +2,25 @@ import json
 import logging
 import os
 import re
-import subprocess
-import sys
+import tempfile
 import time
 import threading
 import yaml
 
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QRunnable, QThreadPool
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QRunnable, QThreadPool, QTimer
+
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 3
+DEFAULT_MAX_CONCURRENT_WRAPPER_DOWNLOADS = 2
+WRAPPER_CODECS = {"ALAC", "ATMOS"}
+THROUGHPUT_INTERVAL_MS = 1000
+# Older fetched metadata is not handed to the backend; it looks the album up again
+# so a job that sat in the queue downloads what the catalog serves now.
+METADATA_HANDOFF_MAX_AGE = 30 * 60
 
 class DownloadJobRunner(QRunnable):
 
-    def __init__(self, job_id, command, total_tracks, worker_ref, quality_preference, is_playlist=False, original_url=""):
+    def __init__(self, job_id, command, total_tracks, worker_ref, quality_preference, is_playlist=False, original_url="",
+                 is_selection=False):
         super().__init__()
         self.job_id = job_id
         self.command = command
@@ -23,6 +31,10 @@ class DownloadJobRunner(QRunnable):
         self.started_at = None
         self.total_tracks_updated = False
         self._pause_triggered = False
+        self.cancelled = False
+        self.process = None
+        self.transferred_bytes = 0
+        self._counted_bytes = 0
         
        
         self.original_url = original_url
@@ -33,6 +45,8 @@ class DownloadJobRunner(QRunnable):
         self.is_mv = "--music-video" in command
         self.is_single_song = "--song" in command
         self.is_playlist = is_playlist
+        # A track selection counts its own tracks; the backend's numbers are album positions.
+        self.is_selection = is_selection
         
  
         self.is_user_playlist = "pl.u-" in original_url
@@ -94,8 +108,28 @@ class DownloadJobRunner(QRunnable):
             s += 1
         return f"{f:.1f} {units[s]}"
 
+    def cancel(self):
+        """Stops this job's backend operation; run() then reports it as cancelled."""
+        self.cancelled = True
+        process = self.process
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+    def pause(self):
+        """Stops this job without reporting it finished, so the queue can run it again on resume."""
+        self._pause_triggered = True
+        self.cancel()
+
+    def _count_transferred(self):
+        # downloaded_bytes restarts at each track; keep a running total for throughput reporting.
+        if self.downloaded_bytes >= self._counted_bytes:
+            self.transferred_bytes += self.downloaded_bytes - self._counted_bytes
+        else:
+            self.transferred_bytes += self.downloaded_bytes
+        self._counted_bytes = self.downloaded_bytes
+
     def _should_use_album_like_tracking(self):
-        return not self.is_single_song and not (self.is_mv and self.total_tracks == 1)
+        return not self.is_single_song and not self.is_selection and not (self.is_mv and self.total_tracks == 1)
 
     def _emit_progress(self, status_text, track_percent, overall_percent, force=False):
         now = time.monotonic()
@@ -331,28 +365,23 @@ class DownloadJobRunner(QRunnable):
     def run(self):
         try:
             self.signals.fetching.emit(self.job_id, "Fetching details...")
-            process = subprocess.Popen(
-                self.command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            )
+            process = self.worker_ref.controller.backend.popen(self.command[1:])
 
-            self.worker_ref.set_current_process(process)
+            self.process = process
+            if self.cancelled:
+                process.terminate()
             self.started_at = time.monotonic()
             output_lock = threading.Lock()
 
             def stream_reader(stream, is_stderr):
                 for line in iter(stream.readline, ''):
-                    if self.worker_ref.was_terminated_intentionally and process.poll() is not None:
+                    if self.cancelled and process.poll() is not None:
                         break
                     if self._pause_triggered:
                         break
                     with output_lock:
                         self.process_line(line, is_stderr)
+                        self._count_transferred()
                 stream.close()
 
             stdout_thread = threading.Thread(target=stream_reader, args=(process.stdout, False), daemon=True)
@@ -367,7 +396,7 @@ class DownloadJobRunner(QRunnable):
        
                 return
 
-            if not self.worker_ref.was_terminated_intentionally:
+            if not self.cancelled:
                 stdout_thread.join(timeout=2)
                 stderr_thread.join(timeout=2)
 
@@ -388,7 +417,7 @@ class DownloadJobRunner(QRunnable):
 
             elapsed_str = _fmt_duration(elapsed_sec)
 
-            if self.worker_ref.was_terminated_intentionally:
+            if self.cancelled:
                 self.signals.finished.emit(self.job_id, False, f"Cancelled after {elapsed_str}.", [])
             elif return_code != 0:
                 final_error = self.error_lines[-1] if self.error_lines else f"Backend exited with code {return_code}."
@@ -406,7 +435,7 @@ class DownloadJobRunner(QRunnable):
             logging.error(f"Exception in DownloadJobRunner for job {self.job_id}: {e}")
             self.signals.finished.emit(self.job_id, False, "An unexpected error occurred.", [])
         finally:
-            self.worker_ref.set_current_process(None)
+            self.process = None
 
 class DownloadWorkerSignals(QObject):
     fetching = pyqtSignal(int, str)
@@ -428,29 +457,59 @@ class DownloadWorker(QObject):
     job_stream_label = pyqtSignal(int, str)
     queue_has_been_paused = pyqtSignal(list)
     job_started = pyqtSignal(int)
+    throughput_updated = pyqtSignal(int, float)
 
     def __init__(self, downloader_executable, controller):
         super().__init__()
         self.downloader_executable = downloader_executable
         self.controller = controller
         self.download_queue = []
-        self.is_busy = False
+        self.running_jobs = {}
         self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(1)
-        self.current_process = None
-        self.was_terminated_intentionally = False
-        self.current_job_id = None
-        self.current_job_dict = None
+        self.thread_pool.setMaxThreadCount(DEFAULT_MAX_CONCURRENT_DOWNLOADS)
         self.queue_paused = False
 
-    def set_current_process(self, process):
-        self.current_process = process
+        self._bytes_seen = {}
+        self._throughput_checked = None
+        self.throughput_timer = QTimer(self)
+        self.throughput_timer.setInterval(THROUGHPUT_INTERVAL_MS)
+        self.throughput_timer.timeout.connect(self._report_throughput)
+
+    def _needs_wrapper(self, job) -> bool:
+        """ALAC and Atmos are decrypted through the wrapper; AAC and music videos are not."""
+        if "/music-video/" in job.get('original_url', ''):
+            return False
+        return (job.get('quality') or '').upper() in WRAPPER_CODECS
+
+    def _concurrency_limits(self, config) -> dict:
+        def read(key, default):
+            try:
+                return max(1, int(config.get(key, default)))
+            except (TypeError, ValueError):
+                logging.warning(f"Invalid {key} in config.yaml; using {default}.")
+                return default
+
+        total = read('max-concurrent-downloads', DEFAULT_MAX_CONCURRENT_DOWNLOADS)
+        return {
+            'total': total,
+            'wrapper': min(total, read('max-concurrent-wrapper-downloads', DEFAULT_MAX_CONCURRENT_WRAPPER_DOWNLOADS)),
+            'direct': min(total, read('max-concurrent-direct-downloads', total)),
+        }
+
+    def _has_capacity(self, job, limits) -> bool:
+        needs_wrapper = self._needs_wrapper(job)
+        running = sum(1 for entry in self.running_jobs.values() if entry['wrapper'] == needs_wrapper)
+        return running < limits['wrapper' if needs_wrapper else 'direct']
 
-    def stop_current_job(self):
-        self.was_terminated_intentionally = True
-        if self.current_process and self.current_process.poll() is None:
-            logging.info(f"Sending termination signal to process for job {self.current_job_id}")
-            self.current_process.terminate()
+    def stop_job(self, job_id: int):
+        entry = self.running_jobs.get(job_id)
+        if entry is not None:
+            logging.info(f"Sending termination signal to process for job {job_id}")
+            entry['runner'].cancel()
+
+    def stop_all_jobs(self):
+        for job_id in list(self.running_jobs):
+            self.stop_job(job_id)
 
     def pause_queue(self):
         """Stops the queue from processing new jobs."""
@@ -472,8 +531,7 @@ class DownloadWorker(QObject):
         self.download_queue.clear()
         for job in queued_jobs:
             self.job_cancelled.emit(job['job_id'])
-        if self.is_busy:
-            self.stop_current_job()
+        self.stop_all_jobs()
         self.queue_status_update.emit(len(self.download_queue))
 
     def cancel_job(self, job_id: int) -> bool:
@@ -484,9 +542,9 @@ class DownloadWorker(QObject):
         """
         removed = False
 
-        if self.is_busy and self.current_job_id == job_id:
+        if job_id in self.running_jobs:
             logging.info(f"Requesting cancellation for running job {job_id}.")
-            self.stop_current_job()
+            self.stop_job(job_id)
             removed = True
 
    
@@ -536,16 +594,29 @@ class DownloadWorker(QObject):
             return {}
 
     def _process_queue(self):
-        if self.is_busy or not self.download_queue or self.queue_paused:
+        """Starts queued jobs, oldest first, while the global and per-codec limits allow."""
+        if self.queue_paused or not self.download_queue:
             return
 
-        self.is_busy = True
-        self.was_terminated_intentionally = False
-        job = self.download_queue.pop(0)
-        self.current_job_id = job['job_id']
-        self.current_job_dict = job
-        self.job_started.emit(self.current_job_id)
-        self.queue_status_update.emit(len(self.download_queue))
+        latest_config = self._get_latest_config()
+        limits = self._concurrency_limits(latest_config)
+        self.thread_pool.setMaxThreadCount(limits['total'])
+        # Keep one backend process free so fetches are not stuck behind downloads.
+        self.controller.backend.ensure_capacity(limits['total'] + 1)
+
+        while not self.queue_paused and len(self.running_jobs) < limits['total']:
+            # A job waiting on a full wrapper slot does not hold up AAC or video jobs behind it.
+            job = next((j for j in self.download_queue if self._has_capacity(j, limits)), None)
+            if job is None:
+                break
+            self.download_queue.remove(job)
+            self.queue_status_update.emit(len(self.download_queue))
+            self._start_job(job, latest_config)
+
+    def _start_job(self, job, latest_config):
+        job_id = job['job_id']
+        self.job_started.emit(job_id)
+        metadata_file = None
 
         try:
             url_to_download = job['original_url']
@@ -562,8 +633,6 @@ class DownloadWorker(QObject):
 
             command = [self.downloader_executable]
             
-            latest_config = self._get_latest_config()
-            
    
             allowed_flags = {
                 'aac-save-folder', 'alac-save-folder', 'atmos-save-folder', 'mv-save-folder',
@@ -595,18 +664,27 @@ class DownloadWorker(QObject):
                 command.append("--music-video")
             elif is_song_url: 
                 command.append("--song")
+            selected_ids = media_data.get('_selected_track_ids')
+            if selected_ids:
+                command.extend(["--select-tracks", ",".join(selected_ids)])
+            # The handoff is opt-in until the backend's --metadata-file path has been checked against release builds.
+            if not is_mv_url and latest_config.get('reuse-fetched-metadata', False):
+                metadata_file = self._write_metadata_file(media_data)
+                if metadata_file:
+                    command.extend(["--metadata-file", metadata_file])
             command.append(url_to_download)
 
             logging.info(f"Executing Go backend with command: {' '.join(command)}")
 
             runner = DownloadJobRunner(
-                job['job_id'], 
+                job_id, 
                 command, 
                 total_tracks, 
                 self, 
                 quality_pref, 
                 is_playlist=is_playlist_url,
-                original_url=url_to_download 
+                original_url=url_to_download,
+                is_selection=bool(selected_ids)
             )
             
             runner.signals.fetching.connect(self.job_fetching)
@@ -617,43 +695,111 @@ class DownloadWorker(QObject):
             runner.signals.finished.connect(self._on_job_finished)
             runner.signals.pause_queue_requested.connect(self._handle_pause_request)
 
+            self.running_jobs[job_id] = {
+                'job': job,
+                'runner': runner,
+                'wrapper': self._needs_wrapper(job),
+                'metadata_file': metadata_file,
+            }
             self.thread_pool.start(runner)
+            if not self.throughput_timer.isActive():
+                self._throughput_checked = time.monotonic()
+                self.throughput_timer.start()
 
         except Exception as e:
-            logging.error(f"Failed to start job {job['job_id']}: {e}")
-            self.job_finished.emit(job['job_id'], False, f"Error preparing job: {e}", [])
-            self._on_job_finished(job['job_id'], False, "", [])
+            logging.error(f"Failed to start job {job_id}: {e}")
+            self.running_jobs.pop(job_id, None)
+            self._remove_metadata_file(metadata_file)
+            self.job_finished.emit(job_id, False, f"Error preparing job: {e}", [])
+
+    def _write_metadata_file(self, media_data) -> str | None:
+        """Writes the fetched album data and probed manifest URLs for the backend to reuse."""
+        fetched_at = media_data.get('_fetched_at')
+        if fetched_at is None or time.monotonic() - fetched_at > METADATA_HANDOFF_MAX_AGE:
+            return None
+        tracks = [
+            {'trackData': {'id': t.get('trackData', {}).get('id')}, 'm3u8': t['m3u8']}
+            for t in media_data.get('tracks', []) if t.get('m3u8')
+        ]
+        handoff = {'tracks': tracks}
+        # A single-song job carries a trimmed copy of the album; let the backend fetch the real one.
+        if not media_data.get('_is_single_song'):
+            handoff['albumData'] = media_data.get('albumData', {})
+        try:
+            fd, path = tempfile.mkstemp(prefix='amdl-meta-', suffix='.json')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(handoff, f)
+            return path
+        except OSError as e:
+            logging.warning(f"Could not write metadata file; the backend will fetch it again: {e}")
+            return None
+
+    def _remove_metadata_file(self, path):
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _release_job(self, job_id):
+        entry = self.running_jobs.pop(job_id, None)
+        if entry is not None:
+            self._remove_metadata_file(entry['metadata_file'])
+        return entry
 
     @pyqtSlot(int)
     def _handle_pause_request(self, job_id):
-        """Handles the runner's request to pause the entire queue."""
+        """Pauses the queue after a wrapper failure.
+
+        Every running job that goes through the wrapper is stopped and put back
+        at the front of the paused queue; AAC and video jobs already running are
+        left to finish.
+        """
         if self.queue_paused:
             return
         
         self.pause_queue()
-        self.stop_current_job() 
 
-        full_queue_to_persist = [self.current_job_dict] + self.download_queue
+        paused_jobs = []
+        for running_id, entry in list(self.running_jobs.items()):
+            if running_id == job_id or entry['wrapper']:
+                entry['runner'].pause()
+                self._release_job(running_id)
+                paused_jobs.append(entry['job'])
+
+        full_queue_to_persist = paused_jobs + self.download_queue
         
 
         self.download_queue.clear()
         
 
         self.queue_has_been_paused.emit(full_queue_to_persist)
-        
-
-        self.is_busy = False
-        self.current_job_id = None
-        self.current_job_dict = None
 
     @pyqtSlot(int, bool, str, list)
     def _on_job_finished(self, job_id, success, message, skipped_tracks):
         self.job_finished.emit(job_id, success, message, skipped_tracks)
-        self.is_busy = False
-        self.current_job_id = None
-        self.current_job_dict = None
+        self._release_job(job_id)
         self._process_queue()
 
+    @pyqtSlot()
+    def _report_throughput(self):
+        """Emits the number of running jobs and their combined transfer rate in bytes per second."""
+        now = time.monotonic()
+        elapsed = max(1e-3, now - (self._throughput_checked or now))
+        self._throughput_checked = now
+
+        transferred = 0
+        seen = {}
+        for job_id, entry in self.running_jobs.items():
+            total = entry['runner'].transferred_bytes
+            transferred += max(0, total - self._bytes_seen.get(job_id, 0))
+            seen[job_id] = total
+        self._bytes_seen = seen
+
+        self.throughput_updated.emit(len(self.running_jobs), transferred / elapsed)
+        if not self.running_jobs:
+            self.throughput_timer.stop()
+
     @pyqtSlot(int, str)
     def _on_stream_label(self, job_id, label):
         self.job_stream_label.emit(job_id, label)
@@ -663,4 +809,4 @@ class DownloadWorker(QObject):
         """Unified cancellation for all jobs, fetching and downloading."""
         logging.info("Unified cancel all jobs requested.")
         self.controller.cancel_all_fetches()
-        self.on_force_clear_all()
\ No newline at end of file
+        self.on_force_clear_all()
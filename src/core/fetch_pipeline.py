@@ -0,0 +1,156 @@
+import heapq
+import itertools
+import logging
+import threading
+
+import yaml
+
+from core.catalog_client import backoff_delay
+from core.rate_limiter import INTERACTIVE
+
+DEFAULT_FETCH_CONCURRENCY = 3
+DEFAULT_FETCH_RETRIES = 2
+RETRY_BACKOFF_BASE = 1.0
+
+
+class FetchFailed(Exception):
+    """A metadata fetch that did not produce media data; retryable failures are attempted again."""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class _FetchItem:
+    __slots__ = ('url', 'job_id', 'priority', 'cancelled', 'waiting')
+
+    def __init__(self, url: str, job_id: int, priority: int):
+        self.url = url
+        self.job_id = job_id
+        self.priority = priority
+        self.cancelled = threading.Event()
+        self.waiting = False
+
+
+class FetchPipeline:
+    """Bounded queue for download metadata fetches.
+
+    At most `concurrency` fetches run at once; the rest wait in arrival order,
+    with INTERACTIVE items (a card or pasted link) ahead of BACKGROUND ones
+    (discography and multi-select batches). A fetch that raises FetchFailed is
+    retried with backoff up to `retries` times before on_failed is called.
+
+    fetch(url, job_id) runs on a worker thread obtained from start(callable)
+    and reports success or cancellation itself.
+    """
+
+    def __init__(self, fetch, on_failed, start, concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+                 retries: int = DEFAULT_FETCH_RETRIES):
+        self._fetch = fetch
+        self._on_failed = on_failed
+        self._start = start
+        self.concurrency = max(1, int(concurrency))
+        self.retries = max(0, int(retries))
+        self._queue = []
+        self._seq = itertools.count()
+        self._active = []
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def submit(self, url: str, job_id: int, priority: int = INTERACTIVE):
+        item = _FetchItem(url, job_id, priority)
+        with self._lock:
+            heapq.heappush(self._queue, (priority, next(self._seq), item))
+            if self._running >= self.concurrency:
+                return
+            self._running += 1
+        self._start(self._drain)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def cancel(self, job_id: int) -> str | None:
+        """Drops a queued item, or stops one waiting to retry; returns its URL if either applied.
+
+        A fetch that is running is only marked so it is not retried; its process
+        is stopped by the caller.
+        """
+        with self._lock:
+            for index, (_, _, item) in enumerate(self._queue):
+                if item.job_id == job_id:
+                    self._queue.pop(index)
+                    heapq.heapify(self._queue)
+                    return item.url
+            for item in self._active:
+                if item.job_id == job_id:
+                    item.cancelled.set()
+                    return item.url if item.waiting else None
+        return None
+
+    def cancel_all(self) -> list:
+        """Drops every queued item and stops retries; returns the dropped job IDs."""
+        with self._lock:
+            dropped = [item.job_id for _, _, item in self._queue]
+            self._queue.clear()
+            for item in self._active:
+                item.cancelled.set()
+        return dropped
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._running -= 1
+                    return
+                _, _, item = heapq.heappop(self._queue)
+                self._active.append(item)
+            try:
+                self._run(item)
+            except Exception as e:
+                logging.error(f"Fetch for {item.url} failed unexpectedly: {e}")
+            finally:
+                with self._lock:
+                    self._active.remove(item)
+
+    def _run(self, item: _FetchItem):
+        for attempt in range(self.retries + 1):
+            if item.cancelled.is_set():
+                return
+            try:
+                self._fetch(item.url, item.job_id)
+                return
+            except FetchFailed as e:
+                if not e.retryable or attempt >= self.retries or item.cancelled.is_set():
+                    self._on_failed(item.job_id, item.url, str(e))
+                    return
+                delay = backoff_delay(attempt, base=RETRY_BACKOFF_BASE)
+                logging.warning(f"Fetch for {item.url} failed ({e}); retrying in {delay:.1f}s "
+                                f"(attempt {attempt + 2}/{self.retries + 1})")
+                item.waiting = True
+                try:
+                    if item.cancelled.wait(delay):
+                        return
+                finally:
+                    item.waiting = False
+
+
+def load_fetch_settings() -> dict:
+    try:
+        with open('config.yaml', 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        config = {}
+    except Exception as e:
+        logging.warning(f"Could not read fetch settings from config.yaml: {e}")
+        config = {}
+    settings = {}
+    try:
+        settings['concurrency'] = int(config.get('fetch-concurrency', DEFAULT_FETCH_CONCURRENCY))
+    except (TypeError, ValueError):
+        pass
+    try:
+        settings['retries'] = int(config.get('fetch-retries', DEFAULT_FETCH_RETRIES))
+    except (TypeError, ValueError):
+        pass
+    return settings
@@ -0,0 +1,130 @@
+import copy
+import logging
+import threading
+
+import requests
+import yaml
+from requests.adapters import HTTPAdapter
+
+from core.rate_limiter import INTERACTIVE, RateLimiter, RequestAbandoned
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+DEFAULT_CONNECTIONS_PER_HOST = 8
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 10.0
+# The artwork CDN serves static files and is not held to the API's request
+# budget; the rate only has to stay out of the way of a fast-scrolling grid.
+DEFAULT_CDN_RATE = 1000.0
+
+
+class ImageHttpClient:
+    """Keep-alive connection pool shared by every artwork request.
+
+    Requests are admitted by the client's own per-host RateLimiter at this
+    client's priority; the slot is held until the response headers arrive.
+    It is separate from the Apple API limiter: its window is fixed at the
+    connection pool size, so a slow full-size cover never shrinks it, and it
+    only orders thumbnails ahead of background exports and honours 429s.
+    """
+
+    def __init__(self, connections_per_host: int = DEFAULT_CONNECTIONS_PER_HOST,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 rate: float = DEFAULT_CDN_RATE):
+        self.connections_per_host = max(1, int(connections_per_host))
+        self.timeout = (connect_timeout, read_timeout)
+        self.limiter = RateLimiter(
+            rate=rate, burst=max(1, int(rate)),
+            max_concurrency=self.connections_per_host, min_concurrency=self.connections_per_host,
+            latency_target=read_timeout,
+        )
+        self.session = requests.Session()
+        # requests speaks HTTP/1.1 only, so reuse comes from keep-alive: each host
+        # gets a bounded set of warm connections and callers wait for a free one.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=self.connections_per_host,
+            pool_block=True,
+            max_retries=1,
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        self.priority = INTERACTIVE
+
+    def with_priority(self, priority: int) -> 'ImageHttpClient':
+        """A view of this client, sharing its connection pool, that queues at another priority."""
+        client = copy.copy(self)
+        client.priority = priority
+        return client
+
+    def _request(self, method: str, url: str, should_abort=None, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        with self.limiter.request(url, self.priority, should_abort=should_abort) as permit:
+            response = self.session.request(method, url, **kwargs)
+            permit.record(response.status_code, response.headers)
+        return response
+
+    def get(self, url: str, **kwargs):
+        return self._request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self._request('HEAD', url, **kwargs)
+
+    def fetch(self, url: str, should_abort=None, chunk_size: int = 64 * 1024) -> bytes | None:
+        """Download url into memory; returns None if should_abort() turns true while queued or mid-body."""
+        try:
+            response = self.get(url, stream=True, should_abort=should_abort)
+        except RequestAbandoned:
+            return None
+        with response:
+            response.raise_for_status()
+            chunks = []
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if should_abort is not None and should_abort():
+                    return None
+                chunks.append(chunk)
+        return b''.join(chunks)
+
+    def close(self):
+        self.session.close()
+
+
+def _load_settings() -> dict:
+    try:
+        with open('config.yaml', 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        config = {}
+    except Exception as e:
+        logging.warning(f"Could not read image HTTP settings from config.yaml: {e}")
+        config = {}
+    settings = {}
+    try:
+        settings['connections_per_host'] = int(config.get('artwork-connections-per-host', DEFAULT_CONNECTIONS_PER_HOST))
+    except (TypeError, ValueError):
+        pass
+    try:
+        settings['read_timeout'] = float(config.get('artwork-timeout', DEFAULT_READ_TIMEOUT))
+    except (TypeError, ValueError):
+        pass
+    try:
+        settings['rate'] = float(config.get('artwork-requests-per-second', DEFAULT_CDN_RATE))
+    except (TypeError, ValueError):
+        pass
+    return settings
+
+
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def image_http() -> ImageHttpClient:
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = ImageHttpClient(**_load_settings())
+    return _CLIENT
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+
+from core.catalog_client import CatalogError
+
+BATCH_WINDOW = 0.02
+MAX_IDS_PER_REQUEST = 100
+
+
+class LookupBatcher:
+    """Coalesces single-item catalog lookups into multi-id requests.
+
+    Callers keep the one-item interface. A lookup is sent at once when nothing
+    of its type is in flight; ids requested while a request is on the wire
+    queue behind it and share one `?ids=` request, sent when it returns or
+    after BATCH_WINDOW at the latest, split into API-sized chunks. Every
+    caller gets back a `{'data': [item]}` response as before.
+    """
+
+    def __init__(self, catalog, window: float = BATCH_WINDOW, chunk_size: int = MAX_IDS_PER_REQUEST):
+        self.catalog = catalog
+        self.window = window
+        self.chunk_size = max(1, int(chunk_size))
+        self._pending = {}
+        self._flush_handles = {}
+        self._inflight = {}
+        self._active = {}
+        self.requests = 0
+        self.lookups = 0
+
+    async def lookup(self, item_type_plural: str, item_id: str) -> dict:
+        loop = asyncio.get_running_loop()
+        key = (self.catalog.storefront, item_type_plural)
+        self.lookups += 1
+        future = self._inflight.get((key, item_id))
+        if future is None:
+            future = loop.create_future()
+            self._inflight[(key, item_id)] = future
+            future.add_done_callback(lambda _f, k=(key, item_id): self._inflight.pop(k, None))
+            pending = self._pending.setdefault(key, {})
+            pending[item_id] = future
+            if len(pending) >= self.chunk_size or not self._active.get(key):
+                self._flush(key)
+            elif key not in self._flush_handles:
+                self._flush_handles[key] = loop.call_later(self.window, self._flush, key)
+        # Shielded so one cancelled caller does not fail the same id for the others.
+        return {'data': [await asyncio.shield(future)]}
+
+    def _flush(self, key):
+        handle = self._flush_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        pending = self._pending.pop(key, None)
+        if not pending:
+            return
+        items = list(pending.items())
+        self._active[key] = self._active.get(key, 0) + (len(items) + self.chunk_size - 1) // self.chunk_size
+        for start in range(0, len(items), self.chunk_size):
+            asyncio.ensure_future(self._fetch_chunk(key, dict(items[start:start + self.chunk_size])))
+
+    async def _fetch_chunk(self, key, futures: dict):
+        storefront, item_type_plural = key
+        self.requests += 1
+        try:
+            if len(futures) == 1:
+                response = await self.catalog.lookup(item_type_plural, next(iter(futures)))
+            else:
+                response = await self.catalog.lookup_many(item_type_plural, list(futures))
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._active[key] -= 1
+            if not self._active[key]:
+                del self._active[key]
+            # Whatever queued behind this request goes out now rather than at the window.
+            if self._pending.get(key):
+                self._flush(key)
+
+        by_id = {item.get('id'): item for item in response.get('data', []) if isinstance(item, dict)}
+        for item_id, future in futures.items():
+            if future.done():
+                continue
+            if item_id in by_id:
+                future.set_result(by_id[item_id])
+            else:
+                future.set_exception(CatalogError(f"{item_type_plural}/{item_id} not found in {storefront} catalog", 404))
+        if len(futures) > 1:
+            logging.debug(f"Batched {len(futures)} {item_type_plural} lookups into one request")
@@ -0,0 +1,352 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import yaml
+
+INTERACTIVE = 0
+BACKGROUND = 1
+
+DEFAULT_RATE = 20.0
+DEFAULT_BURST = 20
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MIN_CONCURRENCY = 2
+DEFAULT_LATENCY_TARGET = 3.0
+
+DECREASE_FACTOR = 0.5
+DECREASE_COOLDOWN = 1.0
+DEFAULT_THROTTLE_PAUSE = 2.0
+MAX_THROTTLE_PAUSE = 120.0
+# Slots background work may never take, so a search can start while a batch is running.
+INTERACTIVE_RESERVE = 1
+# Waiters re-check the bucket at least this often; releases wake them sooner.
+POLL_INTERVAL = 0.25
+
+
+class RequestAbandoned(Exception):
+    """The caller gave up while its request was still queued for a slot."""
+
+
+def parse_retry_after(value) -> float | None:
+    """Retry-After as seconds from now; accepts delta-seconds or an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class _Waiter:
+    __slots__ = ('priority', 'granted', 'abandoned', '_event', '_loop')
+
+    def __init__(self, priority: int, loop=None):
+        self.priority = priority
+        self.granted = False
+        self.abandoned = False
+        self._loop = loop
+        self._event = asyncio.Event() if loop is not None else threading.Event()
+
+    def notify(self):
+        if self._loop is None:
+            self._event.set()
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._event.set)
+            except RuntimeError:
+                # The waiting loop has been closed; nobody is left to wake.
+                pass
+
+
+class Permit:
+    """One admitted request; record() the response so the limiter can adapt."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.status = None
+        self.latency = None
+        self.retry_after = None
+
+    def record(self, status: int, headers=None):
+        self.status = status
+        self.latency = time.monotonic() - self.started
+        if headers is not None:
+            self.retry_after = parse_retry_after(headers.get('Retry-After'))
+
+
+class HostLimiter:
+    """Token bucket plus an AIMD concurrency window for one host.
+
+    Requests are admitted in priority order while both a token and a slot are
+    free. Successful fast responses grow the window by roughly one slot per
+    window's worth of requests; 429s, 5xx, transport errors and slow responses
+    halve it (at most once per DECREASE_COOLDOWN). A 429 or Retry-After pauses
+    the whole host until the server says it is ready again.
+    """
+
+    def __init__(self, host: str, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 min_concurrency: int = DEFAULT_MIN_CONCURRENCY,
+                 latency_target: float = DEFAULT_LATENCY_TARGET):
+        self.host = host
+        self.rate = max(0.1, float(rate))
+        self.burst = max(1, int(burst))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.min_concurrency = max(1, min(int(min_concurrency), self.max_concurrency))
+        self.latency_target = latency_target
+        self.limit = float(max(self.min_concurrency, self.max_concurrency // 2))
+        self.in_flight = 0
+        self.throttled = 0
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._waiters = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    # --- Admission ---
+
+    def _slots_for(self, priority: int) -> int:
+        slots = max(1, int(self.limit))
+        if priority > INTERACTIVE and slots > INTERACTIVE_RESERVE:
+            slots -= INTERACTIVE_RESERVE
+        return slots
+
+    def _dispatch(self, now: float):
+        """Admit waiters from the head of the queue; returns (admitted, seconds until retry)."""
+        admitted = []
+        wait = None
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        while self._waiters:
+            _, _, waiter = self._waiters[0]
+            if waiter.abandoned:
+                heapq.heappop(self._waiters)
+                continue
+            if now < self._paused_until:
+                wait = self._paused_until - now
+                break
+            if self.in_flight >= self._slots_for(waiter.priority):
+                break
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                break
+            heapq.heappop(self._waiters)
+            self._tokens -= 1
+            self.in_flight += 1
+            waiter.granted = True
+            admitted.append(waiter)
+        return admitted, wait
+
+    def _enqueue(self, waiter: _Waiter):
+        with self._lock:
+            heapq.heappush(self._waiters, (waiter.priority, next(self._seq), waiter))
+            admitted, wait = self._dispatch(time.monotonic())
+        for other in admitted:
+            other.notify()
+        return wait
+
+    def _poll(self, waiter: _Waiter):
+        with self._lock:
+            if waiter.granted:
+                return True, None
+            admitted, wait = self._dispatch(time.monotonic())
+        for other in admitted:
+            other.notify()
+        return waiter.granted, wait
+
+    def _abandon(self, waiter: _Waiter):
+        with self._lock:
+            if waiter.granted:
+                self.in_flight -= 1
+            waiter.abandoned = True
+            admitted, _ = self._dispatch(time.monotonic())
+        for other in admitted:
+            other.notify()
+
+    def acquire(self, priority: int = INTERACTIVE, timeout: float | None = None, should_abort=None):
+        """Block the calling thread until a request to this host may start.
+
+        should_abort() is checked while queued; once it turns true the waiter
+        leaves the queue and RequestAbandoned is raised.
+        """
+        waiter = _Waiter(priority)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        wait = self._enqueue(waiter)
+        while not waiter.granted:
+            if should_abort is not None and should_abort():
+                self._abandon(waiter)
+                raise RequestAbandoned(f"Request to {self.host} abandoned while queued")
+            pause = POLL_INTERVAL if wait is None else min(wait, POLL_INTERVAL)
+            if deadline is not None:
+                pause = min(pause, deadline - time.monotonic())
+                if pause <= 0:
+                    self._abandon(waiter)
+                    raise TimeoutError(f"Timed out waiting for a request slot on {self.host}")
+            waiter._event.wait(pause)
+            waiter._event.clear()
+            granted, wait = self._poll(waiter)
+            if granted:
+                break
+
+    async def acquire_async(self, priority: int = INTERACTIVE):
+        """Wait on the running loop until a request to this host may start."""
+        waiter = _Waiter(priority, asyncio.get_running_loop())
+        wait = self._enqueue(waiter)
+        try:
+            while not waiter.granted:
+                pause = POLL_INTERVAL if wait is None else min(wait, POLL_INTERVAL)
+                try:
+                    await asyncio.wait_for(waiter._event.wait(), pause)
+                except asyncio.TimeoutError:
+                    pass
+                waiter._event.clear()
+                granted, wait = self._poll(waiter)
+                if granted:
+                    break
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    # --- Feedback ---
+
+    def release(self, permit: Permit | None = None, failed: bool = False):
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if permit is not None or failed:
+                self._adapt(now, permit, failed)
+            admitted, _ = self._dispatch(now)
+        for waiter in admitted:
+            waiter.notify()
+
+    def _adapt(self, now: float, permit: Permit | None, failed: bool):
+        status = permit.status if permit is not None else None
+        retry_after = permit.retry_after if permit is not None else None
+        if status == 429 or (retry_after is not None and status is not None and status >= 500):
+            self.throttled += 1
+            pause = min(MAX_THROTTLE_PAUSE, retry_after if retry_after is not None else DEFAULT_THROTTLE_PAUSE)
+            if now + pause > self._paused_until:
+                self._paused_until = now + pause
+                logging.warning(f"{self.host} is throttling requests (HTTP {status}); pausing for {pause:.1f}s")
+            self._tokens = 0.0
+
+        congested = failed or (status is not None and (status == 429 or status >= 500))
+        if not congested and permit is not None and permit.latency is not None:
+            congested = permit.latency > self.latency_target
+        if congested:
+            if now - self._last_decrease >= DECREASE_COOLDOWN and self.limit > self.min_concurrency:
+                self.limit = max(float(self.min_concurrency), self.limit * DECREASE_FACTOR)
+                self._last_decrease = now
+                logging.info(f"{self.host}: request window reduced to {int(self.limit)}")
+        elif status is not None and status < 400:
+            self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'limit': int(self.limit), 'in_flight': self.in_flight, 'queued': len(self._waiters),
+                'throttled': self.throttled, 'paused_for': max(0.0, self._paused_until - time.monotonic()),
+            }
+
+
+class RateLimiter:
+    """Per-host limiters shared by every client that talks to Apple."""
+
+    def __init__(self, **host_settings):
+        self._host_settings = host_settings
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def for_host(self, host: str) -> HostLimiter:
+        host = (host or '').lower()
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            with self._lock:
+                limiter = self._hosts.get(host)
+                if limiter is None:
+                    limiter = self._hosts[host] = HostLimiter(host, **self._host_settings)
+        return limiter
+
+    def for_url(self, url: str) -> HostLimiter:
+        return self.for_host(urlsplit(url).hostname or '')
+
+    @contextmanager
+    def request(self, url: str, priority: int = INTERACTIVE, timeout: float | None = None, should_abort=None):
+        limiter = self.for_url(url)
+        limiter.acquire(priority, timeout, should_abort)
+        permit = Permit()
+        failed = False
+        try:
+            yield permit
+        except Exception:
+            failed = permit.status is None
+            raise
+        finally:
+            limiter.release(permit, failed)
+
+    @asynccontextmanager
+    async def request_async(self, url: str, priority: int = INTERACTIVE):
+        limiter = self.for_url(url)
+        await limiter.acquire_async(priority)
+        permit = Permit()
+        failed = False
+        try:
+            yield permit
+        except Exception:
+            # Cancellation is not an Exception, so it never counts against the host.
+            failed = permit.status is None
+            raise
+        finally:
+            limiter.release(permit, failed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {host: limiter.stats() for host, limiter in hosts.items()}
+
+
+def _load_settings() -> dict:
+    try:
+        with open('config.yaml', 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        config = {}
+    except Exception as e:
+        logging.warning(f"Could not read rate limit settings from config.yaml: {e}")
+        config = {}
+    settings = {}
+    try:
+        settings['rate'] = float(config.get('apple-requests-per-second', DEFAULT_RATE))
+        settings['burst'] = max(1, int(settings['rate']))
+    except (TypeError, ValueError):
+        pass
+    try:
+        settings['max_concurrency'] = int(config.get('apple-max-concurrency', DEFAULT_MAX_CONCURRENCY))
+    except (TypeError, ValueError):
+        pass
+    return settings
+
+
+_LIMITER = None
+_LIMITER_LOCK = threading.Lock()
+
+
+def rate_limiter() -> RateLimiter:
+    global _LIMITER
+    if _LIMITER is None:
+        with _LIMITER_LOCK:
+            if _LIMITER is None:
+                _LIMITER = RateLimiter(**_load_settings())
+    return _LIMITER
@@ -0,0 +1,175 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import yaml
+
+DEFAULT_TTL = 600.0
+DEFAULT_MAX_ENTRIES = 256
+
+CACHE_FILENAME = 'search_responses.json'
+
+# Manifest probes describe the encodes behind a track, which practically never change.
+QUALITY_CACHE_TTL = 30 * 24 * 3600.0
+QUALITY_CACHE_MAX_ENTRIES = 20000
+QUALITY_CACHE_FILENAME = 'track_qualities.json'
+
+
+def search_key(storefront: str, params: dict) -> tuple:
+    """Cache key for a catalog search: (storefront, term, types, limit, offset, include)."""
+    term = ' '.join(str(params.get('term', '')).lower().split())
+    return (
+        (storefront or '').lower(), term, params.get('types', ''),
+        int(params.get('limit', 0)), int(params.get('offset', 0)), params.get('include', ''),
+    )
+
+
+def quality_key(storefront: str, track_id: str) -> tuple:
+    """Cache key for a track's manifest quality probe."""
+    return ((storefront or '').lower(), str(track_id))
+
+
+class ResponseCache:
+    """TTL + LRU cache for decoded catalog responses, optionally persisted as JSON.
+
+    Entries carry a wall-clock expiry so a persisted cache is still honoured
+    (and still expires) after a restart.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 persist_path: str | None = None):
+        self.ttl = ttl
+        self.max_entries = max(1, int(max_entries))
+        self.persist_path = persist_path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if persist_path:
+            self._load()
+
+    def get(self, key: tuple):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, value = entry
+            if expires <= now:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + self.ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, storefront: str | None = None):
+        """Drop everything, or only the entries for one storefront."""
+        with self._lock:
+            if storefront is None:
+                self._entries.clear()
+                return
+            storefront = storefront.lower()
+            for key in [k for k in self._entries if k[0] == storefront]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+    # --- Persistence ---
+
+    def _load(self):
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logging.warning(f"Search cache: could not read {self.persist_path}: {e}")
+            return
+        now = time.time()
+        with self._lock:
+            for key, expires, value in raw.get('entries', []):
+                if expires > now:
+                    self._entries[tuple(key)] = (expires, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def save(self):
+        if not self.persist_path:
+            return
+        now = time.time()
+        with self._lock:
+            entries = [[list(key), expires, value] for key, (expires, value) in self._entries.items() if expires > now]
+        tmp_path = self.persist_path + '.part'
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.persist_path)), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'entries': entries}, f)
+            os.replace(tmp_path, self.persist_path)
+        except OSError as e:
+            logging.warning(f"Search cache: could not write {self.persist_path}: {e}")
+
+
+def _default_cache_dir() -> str:
+    try:
+        from PyQt6.QtCore import QStandardPaths
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    except ImportError:
+        base = ''
+    return base or os.path.join(os.path.expanduser('~'), '.cache', 'apmyx-gui')
+
+
+def _read_config() -> dict:
+    try:
+        with open('config.yaml', 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning(f"Could not read cache settings from config.yaml: {e}")
+        return {}
+
+
+def load_response_cache() -> ResponseCache:
+    """Build the controller's search cache from config.yaml settings."""
+    config = _read_config()
+    settings = {}
+    try:
+        settings['ttl'] = float(config.get('search-cache-ttl', DEFAULT_TTL))
+    except (TypeError, ValueError):
+        pass
+    try:
+        settings['max_entries'] = int(config.get('search-cache-size', DEFAULT_MAX_ENTRIES))
+    except (TypeError, ValueError):
+        pass
+    if config.get('search-cache-persist', False):
+        settings['persist_path'] = os.path.join(_default_cache_dir(), CACHE_FILENAME)
+    return ResponseCache(**settings)
+
+
+def load_quality_cache() -> ResponseCache:
+    """Build the persistent manifest quality-probe cache from config.yaml settings."""
+    config = _read_config()
+    settings = {'ttl': QUALITY_CACHE_TTL, 'max_entries': QUALITY_CACHE_MAX_ENTRIES}
+    try:
+        settings['ttl'] = float(config.get('quality-cache-ttl', QUALITY_CACHE_TTL))
+    except (TypeError, ValueError):
+        pass
+    if config.get('quality-cache-persist', True):
+        settings['persist_path'] = os.path.join(_default_cache_dir(), QUALITY_CACHE_FILENAME)
+    return ResponseCache(**settings)
@@ -0,0 +1,35 @@
+import logging
+import threading
+import time
+
+_launch = time.perf_counter()
+_marks = {}
+_lock = threading.Lock()
+
+
+def mark_launch():
+    """Reset the launch reference point; call as early as possible in main."""
+    global _launch
+    with _lock:
+        _launch = time.perf_counter()
+        _marks.clear()
+
+
+def since_launch() -> float:
+    return time.perf_counter() - _launch
+
+
+def mark(name: str) -> float | None:
+    """Record the first occurrence of name and log its offset from launch; later calls are ignored."""
+    with _lock:
+        if name in _marks:
+            return None
+        elapsed = time.perf_counter() - _launch
+        _marks[name] = elapsed
+    logging.info(f"[startup] {name}: {elapsed * 1000:.0f} ms after launch")
+    return elapsed
+
+
+def marks() -> dict:
+    with _lock:
+        return dict(_marks)
@@ -0,0 +1,72 @@
+import base64
+import json
+import logging
+import os
+import sys
+import time
+
+TOKEN_FILENAME = 'developer_token.json'
+
+
+def jwt_expiry(token: str) -> float | None:
+    """The exp claim of a JWT as a Unix timestamp, or None if it cannot be read."""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _default_config_dir() -> str:
+    try:
+        from PyQt6.QtCore import QStandardPaths
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppConfigLocation)
+    except ImportError:
+        base = ''
+    return base or os.path.join(os.path.expanduser('~'), '.config', 'apmyx-gui')
+
+
+class TokenStore:
+    """Developer token persisted next to the app config, readable only by the current user."""
+
+    def __init__(self, path: str | None = None):
+        self.path = path or os.path.join(_default_config_dir(), TOKEN_FILENAME)
+
+    def load(self, min_validity: float = 0.0) -> tuple[str, float] | None:
+        """Return (token, exp) if a stored token stays valid for at least min_validity seconds."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable developer token cache: {e}")
+            return None
+        token = data.get('token')
+        expires = jwt_expiry(token) if token else None
+        if not token or expires is None or expires - time.time() < min_validity:
+            return None
+        return token, expires
+
+    def save(self, token: str):
+        tmp_path = self.path + '.part'
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'token': token, 'exp': jwt_expiry(token), 'saved': time.time()}, f)
+            if sys.platform != 'win32':
+                os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Could not persist developer token: {e}")
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not remove cached developer token: {e}")
@@ -5,9 +5,10 @@ import os
 import traceback
 import atexit
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QSettings
+from PyQt6.QtCore import QSettings, QTimer
 from PyQt6.QtGui import QFontDatabase, QFont, QIcon
 from core.app import AppController
+from core import startup_metrics
 from ui.main_window import MainWindow
 from ui.main_window.dialogs import UpdateDialog 
 
@@ -185,6 +186,7 @@ if __name__ == "__main__":
         sys.stdout.reconfigure(encoding="utf-8", errors="replace")
         sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
+    startup_metrics.mark_launch()
     setup_logging()
     
     app = QApplication(sys.argv)
@@ -219,6 +221,7 @@ if __name__ == "__main__":
 
     window = MainWindow(controller)
     window.show()
+    startup_metrics.mark("window shown")
     
     def handle_update_check(latest, current, url):
         if controller.is_newer_version(latest, current) and latest:
@@ -227,5 +230,7 @@ if __name__ == "__main__":
 
     controller.updatecheckfinished.connect(handle_update_check)
     controller.checkforupdates()
+    # Prewarm starts once the first frame is painted.
+    QTimer.singleShot(0, controller.start_prewarm)
 
     sys.exit(app.exec())
\ No newline at end of file
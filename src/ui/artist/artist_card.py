@@ -5,11 +5,13 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSizePolicy, QApplication
 )
 from PyQt6.QtCore import pyqtSignal, pyqtSlot, QThreadPool, QSize, Qt, QPointF, QEvent, QRectF, QRect
-from PyQt6.QtGui import QPixmap, QMouseEvent, QBitmap, QPainter, QColor, QPen, QFontMetrics, QIcon, QFont
+from PyQt6.QtGui import QPixmap, QMouseEvent, QBitmap, QPainter, QColor, QPen, QFontMetrics, QIcon, QFont, QImage
 
 
-from ..search_widgets import LoadingSpinner, ImageFetcher, MarqueeLabel, round_pixmap
+from ..search_widgets import LoadingSpinner, ImageFetcher, MarqueeLabel
 from ..search_cards import DownloadIconButton, TracklistButton, InfoIconButton, PlayButton
+from core.artwork_urls import resolve_artwork_url
+from ..image_scheduler import image_scheduler
 
 class HoverMask(QLabel):
     def __init__(self, track_text, year_text, parent=None):
@@ -296,21 +298,19 @@ class ArtistAlbumCard(QWidget):
         attrs = self.album_data.get('attributes', {})
         artwork_url = attrs.get('artwork', {}).get('url')
         if artwork_url:
-            formatted_url = artwork_url.replace('{w}', '360').replace('{h}', '360')
-            self.worker = ImageFetcher(formatted_url).auto_cancel_on(self)
+            formatted_url = resolve_artwork_url(artwork_url, self.artwork_label.width(), self.devicePixelRatioF())
+            self.worker = (ImageFetcher(formatted_url)
+                           .rendered(self.artwork_label.size(), self.devicePixelRatioF(), radius=12)
+                           .auto_cancel_on(self))
             self.worker.signals.image_loaded.connect(self._set_artwork)
             self.worker.signals.error.connect(self._on_load_error)
-            self.thread_pool.start(self.worker)
+            image_scheduler().submit(self.worker, self, self.thread_pool)
         else:
             self.artwork_label.setText("No Image")
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
-        scaled_pixmap = pixmap.scaled(self.artwork_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        final_pixmap = round_pixmap(scaled_pixmap, 12)
-        self.artwork_label.setPixmap(final_pixmap)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        self.artwork_label.setPixmap(QPixmap.fromImage(image))
 
     @pyqtSlot(str)
     def _on_load_error(self, error_str: str):
@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import (
     QPushButton, QSizePolicy, QFrame, QTabWidget,
     QGraphicsOpacityEffect, QToolButton, QScroller,
     QScrollerProperties, QListView, QApplication, QStyle,
-    QStyleOptionViewItem, QScrollArea, QGridLayout, QMessageBox
+    QStyleOptionViewItem, QScrollArea, QGridLayout, QMessageBox, QFileDialog
 )
 from PyQt6.QtCore import (
     pyqtSignal, pyqtSlot, QThreadPool, Qt, QTimer,
@@ -15,9 +15,11 @@ import weakref
 import logging
 
 from ..search_widgets import LoadingSpinner
+from ..image_scheduler import image_scheduler
 from .artist_hero_and_header import ArtistHeroWidget, SegmentedTabs
 from .artist_card import ArtistAlbumCard
 from ..view_select import SelectionDropdown
+from ..artwork_downloader_page import ArtworkExportWorker
 
 class ArtistDiscographyPage(QWidget):
     back_requested = pyqtSignal()
@@ -34,6 +36,7 @@ class ArtistDiscographyPage(QWidget):
         
         self.selection_manager = {}
         self._is_downloading_all = False
+        self._export_worker = None
         
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
@@ -160,6 +163,8 @@ class ArtistDiscographyPage(QWidget):
             self._on_scroll_value(sb.value())
 
     def _on_scroll_value(self, v: int):
+        if view := self._get_current_view():
+            image_scheduler().reprioritize(view)
         target_height = max(0, self.hero.expanded_height - v)
         
         if self._hero_anim.state() == QPropertyAnimation.State.Running:
@@ -294,6 +299,13 @@ class ArtistDiscographyPage(QWidget):
         self.bottom_deselect_btn.setStyleSheet("padding: 6px 12px;")
         self.bottom_deselect_btn.clicked.connect(self._deselect_current)
 
+        self.export_covers_btn = QPushButton("Export Covers")
+        self.export_covers_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.export_covers_btn.setToolTip("Save the full-size cover of every release into a folder")
+        self.export_covers_btn.setStyleSheet("padding: 6px 12px;")
+        self.export_covers_btn.clicked.connect(self._on_export_covers_clicked)
+
+        lay.addWidget(self.export_covers_btn)
         lay.addStretch()
         lay.addWidget(self.selection_controls_widget)
         lay.addWidget(self.bottom_select_all_btn)
@@ -317,6 +329,57 @@ class ArtistDiscographyPage(QWidget):
                 self.download_selected_button.setEnabled(False)
                 self.download_requested.emit(selected_items)
 
+    def _on_export_covers_clicked(self):
+        if self._export_worker is not None:
+            self._export_worker.cancel()
+            self.export_covers_btn.setEnabled(False)
+            self.export_covers_btn.setText("Cancelling...")
+            return
+
+        items = []
+        for category in self.categories:
+            if category == "Music Videos":
+                continue
+            grid_layout = self.grid_layouts.get(category.lower().replace(" ", "_"))
+            if grid_layout:
+                for i in range(grid_layout.count()):
+                    item = grid_layout.itemAt(i)
+                    if item and (widget := item.widget()) and isinstance(widget, ArtistAlbumCard):
+                        items.append(widget.result_data)
+        if not items:
+            return
+
+        directory = QFileDialog.getExistingDirectory(self, "Export Covers To...")
+        if not directory:
+            return
+
+        self._export_worker = ArtworkExportWorker(items, directory)
+        self._export_worker.signals.progress.connect(self._on_export_progress)
+        self._export_worker.signals.finished.connect(self._on_export_finished)
+        self.export_covers_btn.setText("Cancel Export")
+        QThreadPool.globalInstance().start(self._export_worker)
+
+    @pyqtSlot(int, int, float)
+    def _on_export_progress(self, done, total, bytes_per_sec):
+        if sip.isdeleted(self):
+            return
+        self.export_covers_btn.setText(f"Cancel Export ({done}/{total})")
+        main_window = self.window()
+        if main_window and hasattr(main_window, 'statusBar'):
+            main_window.statusBar().showMessage(f"Exporting covers: {done}/{total} ({bytes_per_sec / 1024 / 1024:.1f} MB/s)", 0)
+
+    @pyqtSlot(object)
+    def _on_export_finished(self, summary):
+        if sip.isdeleted(self):
+            return
+        self._export_worker = None
+        self.export_covers_btn.setText("Export Covers")
+        self.export_covers_btn.setEnabled(True)
+        main_window = self.window()
+        if main_window and hasattr(main_window, 'statusBar'):
+            prefix = "Export cancelled" if summary.cancelled else "Export finished"
+            main_window.statusBar().showMessage(f"{prefix}: {summary.describe()}", 8000)
+
     def _create_tab(self, title):
         category = title.lower().replace(" ", "_")
         tab = QWidget()
@@ -5,10 +5,11 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (pyqtSignal, pyqtSlot, QThreadPool, Qt, QTimer, QPropertyAnimation, QEasingCurve, 
                           QRect, QRectF, pyqtProperty)
-from PyQt6.QtGui import QPixmap, QBitmap, QPainter, QColor, QFont, QPainterPath
+from PyQt6.QtGui import QPixmap, QBitmap, QPainter, QColor, QFont, QPainterPath, QImage
 import logging
 from ..search_widgets import ImageFetcher, ClickableLabel, CustomCheckBox
 from ..search_cards import SettingsButton
+from core.artwork_urls import resolve_artwork_url
 
 class _Thumb(QWidget):
     def __init__(self, color: QColor, parent=None):
@@ -339,16 +340,15 @@ class ArtistHeroWidget(QWidget):
     def _fetch_image(self):
         artist_url = self.artist_data.get('artworkUrl', '')
         if artist_url:
-            bg_url = artist_url.replace('{w}', '800').replace('{h}', '800')
+            bg_url = resolve_artwork_url(artist_url, 800)
             artist_worker = ImageFetcher(bg_url).auto_cancel_on(self)
             artist_worker.signals.image_loaded.connect(self._set_artist_image)
             self.thread_pool.start(artist_worker)
 
-    @pyqtSlot(bytes)
-    def _set_artist_image(self, image_data):
-        if image_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artist_image(self, image):
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
             
             self.background_pixmap = pixmap.copy()
             
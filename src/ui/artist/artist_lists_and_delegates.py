@@ -11,6 +11,8 @@ from PyQt6.QtGui import QPixmap, QBitmap, QPainter, QColor, QFontMetrics, QPen,
 import logging
 from ..search_widgets import LoadingSpinner, ImageFetcher, ClickableLabel
 from ..search_cards import TracklistButton, round_pixmap, resource_path, render_svg_tinted
+from core.artwork_urls import resolve_artwork_url
+from ..pixmap_cache import pixmap_cache
 from PyQt6 import sip
 
 class DiscographyModel(QAbstractListModel):
@@ -71,7 +73,7 @@ class DiscographyDelegate(QStyledItemDelegate):
     def __init__(self, image_cache, parent=None):
         super().__init__(parent)
         self.image_cache = image_cache
-        self._pm_cache = {}
+        self._pm_cache = pixmap_cache()
         self.btn_size = 26
         
         # --- Pre-render all button states to pixmaps for performance ---
@@ -102,9 +104,10 @@ class DiscographyDelegate(QStyledItemDelegate):
         self.details_font.setWeight(QFont.Weight.Medium)
 
     def _cached_scaled_rounded(self, url: str, size: QSize, radius: int) -> QPixmap | None:
-        key = (url, size.width(), size.height(), radius)
-        if key in self._pm_cache:
-            return self._pm_cache[key]
+        style = ('list', radius)
+        cached = self._pm_cache.get(url, style, size)
+        if cached is not None:
+            return cached
         
         base = self.image_cache.get(url)
         if not base:
@@ -112,7 +115,7 @@ class DiscographyDelegate(QStyledItemDelegate):
         
         scaled = base.scaled(size, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
         rounded = round_pixmap(scaled, radius)
-        self._pm_cache[key] = rounded
+        self._pm_cache.put(url, style, size, rounded)
         return rounded
 
     def _create_button_pixmap(self, bg_color: QColor, icon_type: str) -> QPixmap:
@@ -192,7 +195,7 @@ class DiscographyDelegate(QStyledItemDelegate):
         padding = 8
         artwork_size = 56
         artwork_rect = QRect(option.rect.x() + padding, option.rect.y() + (option.rect.height() - artwork_size) // 2, artwork_size, artwork_size)
-        artwork_url = attrs.get('artwork', {}).get('url', '').replace('{w}', '256').replace('{h}', '256')
+        artwork_url = resolve_artwork_url(attrs.get('artwork', {}).get('url', ''), artwork_size, painter.device().devicePixelRatioF())
         
         pixmap = self._cached_scaled_rounded(artwork_url, QSize(artwork_size, artwork_size), 4)
         if pixmap:
@@ -303,7 +306,7 @@ class DiscographyGridDelegate(QStyledItemDelegate):
     def __init__(self, image_cache, parent=None):
         super().__init__(parent)
         self.image_cache = image_cache
-        self._pm_cache = {}
+        self._pm_cache = pixmap_cache()
         self.btn_size = 26
         
         # --- Pre-render all button states to pixmaps for performance ---
@@ -343,9 +346,10 @@ class DiscographyGridDelegate(QStyledItemDelegate):
         self.radius = 12
         
     def _cached_scaled_rounded(self, url: str, size: QSize, radius: int, item_type: str = None) -> QPixmap | None:
-        key = (url, size.width(), size.height(), radius, item_type)
-        if key in self._pm_cache:
-            return self._pm_cache[key]
+        style = ('grid', radius, item_type)
+        cached = self._pm_cache.get(url, style, size)
+        if cached is not None:
+            return cached
         
         base = self.image_cache.get(url)
         if not base:
@@ -379,7 +383,7 @@ class DiscographyGridDelegate(QStyledItemDelegate):
             painter.drawPixmap(0, 0, scaled)
             painter.end()
 
-        self._pm_cache[key] = final_pixmap
+        self._pm_cache.put(url, style, size, final_pixmap)
         return final_pixmap
 
     def _create_button_pixmap(self, bg_color: QColor, icon_type: str) -> QPixmap:
@@ -479,7 +483,7 @@ class DiscographyGridDelegate(QStyledItemDelegate):
         card_rect = option.rect.adjusted(card_m, card_m, -card_m, -card_m)
         
         art_rect = QRect(card_rect.x(), card_rect.y(), self.art_size.width(), self.art_size.height())
-        art_url = attrs.get('artwork', {}).get('url', '').replace('{w}', '256').replace('{h}', '256')
+        art_url = resolve_artwork_url(attrs.get('artwork', {}).get('url', ''), self.art_size.width(), painter.device().devicePixelRatioF())
         
         pm = self._cached_scaled_rounded(art_url, self.art_size, self.radius, item_type)
         if pm:
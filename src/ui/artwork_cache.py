@@ -0,0 +1,215 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit
+
+from PyQt6.QtCore import QStandardPaths
+from PyQt6.QtGui import QImage
+
+MEMORY_BUDGET_BYTES = 128 * 1024 * 1024
+DISK_BUDGET_BYTES = 512 * 1024 * 1024
+
+_MZSTATIC_SHARD = re.compile(r'^is\d+(-ssl)?\.mzstatic\.com$')
+
+
+def normalize_artwork_url(url: str) -> str:
+    url = (url or '').strip()
+    if not url:
+        return ''
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    # Every isN-ssl shard serves the same path, so treat them as one host.
+    if _MZSTATIC_SHARD.match(host):
+        host = 'mzstatic.com'
+    scheme = 'https' if parts.scheme in ('http', 'https', '') else parts.scheme.lower()
+    return urlunsplit((scheme, host, parts.path, parts.query, ''))
+
+
+class ArtworkCache:
+    def __init__(self, cache_dir: str | None = None,
+                 memory_budget: int = MEMORY_BUDGET_BYTES,
+                 disk_budget: int = DISK_BUDGET_BYTES):
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self.cache_dir = cache_dir or self._default_cache_dir()
+
+        self._lock = threading.Lock()
+        self._images = OrderedDict()
+        self._memory_bytes = 0
+
+        self._disk_lock = threading.Lock()
+        self._disk_index = None
+        self._disk_bytes = 0
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def _default_cache_dir():
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        if not base:
+            base = os.path.join(os.path.expanduser('~'), '.cache', 'apmyx-gui')
+        return os.path.join(base, 'artwork')
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    # --- Memory tier ---
+
+    def get_image(self, url: str) -> QImage | None:
+        key = normalize_artwork_url(url)
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.memory_hits += 1
+            return image
+
+    def put_image(self, url: str, image: QImage):
+        key = normalize_artwork_url(url)
+        if not key or image is None or image.isNull():
+            return
+        cost = image.sizeInBytes()
+        # Full-resolution covers would flush the whole tier; leave those to disk.
+        if cost > self.memory_budget // 8:
+            return
+        with self._lock:
+            old = self._images.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old.sizeInBytes()
+            self._images[key] = image
+            self._memory_bytes += cost
+            while self._memory_bytes > self.memory_budget and self._images:
+                _, evicted = self._images.popitem(last=False)
+                self._memory_bytes -= evicted.sizeInBytes()
+
+    # --- Disk tier ---
+
+    def _ensure_disk_index(self):
+        if self._disk_index is not None:
+            return
+        entries = []
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.is_file() or entry.name.endswith('.part'):
+                        continue
+                    st = entry.stat()
+                    entries.append((st.st_mtime, entry.name, st.st_size))
+        except OSError as e:
+            logging.warning(f"Artwork cache: could not scan {self.cache_dir}: {e}")
+        entries.sort()
+        self._disk_index = OrderedDict((name, size) for _, name, size in entries)
+        self._disk_bytes = sum(self._disk_index.values())
+        self._trim_disk()
+
+    def _trim_disk(self):
+        while self._disk_bytes > self.disk_budget and self._disk_index:
+            name, size = self._disk_index.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+
+    def get_bytes(self, url: str) -> bytes | None:
+        key = normalize_artwork_url(url)
+        if not key:
+            return None
+        path = self._disk_path(key)
+        name = os.path.basename(path)
+        with self._disk_lock:
+            self._ensure_disk_index()
+            if name not in self._disk_index:
+                return None
+            self._disk_index.move_to_end(name)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path, None)
+        except OSError:
+            with self._disk_lock:
+                size = self._disk_index.pop(name, None)
+                if size is not None:
+                    self._disk_bytes -= size
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        return data
+
+    def put_bytes(self, url: str, data: bytes):
+        key = normalize_artwork_url(url)
+        if not key or not data or len(data) > self.disk_budget:
+            return
+        path = self._disk_path(key)
+        name = os.path.basename(path)
+        tmp_path = f"{path}.{threading.get_ident()}.part"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Artwork cache: failed to write {name}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._disk_lock:
+            self._ensure_disk_index()
+            old = self._disk_index.pop(name, None)
+            if old is not None:
+                self._disk_bytes -= old
+            self._disk_index[name] = len(data)
+            self._disk_bytes += len(data)
+            self._trim_disk()
+
+    # --- Bookkeeping ---
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def record_coalesced(self):
+        with self._lock:
+            self.coalesced += 1
+
+    def clear_memory(self):
+        with self._lock:
+            self._images.clear()
+            self._memory_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'memory_items': len(self._images),
+                'memory_bytes': self._memory_bytes,
+            }
+        with self._disk_lock:
+            stats['disk_items'] = len(self._disk_index or {})
+            stats['disk_bytes'] = self._disk_bytes
+        return stats
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def artwork_cache() -> ArtworkCache:
+    global _CACHE
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                _CACHE = ArtworkCache()
+    return _CACHE
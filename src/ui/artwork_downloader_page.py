@@ -1,7 +1,7 @@
 import os
 import re
-import requests
 import random
+import threading
 import weakref
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QFrame, QPushButton,
@@ -13,41 +13,30 @@ from PyQt6.QtGui import QPixmap, QPainter, QColor, QCursor, QPen, QImage
 
 from .search_widgets import SearchLineEdit, LoadingSpinner, ImageFetcher, round_pixmap, MarqueeLabel
 from .search_cards import SettingsButton, DownloadIconButton
+from core.artwork_urls import resolve_artwork_url
+from core.artwork_export import stream_to_file, export_artwork_batch, load_export_settings
+from core.image_http import image_http
+from core.rate_limiter import BACKGROUND
+from .image_scheduler import image_scheduler, PRIORITY_VISIBLE
+from .image_analysis import analyze_artwork
 from enum import Enum
 
 class HeroImageWorkerSignals(QObject):
-    finished = pyqtSignal(QPixmap, str)
+    finished = pyqtSignal(str, QImage, object)
 
 class HeroImageWorker(QRunnable):
-    def __init__(self, image_data, size):
+    def __init__(self, url, source_image, size):
         super().__init__()
         self.signals = HeroImageWorkerSignals()
-        self.image_data = image_data
+        self.url = url
+        self.source_image = source_image
         self.size = size
 
     @pyqtSlot()
     def run(self):
-        pixmap = QPixmap()
-        pixmap.loadFromData(self.image_data)
-        
-        image = pixmap.toImage().convertToFormat(QImage.Format.Format_RGB32)
-        corner_rect = image.rect().adjusted(0, 0, -image.width() * 3 // 4, -image.height() * 3 // 4)
-        total_lum = 0
-        if corner_rect.width() > 0 and corner_rect.height() > 0:
-            for y in range(corner_rect.top(), corner_rect.bottom()):
-                for x in range(corner_rect.left(), corner_rect.right()):
-                    total_lum += QColor(image.pixel(x, y)).lightness()
-            avg_lum = total_lum / (corner_rect.width() * corner_rect.height())
-        else:
-            avg_lum = 128
-
-        if avg_lum > 160:
-            menu_style = "border: none; border-radius: 8px; QToolTip { color: #222; }"
-        else:
-            menu_style = "border: none; border-radius: 8px; QToolTip { color: #eee; }"
-
-        scaled = pixmap.scaled(self.size, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
-        self.signals.finished.emit(scaled, menu_style)
+        analysis = analyze_artwork(self.url, self.source_image)
+        scaled = self.source_image.scaled(self.size, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
+        self.signals.finished.emit(self.url, scaled, analysis)
 
 class ImageViewer(QDialog):
     download_requested = pyqtSignal(str, str)
@@ -134,11 +123,10 @@ class ImageViewer(QDialog):
         
         self.download_requested.emit(high_res_url, filename)
 
-    @pyqtSlot(bytes)
-    def _on_image_loaded(self, image_data):
+    @pyqtSlot(QImage)
+    def _on_image_loaded(self, image):
         self.spinner.stop()
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
+        pixmap = QPixmap.fromImage(image)
         
         scaled_pixmap = pixmap.scaled(
             self.image_label.size(), 
@@ -177,16 +165,40 @@ class ArtworkDownloadWorker(QRunnable):
     @pyqtSlot()
     def run(self):
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-            with requests.get(self.url, stream=True, timeout=30, headers=headers) as r:
-                r.raise_for_status()
-                with open(self.save_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            stream_to_file(image_http(), self.url, self.save_path)
             self.signals.finished.emit(f"Saved to {os.path.basename(self.save_path)}")
         except Exception as e:
             self.signals.error.emit(str(e))
 
+class ArtworkExportWorkerSignals(QObject):
+    progress = pyqtSignal(int, int, float)
+    finished = pyqtSignal(object)
+
+class ArtworkExportWorker(QRunnable):
+    """Exports full-size covers for a list of items into one folder."""
+
+    def __init__(self, items, directory):
+        super().__init__()
+        self.items = list(items)
+        self.directory = directory
+        self.signals = ArtworkExportWorkerSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @pyqtSlot()
+    def run(self):
+        settings = load_export_settings()
+        summary = export_artwork_batch(
+            image_http().with_priority(BACKGROUND), self.items, self.directory,
+            width=settings['width'], height=settings['height'],
+            concurrency=settings['concurrency'],
+            progress=lambda s: self.signals.progress.emit(s.done, s.total, s.throughput),
+            should_abort=self._cancel_event.is_set,
+        )
+        self.signals.finished.emit(summary)
+
 class ArtworkDisplayCard(QWidget):
     download_requested = pyqtSignal(object, str, str)
     artwork_clicked = pyqtSignal(dict)
@@ -328,20 +340,19 @@ class ArtworkDisplayCard(QWidget):
         self.artwork_label.setText("")
         self.spinner.start()
 
-        preview_url = self.artwork_data.get('artworkUrl', '').replace('5000x5000', '400x400')
+        preview_url = resolve_artwork_url(self.artwork_data.get('artworkUrl', ''), self.artwork_label.width(), self.devicePixelRatioF())
         if preview_url:
             worker = ImageFetcher(preview_url).auto_cancel_on(self)
             worker.signals.image_loaded.connect(self._set_artwork)
             worker.signals.error.connect(self._on_load_error)
-            self.image_pool.start(worker)
+            image_scheduler().submit(worker, self, self.image_pool)
         else:
             self._on_load_error("No artwork URL found")
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
         self.spinner.stop()
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
+        pixmap = QPixmap.fromImage(image)
         scaled = pixmap.scaled(self.artwork_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
         self.artwork_label.setPixmap(round_pixmap(scaled, 8))
 
@@ -371,12 +382,15 @@ class ArtworkDownloaderPage(QWidget):
         
         self.image_thread_pool = QThreadPool()
         self.image_thread_pool.setMaxThreadCount(6)
+        self._hero_url = None
         
         self.download_thread_pool = QThreadPool()
         self.download_thread_pool.setMaxThreadCount(2)
         
         self.results_widgets = []
         self.items_to_add = []
+        self.current_results = []
+        self._export_worker = None
         
         self.current_query = None
         self.current_offset = 0
@@ -432,10 +446,25 @@ class ArtworkDownloaderPage(QWidget):
         content_layout = QVBoxLayout(self.content_frame)
         content_layout.setContentsMargins(20, 15, 20, 20)
         
+        search_row = QHBoxLayout()
+        search_row.setSpacing(10)
         self.search_bar = SearchLineEdit()
         self.search_bar.setPlaceholderText("Search by Album or Artist")
         self.search_bar.returnPressed.connect(self.perform_search)
-        content_layout.addWidget(self.search_bar)
+        search_row.addWidget(self.search_bar, 1)
+
+        self.export_all_button = QPushButton("Export All")
+        self.export_all_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.export_all_button.setToolTip("Save the full-size cover of every result into a folder")
+        self.export_all_button.setStyleSheet("""
+            QPushButton { background-color: #d60117; color: white; border: none; border-radius: 4px; font-weight: bold; padding: 6px 14px; }
+            QPushButton:hover { background-color: #e62237; }
+            QPushButton:disabled { background-color: #444; color: #888; }
+        """)
+        self.export_all_button.setEnabled(False)
+        self.export_all_button.clicked.connect(self._on_export_all_clicked)
+        search_row.addWidget(self.export_all_button)
+        content_layout.addLayout(search_row)
 
         self.main_stack = QStackedWidget()
         content_layout.addWidget(self.main_stack, 1)
@@ -534,28 +563,35 @@ class ArtworkDownloaderPage(QWidget):
 
     def _update_hero_background(self, results):
         if not results:
+            self._hero_url = None
             self.hero_bg.setPixmap(QPixmap())
             return
 
         first_item = random.choice(results)
-        url = first_item.get('artworkUrl', '').replace('5000x5000', '200x200')
+        url = resolve_artwork_url(first_item.get('artworkUrl', ''), 200)
         if not url:
             return
 
+        self._hero_url = url
         worker = ImageFetcher(url)
-        worker.signals.image_loaded.connect(self._start_hero_processing)
-        self.image_thread_pool.start(worker)
+        worker.signals.image_loaded.connect(lambda image, u=url: self._start_hero_processing(u, image))
+        self.image_thread_pool.start(worker, PRIORITY_VISIBLE)
 
-    @pyqtSlot(bytes)
-    def _start_hero_processing(self, image_data):
-        worker = HeroImageWorker(image_data, self.hero.size())
+    def _start_hero_processing(self, url, image):
+        if url != self._hero_url:
+            return
+        worker = HeroImageWorker(url, image, self.hero.size())
         worker.signals.finished.connect(self._on_hero_bg_loaded)
         QThreadPool.globalInstance().start(worker)
 
-    @pyqtSlot(QPixmap, str)
-    def _on_hero_bg_loaded(self, pixmap, menu_style):
-        self.hero_bg.setPixmap(pixmap)
-        self.menu_btn.setStyleSheet(menu_style)
+    @pyqtSlot(str, QImage, object)
+    def _on_hero_bg_loaded(self, url, image, analysis):
+        if url != self._hero_url:
+            return
+        self.hero_bg.setPixmap(QPixmap.fromImage(image))
+        self.hero_bg.setStyleSheet(f"background-color: {analysis.dominant.name()};")
+        tooltip_color = "#222" if analysis.is_light else "#eee"
+        self.menu_btn.setStyleSheet(f"border: none; border-radius: 8px; QToolTip {{ color: {tooltip_color}; }}")
 
     def _reflow_grid(self):
         num_columns = max(1, self.scroll_area.width() // 240)
@@ -588,6 +624,8 @@ class ArtworkDownloaderPage(QWidget):
         
         self.search_bar.start_loading()
         self._clear_results()
+        self.current_results = []
+        self._update_export_button()
         self.controller.search_for_artwork(query)
 
     @pyqtSlot(list)
@@ -603,11 +641,13 @@ class ArtworkDownloaderPage(QWidget):
             self.no_more_results = True
         else:
             self.current_offset = len(results)
+            self.current_results = list(results)
             self._start_adding_cards(results)
             if len(results) < 50:
                 self.no_more_results = True
 
         self.is_loading_more = False
+        self._update_export_button()
 
     @pyqtSlot(list)
     def on_append_search_results(self, new_results):
@@ -618,13 +658,16 @@ class ArtworkDownloaderPage(QWidget):
             self.no_more_results = True
         else:
             self.current_offset += len(new_results)
+            self.current_results.extend(new_results)
             self._start_adding_cards(new_results)
             if len(new_results) < 50:
                 self.no_more_results = True
         
         self.is_loading_more = False
+        self._update_export_button()
 
     def on_scroll(self, value):
+        image_scheduler().reprioritize(self.scroll_area)
         if self.is_loading_more or self.no_more_results or not self.current_query:
             return
 
@@ -668,6 +711,8 @@ class ArtworkDownloaderPage(QWidget):
         
         if self.items_to_add:
             QTimer.singleShot(30, self._process_card_chunk)
+        else:
+            image_scheduler().reprioritize(self.scroll_area)
         
         self._manage_memory_if_needed()
 
@@ -732,5 +777,41 @@ class ArtworkDownloaderPage(QWidget):
             card.set_download_state(False)
         self.statusBar().showMessage(f"Download failed: {error_message}", 5000)
 
+    def _update_export_button(self):
+        if self._export_worker is not None:
+            return
+        self.export_all_button.setText(f"Export All ({len(self.current_results)})" if self.current_results else "Export All")
+        self.export_all_button.setEnabled(bool(self.current_results))
+
+    def _on_export_all_clicked(self):
+        if self._export_worker is not None:
+            self._export_worker.cancel()
+            self.export_all_button.setEnabled(False)
+            self.export_all_button.setText("Cancelling...")
+            return
+        if not self.current_results:
+            return
+        directory = QFileDialog.getExistingDirectory(self, "Export Covers To...")
+        if not directory:
+            return
+
+        self._export_worker = ArtworkExportWorker(self.current_results, directory)
+        self._export_worker.signals.progress.connect(self._on_export_progress)
+        self._export_worker.signals.finished.connect(self._on_export_finished)
+        self.export_all_button.setText("Cancel Export")
+        self.download_thread_pool.start(self._export_worker)
+        self.statusBar().showMessage(f"Exporting {len(self.current_results)} covers to {directory}...", 0)
+
+    @pyqtSlot(int, int, float)
+    def _on_export_progress(self, done, total, bytes_per_sec):
+        self.statusBar().showMessage(f"Exporting covers: {done}/{total} ({bytes_per_sec / 1024 / 1024:.1f} MB/s)", 0)
+
+    @pyqtSlot(object)
+    def _on_export_finished(self, summary):
+        self._export_worker = None
+        prefix = "Export cancelled" if summary.cancelled else "Export finished"
+        self.statusBar().showMessage(f"{prefix}: {summary.describe()}", 8000)
+        self._update_export_button()
+
     def statusBar(self):
         return self.window().statusBar()
\ No newline at end of file
@@ -2,11 +2,12 @@ from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel, QProgres
                              QPushButton, QMessageBox, QDialog, QTableWidget,
                              QTableWidgetItem, QHeaderView, QDialogButtonBox, QPlainTextEdit)
 from PyQt6.QtCore import (Qt, pyqtSlot, QThreadPool, pyqtSignal, QTimer, QPropertyAnimation,
-                          QEasingCurve, pyqtProperty, QBuffer, QIODevice, QRectF)
-from PyQt6.QtGui import (QPixmap, QIcon, QFontMetrics, QImageReader, QColorSpace, QPainter,
+                          QEasingCurve, pyqtProperty, QRectF)
+from PyQt6.QtGui import (QPixmap, QIcon, QFontMetrics, QImage, QColorSpace, QPainter,
                          QColor)
 from PyQt6.QtSvg import QSvgRenderer
 from .search_widgets import ImageFetcher
+from core.artwork_urls import resolve_artwork_url
 
 class InfoButton(QPushButton):
     """A custom-painted circular button with an SVG 'info' icon."""
@@ -290,15 +291,17 @@ class DownloadJobWidget(QWidget):
             
             title = track_attrs.get('name', 'Unknown Song')
             artist = track_attrs.get('artistName', 'Unknown Artist')
-            artwork_url = track_attrs.get('artwork', {}).get('url', '').replace('{w}', '128').replace('{h}', '128')
+            artwork_url = resolve_artwork_url(track_attrs.get('artwork', {}).get('url', ''), 52, self.devicePixelRatioF())
             self.track_count_label.setText("1 track")
         else:
             # This is a full album, EP, or a single-track release.
             title = album_attrs.get('name', 'Unknown Album')
             artist = album_attrs.get('artistName', 'Unknown Artist')
-            artwork_url = album_attrs.get('artwork', {}).get('url', '').replace('{w}', '128').replace('{h}', '128')
+            artwork_url = resolve_artwork_url(album_attrs.get('artwork', {}).get('url', ''), 52, self.devicePixelRatioF())
             
-            if track_count > 0:
+            if item_data.get('_selected_track_ids'):
+                self.track_count_label.setText(f"{track_count} selected tracks")
+            elif track_count > 0:
                 self.track_count_label.setText(f"{track_count} tracks")
             else:
                 self.track_count_label.setText("")
@@ -312,24 +315,9 @@ class DownloadJobWidget(QWidget):
             self.worker.signals.error.connect(self._on_image_error)
             QThreadPool.globalInstance().start(self.worker)
 
-    @pyqtSlot(bytes)
-    def set_image(self, image_bytes: bytes | None):
-        if not image_bytes:
-            self.art_label.setText("...")
-            return
-
-        buffer = QBuffer()
-        buffer.open(QIODevice.OpenModeFlag.ReadWrite)
-        buffer.write(image_bytes)
-        buffer.seek(0)
-
-        reader = QImageReader()
-        reader.setDevice(buffer)
-        reader.setDecideFormatFromContent(True)
-        reader.setAutoTransform(True)
-        
-        img = reader.read()
-        if img.isNull():
+    @pyqtSlot(QImage)
+    def set_image(self, img: QImage | None):
+        if img is None or img.isNull():
             self.art_label.setText("No Art")
             return
 
@@ -0,0 +1,127 @@
+import sys
+import threading
+from collections import Counter, OrderedDict
+
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtGui import QColor, QImage
+
+from .artwork_cache import normalize_artwork_url
+
+# Colour statistics don't need more than a thumbnail; Qt does the downscale in C++.
+SAMPLE_SIZE = 48
+LIGHT_THRESHOLD = 160
+_CACHE_LIMIT = 256
+
+# RGB32 is a native-endian 0xffRRGGBB word, so byte offsets depend on the host.
+_R, _G, _B = (2, 1, 0) if sys.byteorder == 'little' else (1, 2, 3)
+
+
+class ImageAnalysis:
+    __slots__ = ('corner_lightness', 'average', 'dominant', 'accent', 'is_light')
+
+    def __init__(self, corner_lightness, average, dominant, accent):
+        self.corner_lightness = corner_lightness
+        self.average = average
+        self.dominant = dominant
+        self.accent = accent
+        self.is_light = corner_lightness > LIGHT_THRESHOLD
+
+
+def _channel_means(image: QImage, rect: QRect) -> tuple[float, float, float]:
+    """Per-channel means of rect in an RGB32 image, summed a row slice at a time."""
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    view = memoryview(bits)
+    stride = image.bytesPerLine()
+    left = rect.left() * 4
+    width = rect.width() * 4
+    r = g = b = 0
+    for y in range(rect.top(), rect.top() + rect.height()):
+        row = view[y * stride + left:y * stride + left + width]
+        r += sum(row[_R::4])
+        g += sum(row[_G::4])
+        b += sum(row[_B::4])
+    count = max(1, rect.width() * rect.height())
+    return r / count, g / count, b / count
+
+
+def _mean_lightness(image: QImage, rect: QRect) -> float:
+    """Mean HSL lightness, (max + min) / 2 per pixel, as QColor.lightness() reports it."""
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    view = memoryview(bits)
+    stride = image.bytesPerLine()
+    total = 0
+    for y in range(rect.top(), rect.top() + rect.height()):
+        row = view[y * stride + rect.left() * 4:y * stride + (rect.left() + rect.width()) * 4]
+        for r, g, b in zip(row[_R::4], row[_G::4], row[_B::4]):
+            total += (max(r, g, b) + min(r, g, b) + 1) // 2
+    return total / max(1, rect.width() * rect.height())
+
+
+def _palette(image: QImage) -> tuple[QColor, QColor]:
+    """Dominant and accent colours from a 4-bit-per-channel histogram."""
+    quantized = image.convertToFormat(QImage.Format.Format_RGB444)
+    bits = quantized.constBits()
+    bits.setsize(quantized.sizeInBytes())
+    stride = quantized.bytesPerLine()
+    row_bytes = quantized.width() * 2
+    view = memoryview(bits)
+    counts = Counter()
+    for y in range(quantized.height()):
+        counts.update(view[y * stride:y * stride + row_bytes].cast('H'))
+
+    def to_color(value):
+        return QColor(((value >> 8) & 0xF) * 17, ((value >> 4) & 0xF) * 17, (value & 0xF) * 17)
+
+    ranked = [to_color(value) for value, _ in counts.most_common(24)]
+    dominant = ranked[0] if ranked else QColor(40, 40, 40)
+    accent = dominant
+    best = -1.0
+    for color in ranked[1:]:
+        hue_gap = abs(color.hsvHue() - dominant.hsvHue()) if color.hsvHue() >= 0 and dominant.hsvHue() >= 0 else 180
+        score = color.hsvSaturationF() * color.valueF() * (0.5 + min(hue_gap, 360 - hue_gap) / 360)
+        if score > best:
+            best = score
+            accent = color
+    return dominant, accent
+
+
+def analyze_image(image: QImage) -> ImageAnalysis:
+    sample = image.scaled(SAMPLE_SIZE, SAMPLE_SIZE, Qt.AspectRatioMode.IgnoreAspectRatio,
+                          Qt.TransformationMode.SmoothTransformation)
+    sample = sample.convertToFormat(QImage.Format.Format_RGB32)
+    # The menu button sits over the top-left quarter, so contrast is judged there.
+    corner = QRect(0, 0, max(1, sample.width() // 4), max(1, sample.height() // 4))
+    corner_lightness = _mean_lightness(sample, corner)
+    average = QColor(*(int(c) for c in _channel_means(sample, sample.rect())))
+    dominant, accent = _palette(sample)
+    return ImageAnalysis(corner_lightness, average, dominant, accent)
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def cached_analysis(url: str) -> ImageAnalysis | None:
+    key = normalize_artwork_url(url)
+    with _cache_lock:
+        result = _cache.get(key)
+        if result is not None:
+            _cache.move_to_end(key)
+        return result
+
+
+def analyze_artwork(url: str, image: QImage) -> ImageAnalysis:
+    """analyze_image, memoised per artwork URL."""
+    result = cached_analysis(url)
+    if result is not None:
+        return result
+    result = analyze_image(image)
+    key = normalize_artwork_url(url)
+    if key:
+        with _cache_lock:
+            _cache[key] = result
+            while len(_cache) > _CACHE_LIMIT:
+                _cache.popitem(last=False)
+    return result
@@ -0,0 +1,136 @@
+import itertools
+import weakref
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QPoint, QRect, QThreadPool, QTimer
+from PyQt6.QtWidgets import QScrollArea, QWidget
+
+PRIORITY_VISIBLE = 3
+PRIORITY_NEAR = 2
+
+# How far outside the viewport (in viewport heights) a card still counts as
+# "near" and keeps prefetching. Anything further is parked until it comes back.
+NEAR_VIEWPORTS = 1.0
+
+
+class _ImageJob:
+    __slots__ = ('fetcher', 'widget_ref', 'pool', 'priority', 'parked')
+
+    def __init__(self, fetcher, widget, pool, priority):
+        self.fetcher = fetcher
+        self.widget_ref = weakref.ref(widget)
+        self.pool = pool
+        self.priority = priority
+        self.parked = False
+
+
+class ImageScheduler(QObject):
+    """Queues artwork fetches so on-screen cards load first and off-screen ones wait."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = {}
+        # id(fetcher) can be reused once a fetcher is freed, so jobs get their own keys.
+        self._keys = itertools.count()
+        self._dirty_areas = weakref.WeakSet()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(40)
+        self._timer.timeout.connect(self._flush)
+        self.parked_count = 0
+        self.skipped_count = 0
+
+    def submit(self, fetcher, widget: QWidget, pool: QThreadPool | None = None):
+        pool = pool or QThreadPool.globalInstance()
+        job = _ImageJob(fetcher, widget, pool, PRIORITY_NEAR)
+        key = next(self._keys)
+        self._jobs[key] = job
+        widget.destroyed.connect(lambda *_, key=key: self._drop(key))
+        pool.start(fetcher, job.priority)
+
+    def reprioritize(self, scroll_area: QScrollArea):
+        """Coalesce scroll events; the actual pass runs once per timer tick."""
+        self._dirty_areas.add(scroll_area)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        areas = [a for a in self._dirty_areas if not sip.isdeleted(a)]
+        self._dirty_areas = weakref.WeakSet()
+        for area in areas:
+            self._reprioritize_now(area)
+
+    @staticmethod
+    def _try_take(job):
+        # Once a runnable has started (or auto-deleted itself) it can no longer be re-queued.
+        if sip.isdeleted(job.fetcher) or getattr(job.fetcher, '_started', False):
+            return False
+        try:
+            return job.pool.tryTake(job.fetcher)
+        except RuntimeError:
+            return False
+
+    def _drop(self, key):
+        job = self._jobs.pop(key, None)
+        if job is not None and not job.parked and self._try_take(job):
+            self.skipped_count += 1
+
+    def _classify(self, widget, area, viewport_rect, near_rect):
+        if not widget.isVisibleTo(area):
+            return None
+        top_left = widget.mapTo(area.viewport(), QPoint(0, 0))
+        rect = QRect(top_left, widget.size())
+        if rect.intersects(viewport_rect):
+            return PRIORITY_VISIBLE
+        if rect.intersects(near_rect):
+            return PRIORITY_NEAR
+        return None
+
+    def _reprioritize_now(self, area: QScrollArea):
+        content = area.widget()
+        if content is None:
+            return
+        viewport = area.viewport()
+        viewport_rect = viewport.rect()
+        margin = int(viewport_rect.height() * NEAR_VIEWPORTS)
+        near_rect = viewport_rect.adjusted(0, -margin, 0, margin)
+        area_visible = area.isVisible()
+
+        for key, job in list(self._jobs.items()):
+            widget = job.widget_ref()
+            if widget is None or sip.isdeleted(widget):
+                self._jobs.pop(key, None)
+                continue
+            if not content.isAncestorOf(widget):
+                continue
+
+            priority = self._classify(widget, area, viewport_rect, near_rect) if area_visible else None
+            if priority == job.priority and not job.parked:
+                continue
+
+            if not job.parked and not self._try_take(job):
+                self._jobs.pop(key, None)
+                continue
+
+            if priority is None:
+                if not job.parked:
+                    job.parked = True
+                    self.parked_count += 1
+                continue
+
+            job.parked = False
+            job.priority = priority
+            job.pool.start(job.fetcher, priority)
+
+    def pending_count(self) -> int:
+        return len(self._jobs)
+
+
+_SCHEDULER = None
+
+
+def image_scheduler() -> ImageScheduler:
+    global _SCHEDULER
+    if _SCHEDULER is None or sip.isdeleted(_SCHEDULER):
+        _SCHEDULER = ImageScheduler()
+    return _SCHEDULER
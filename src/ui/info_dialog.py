@@ -7,11 +7,12 @@ from PyQt6.QtCore import (pyqtSignal, pyqtSlot, QThreadPool, Qt, QTimer, QProper
                           QObject, QEvent, QParallelAnimationGroup, QSize, pyqtProperty, QSequentialAnimationGroup,
                           QPauseAnimation)
 from PyQt6.QtGui import (QPixmap, QBitmap, QPainter, QColor, QLinearGradient, QFontMetrics, QPen, QFont,
-                         QPainterPath)
+                         QPainterPath, QImage)
 import logging
 import os
 from .search_widgets import ImageFetcher, round_pixmap, ClickableLabel
 from .search_cards import resource_path, render_svg_tinted
+from core.artwork_urls import resolve_artwork_url
 
 class ShimmerTag(QWidget):
     def __init__(self, text: str, parent=None):
@@ -652,18 +653,17 @@ class InfoDialog(QDialog):
                 t.start(1500)
 
     def _fetch_artwork(self):
-        artwork_url = self.item_data.get('artworkUrl', '').replace('600x600', '160x160')
+        artwork_url = resolve_artwork_url(self.item_data.get('artworkUrl', ''), self.art_label.width(), self.devicePixelRatioF())
         if artwork_url:
             worker = ImageFetcher(artwork_url).auto_cancel_on(self)
             worker.signals.image_loaded.connect(self._set_artwork)
             worker.signals.error.connect(self._on_artwork_error)
             QThreadPool.globalInstance().start(worker)
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        if image_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
             scaled = pixmap.scaled(self.art_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             self.art_label.setPixmap(round_pixmap(scaled, 6))
 
@@ -10,7 +10,18 @@ from PyQt6.QtGui import QPixmap, QPainter
 from PyQt6.QtSvg import QSvgRenderer
 from ...search_widgets import LoadingSpinner
 from ...search_cards import SearchResultCard, SongListCard
+from ...image_scheduler import image_scheduler
 from ..utility_widgets import ListLoadingIndicator
+from core import startup_metrics
+
+PAGE_SIZE = 30
+
+# When to fetch the next page of a tab in the background: 0.0 as soon as the
+# current page arrives, a fraction to wait for that much scroll, None to disable.
+PREFETCH_AT = {'songs': 0.0, 'albums': 0.0, 'artists': 0.5, 'music_videos': 0.5, 'playlists': 0.5}
+# How close to the bottom (in viewport heights) a tab starts appending the next page.
+APPEND_MARGIN = {'songs': 1.0, 'albums': 1.0, 'artists': 0.5, 'music_videos': 0.5, 'playlists': 0.5}
+
 
 class SearchFeatures:
     def _ensure_storefront_or_prompt(self) -> bool:
@@ -54,12 +65,15 @@ class SearchFeatures:
             self._hide_link_spinner()
 
     def on_scroll(self, value, category):
+        image_scheduler().reprioritize(self.scroll_areas[category])
         if self.is_initial_loading.get(category):
             return
         if self.is_loading_more.get(category) or self.no_more_results.get(category):
             return
         scrollbar = self.scroll_areas[category].verticalScrollBar()
-        if value >= scrollbar.maximum() - 150:
+        self._maybe_prefetch(category, value)
+        margin = max(150, int(scrollbar.pageStep() * APPEND_MARGIN.get(category, 0.0)))
+        if value >= scrollbar.maximum() - margin:
             self.is_loading_more[category] = True
             container = self.tab_containers.get(category)
             if container:
@@ -77,10 +91,33 @@ class SearchFeatures:
                         layout.addWidget(self.loading_tile, next_row, next_col)
                     self.loading_tile.show()
                     self.loading_tile.start()
-            offset = self.search_offsets.get(category, 0) + 30
+            offset = self.search_offsets.get(category, 0) + PAGE_SIZE
             self.search_offsets[category] = offset
             self.controller.load_more_results(self.current_query, category, offset)
 
+    def _maybe_prefetch(self, category, value=None):
+        """Ask the controller to warm the next page of category if its trigger point is reached."""
+        threshold = PREFETCH_AT.get(category)
+        if threshold is None or not self.current_query or self.no_more_results.get(category):
+            return
+        offset = self.search_offsets.get(category, 0) + PAGE_SIZE
+        if self.prefetched_offsets.get(category, -1) >= offset:
+            return
+        if threshold > 0:
+            scrollbar = self.scroll_areas[category].verticalScrollBar()
+            position = scrollbar.value() if value is None else value
+            if scrollbar.maximum() <= 0 or position < scrollbar.maximum() * threshold:
+                return
+        self.prefetched_offsets[category] = offset
+        self.controller.prefetch_results(self.current_query, category, offset, PAGE_SIZE)
+
+    def _note_page_arrived(self, category, items):
+        # The catalog leaves out the next link on the last page; don't spend a request proving it.
+        if not items or self.controller.search_exhausted(self.current_query, category):
+            self.no_more_results[category] = True
+            return
+        self._maybe_prefetch(category)
+
     def on_search_clicked(self):
         if not self._ensure_storefront_or_prompt():
             return
@@ -101,6 +138,7 @@ class SearchFeatures:
         self.is_loading_more = {'songs': False, 'albums': False, 'artists': False, 'music_videos': False, 'playlists': False}
         self.is_initial_loading = {'songs': True, 'albums': True, 'artists': True, 'music_videos': True, 'playlists': True, 'top_results': True}
         self.no_more_results = {'songs': False, 'albums': False, 'artists': False, 'music_videos': False, 'playlists': False}
+        self.prefetched_offsets = {}
         self.albums_tab_searched = False
         self.music_videos_tab_searched = False
         self.playlists_tab_searched = False
@@ -126,6 +164,8 @@ class SearchFeatures:
         self.controller.search(query)
 
     def on_tab_changed(self, index):
+        for scroll_area in self.scroll_areas.values():
+            image_scheduler().reprioritize(scroll_area)
         tab_text = self.tab_widget.tabText(index)
         if tab_text == "Albums" and not self.albums_tab_searched:
             self.albums_tab_searched = True
@@ -392,6 +432,8 @@ class SearchFeatures:
             spinner.deleteLater()
         self.search_cache = results
         self._populate_top_results_tab(results)
+        if results:
+            startup_metrics.mark("first search result")
         self._populate_category_tab('songs', results.get('songs', []))
         self._populate_category_tab('artists', results.get('artists', []))
         
@@ -420,6 +462,10 @@ class SearchFeatures:
             layout.addWidget(prompt_label)
         
         self.is_initial_loading = {key: False for key in self.is_initial_loading}
+        for category in ('songs', 'artists'):
+            self._note_page_arrived(category, results.get(category, []))
+        for category in ('top_results', 'songs', 'artists'):
+            image_scheduler().reprioritize(self.scroll_areas[category])
 
     def handle_category_search_results(self, category, results):
         spinner = self.loading_spinners.pop(category, None)
@@ -439,6 +485,10 @@ class SearchFeatures:
             self.search_cache['playlists'] = results
             self._populate_category_tab('playlists', results)
             self.is_initial_loading['playlists'] = False
+        else:
+            return
+        image_scheduler().reprioritize(self.scroll_areas[category])
+        self._note_page_arrived(category, results)
 
     def append_search_results(self, category, new_items):
         self.loading_tile.stop()
@@ -456,6 +506,8 @@ class SearchFeatures:
         
         self.search_cache.setdefault(category_key, []).extend(new_items)
         self._start_append_chunk(category_key, new_items)
+        if new_items:
+            self._note_page_arrived(category_key, new_items)
 
     def _start_append_chunk(self, category_key, items_to_add):
         if not items_to_add:
@@ -469,7 +521,7 @@ class SearchFeatures:
         self._perform_append_chunk(category_key, chunk)
         
         if remaining:
-            QTimer.singleShot(50, lambda: self._start_append_chunk(category_key, remaining))
+            QTimer.singleShot(0, lambda: self._start_append_chunk(category_key, remaining))
         else:
             self.is_loading_more[category_key] = False
 
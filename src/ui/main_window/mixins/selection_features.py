@@ -1,6 +1,8 @@
 from PyQt6 import sip
 from PyQt6.QtCore import pyqtSlot
 
+from core.rate_limiter import BACKGROUND
+
 class SelectionFeatures:
     """Features for managing selection of items for batch download."""
 
@@ -92,6 +94,6 @@ class SelectionFeatures:
                 self._pending_song_by_job[job_id] = item_data.get('id')
             
             self.statusBar().showMessage(f"Fetching details for '{item_data.get('name', 'item')}'...", 3000)
-            self.controller.fetch_media_for_download(url, job_id)
+            self.controller.fetch_media_for_download(url, job_id, BACKGROUND)
         
         self._clear_selection()
\ No newline at end of file
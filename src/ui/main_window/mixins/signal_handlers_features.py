@@ -10,6 +10,7 @@ from PyQt6 import sip
 from PyQt6.QtWidgets import QDialog, QLayout, QApplication, QFileDialog
 from PyQt6.QtCore import Qt, pyqtSlot, QTimer
 import os
+from core.rate_limiter import BACKGROUND
 from ..dialogs import RestartDialog, WrapperErrorDialog
 from ...artist import ArtistDiscographyPage
 from ...track_dialogs import TrackSelectionDialog, TrackListingDialog
@@ -51,6 +52,7 @@ class SignalHandlersFeatures:
         self.download_worker.job_error_line.connect(self._maybe_show_decryptor_popup)
         self.download_worker.queue_has_been_paused.connect(self._on_queue_pause_triggered)
         self.download_worker.job_started.connect(self._on_job_started)
+        self.download_worker.throughput_updated.connect(self.queue_panel.update_throughput)
 
         self.search_input.returnPressed.connect(self.handle_input)
         self.settings_button.clicked.connect(self.toggle_sidebar)
@@ -80,6 +82,7 @@ class SignalHandlersFeatures:
         self.controller.lyrics_content_ready_for_save.connect(self.on_lyrics_content_ready_for_save)
         self.controller.artwork_download_started.connect(lambda item_id: self._show_download_spinner(item_id))
         self.controller.artwork_download_finished.connect(self.on_artwork_download_finished)
+        self.controller.artwork_download_progress.connect(self.on_artwork_download_progress)
 
         self.queue_is_paused = False
         self._paused_jobs = []
@@ -382,16 +385,34 @@ class SignalHandlersFeatures:
         self._disco_batch = {'total': len(items), 'done': 0}
         self.statusBar().showMessage(f"Fetching... for {len(items)} releases...", 3000)
         
+        skipped = 0
         for item_data in items:
             url = item_data.get('appleMusicUrl')
             if not url:
-                if self._disco_batch:
-                    self._disco_batch['done'] += 1
+                skipped += 1
                 continue
             
             self.job_counter += 1
             job_id = self.job_counter
-            self.controller.fetch_media_for_download(url, job_id)
+            self.controller.fetch_media_for_download(url, job_id, BACKGROUND)
+
+        for _ in range(skipped):
+            self._advance_disco_batch()
+        if self._disco_batch:
+            self.discography_batch_progress.emit(self._disco_batch['done'], self._disco_batch['total'])
+
+    def _advance_disco_batch(self):
+        """Counts one discography release as fetched or failed and reports batch progress."""
+        if not self._disco_batch:
+            return
+        self._disco_batch['done'] += 1
+        done, total = self._disco_batch['done'], self._disco_batch['total']
+        self.statusBar().showMessage(f"Fetched metadata for {done}/{total} releases.", 2000)
+        self.discography_batch_progress.emit(done, total)
+        if done >= total:
+            self.statusBar().showMessage(f"Finished fetching metadata for all {total} releases.", 3000)
+            self.discography_batch_finished.emit(total)
+            self._disco_batch = None
 
     @pyqtSlot(dict)
     def on_discography_tracklist_requested(self, data: dict):
@@ -517,10 +538,35 @@ class SignalHandlersFeatures:
         item_id = item_data.get('id', '')
         item_name = item_data.get('name', 'Unknown')
         
+        config = {}
+        try:
+            with open("config.yaml", "r") as f:
+                config = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            pass
+        
+        last_dir = config.get("last_artwork_dir", os.path.expanduser("~/Pictures"))
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Artwork",
+            os.path.join(last_dir, "cover.jpg"),
+            "Image Files (*.jpg *.png)"
+        )
+        if not file_path:
+            return
+        
+        config["last_artwork_dir"] = os.path.dirname(file_path)
+        try:
+            with open("config.yaml", "w") as f:
+                yaml.dump(config, f, sort_keys=False, allow_unicode=True)
+        except Exception as e:
+            logging.warning(f"Could not remember artwork directory: {e}")
+        
         self._show_download_spinner(item_id)
         
         self.statusBar().showMessage(f"Fetching artwork for {item_name}...", 3000)
-        self.controller.download_artwork(item_data)
+        self.controller.download_artwork(item_data, file_path)
 
     def _show_download_spinner(self, item_id: str):
         """Show loading spinner on cards for this item"""
@@ -585,51 +631,23 @@ class SignalHandlersFeatures:
             except Exception as e:
                 self.statusBar().showMessage(f"Failed to save lyrics: {e}", 5000)
 
+    @pyqtSlot(str, int, int)
+    def on_artwork_download_progress(self, item_id: str, received: int, total: int):
+        if total:
+            self.statusBar().showMessage(f"Downloading artwork... {received / 1024 / 1024:.1f} / {total / 1024 / 1024:.1f} MB", 2000)
+        else:
+            self.statusBar().showMessage(f"Downloading artwork... {received / 1024 / 1024:.1f} MB", 2000)
+
     @pyqtSlot(str, bool, str)
-    def on_artwork_download_finished(self, item_id: str, success: bool, data_or_error: str):
+    def on_artwork_download_finished(self, item_id: str, success: bool, path_or_error: str):
     
         self._hide_download_spinner(item_id)
         
         if not success:
-            self.statusBar().showMessage(f"Artwork download failed: {data_or_error}", 5000)
+            self.statusBar().showMessage(f"Artwork download failed: {path_or_error}", 5000)
             return
         
-        config = {}
-        try:
-            with open("config.yaml", "r") as f:
-                config = yaml.safe_load(f) or {}
-        except FileNotFoundError:
-            pass
-        
-        item_data = self._get_item_data_by_id(item_id)
-        if not item_data:
-            default_filename = "cover"
-        else:
-            default_filename = "cover"
-        
-        last_dir = config.get("last_artwork_dir", os.path.expanduser("~/Pictures"))
-        
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save Artwork",
-            os.path.join(last_dir, f"{default_filename}.jpg"),
-            "Image Files (*.jpg *.png)"
-        )
-        
-        if file_path:
-            try:
-                artwork_bytes = data_or_error.encode('latin1')
-                
-                with open(file_path, 'wb') as f:
-                    f.write(artwork_bytes)
-                
-                config["last_artwork_dir"] = os.path.dirname(file_path)
-                with open("config.yaml", "w") as f:
-                    yaml.dump(config, f, sort_keys=False, allow_unicode=True)
-                
-                self.statusBar().showMessage(f"Artwork saved to {os.path.basename(file_path)}", 3000)
-            except Exception as e:
-                self.statusBar().showMessage(f"Failed to save artwork: {e}", 5000)
+        self.statusBar().showMessage(f"Artwork saved to {os.path.basename(path_or_error)}", 3000)
 
     def _get_item_data_by_id(self, item_id: str):
         """Find item data from card_widgets by ID"""
@@ -694,15 +712,22 @@ class SignalHandlersFeatures:
         self.track_selection_dialog.play_requested.connect(self.on_play_requested)
         self.track_selection_dialog.check_qualities_requested.connect(self.controller.fetch_qualities_for_dialog)
         self.controller.track_qualities_loaded.connect(self.track_selection_dialog.update_track_qualities)
+        self.controller.track_quality_loaded.connect(self.track_selection_dialog.update_track_quality)
+        self.controller.track_quality_progress.connect(self.track_selection_dialog.update_quality_progress)
         self._clear_active_card()
         
         result = self.track_selection_dialog.exec()
+        self.controller.cancel_quality_probe()
         
-        
-        try:
-            self.controller.track_qualities_loaded.disconnect(self.track_selection_dialog.update_track_qualities)
-        except TypeError:
-            pass 
+        for signal, slot in (
+            (self.controller.track_qualities_loaded, self.track_selection_dialog.update_track_qualities),
+            (self.controller.track_quality_loaded, self.track_selection_dialog.update_track_quality),
+            (self.controller.track_quality_progress, self.track_selection_dialog.update_quality_progress),
+        ):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
 
         selected_ids = self.track_selection_dialog.get_selected_track_ids()
         self.track_selection_dialog = None
@@ -711,10 +736,14 @@ class SignalHandlersFeatures:
             if not selected_ids:
                 return
             
-            original_tracks = media_data.get('tracks', [])
+            batch_selection = self._batch_selections_enabled()
+            tracks_by_id = {t.get('trackData', {}).get('id'): t for t in media_data.get('tracks', [])}
+            batch_tracks = []
+            batch_ids = []
+            batch_urls = []
 
             for track_id in selected_ids:
-                selected_track_obj = next((t for t in original_tracks if t.get('trackData', {}).get('id') == track_id), None)
+                selected_track_obj = tracks_by_id.get(track_id)
                 
                 if not selected_track_obj:
                     continue
@@ -724,13 +753,55 @@ class SignalHandlersFeatures:
                     self.controller.update_status_and_log(f"Could not find URL for track ID {track_id}. Skipping.", "error")
                     continue
 
+                if not batch_selection or "/music-video/" in track_url:
+                    self._queue_track_job(media_data, track_id, track_url)
+                    continue
+
+                batch_tracks.append(selected_track_obj)
+                batch_ids.append(self._song_id_from_url(track_url) or track_id)
+                batch_urls.append((track_id, track_url))
+
+            if batch_tracks:
+                container_url = media_data.get('albumData', {}).get('attributes', {}).get('url', '')
+                if not container_url:
+                    # Nothing to run the selection on; each track is queued on its own URL instead.
+                    for track_id, track_url in batch_urls:
+                        self._queue_track_job(media_data, track_id, track_url)
+                    return
+                # One job for every selected song: one backend run over the album or playlist.
                 self.job_counter += 1
-                job_id = self.job_counter
-                
-                track_specific_media_data = copy.deepcopy(media_data)
-                final_media_data = self._prepare_job_data(track_specific_media_data, song_id=track_id)
-                
-                self._trigger_download(job_id, final_media_data, track_url)
+                batch_media_data = {
+                    'albumData': media_data.get('albumData', {}),
+                    'tracks': batch_tracks,
+                    '_selected_track_ids': batch_ids,
+                    '_fetched_at': media_data.get('_fetched_at'),
+                }
+                self._trigger_download(self.job_counter, batch_media_data, container_url)
+
+    @staticmethod
+    def _batch_selections_enabled() -> bool:
+        """Whether a track selection is queued as one --select-tracks job (opt-in via `batch-track-selections`)."""
+        try:
+            with open('config.yaml', 'r') as f:
+                config = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logging.warning(f"Could not read batch-track-selections from config.yaml: {e}")
+            return False
+        return bool(config.get('batch-track-selections', False))
+
+    def _queue_track_job(self, media_data, track_id, track_url):
+        """Queues one selected track as its own download job on the track's URL."""
+        self.job_counter += 1
+        final_media_data = self._prepare_job_data(media_data, song_id=track_id)
+        self._trigger_download(self.job_counter, final_media_data, track_url)
+
+    @staticmethod
+    def _song_id_from_url(track_url: str) -> str | None:
+        """Catalog song ID from a song URL or an album URL's ?i= parameter."""
+        match = re.search(r'[?&]i=(\d+)', track_url) or re.search(r'/song/[^/]+/(\d+)', track_url)
+        return match.group(1) if match else None
 
     @pyqtSlot(int, int, int)
     def on_media_fetch_progress(self, job_id, current, total):
@@ -754,15 +825,7 @@ class SignalHandlersFeatures:
                 job_widget.job_progress_bar.setRange(0, 1000)
             job_widget.status_label.setText("Queued...")
         
-        if self._disco_batch:
-            self._disco_batch['done'] += 1
-            done, total = self._disco_batch['done'], self._disco_batch['total']
-            self.statusBar().showMessage(f"Fetched metadata for {done}/{total} releases.", 2000)
-            self.discography_batch_progress.emit(done, total)
-            if done >= total:
-                self.statusBar().showMessage(f"Finished fetching metadata for all {total} releases.", 3000)
-                self.discography_batch_finished.emit(total)
-                self._disco_batch = None
+        self._advance_disco_batch()
         
         if self.fetch_progress_popup.isVisible():
             done_count = self._disco_batch['done'] if self._disco_batch else 1
@@ -799,6 +862,7 @@ class SignalHandlersFeatures:
             }
          
             job_media_data['_is_single_song'] = True
+            job_media_data['_fetched_at'] = media_data.get('_fetched_at')
             
          
             album_attrs = job_media_data['albumData'].setdefault('attributes', {})
@@ -905,10 +969,4 @@ class SignalHandlersFeatures:
         else:
             self.show_popup(f"Failed to fetch details for {url}: {error_message}")
         
-        if self._disco_batch:
-            self._disco_batch['done'] += 1
-            done, total = self._disco_batch['done'], self._disco_batch['total']
-            if done >= total:
-                self.statusBar().showMessage(f"Finished fetching metadata for all {total} releases.", 3000)
-                self.discography_batch_finished.emit(total)
-                self._disco_batch = None
\ No newline at end of file
+        self._advance_disco_batch()
\ No newline at end of file
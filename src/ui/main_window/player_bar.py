@@ -1,8 +1,9 @@
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame, QPushButton, QSlider, QStyle
 from PyQt6.QtCore import pyqtSignal, pyqtSlot, QThreadPool, Qt, QPointF, QTimer, QPoint, QRectF
-from PyQt6.QtGui import QPainter, QColor, QPen, QPixmap, QCursor, QPainterPath
+from PyQt6.QtGui import QPainter, QColor, QPen, QPixmap, QCursor, QPainterPath, QImage
 from ..search_widgets import MarqueeLabel, ImageFetcher, round_pixmap
 from ..search_cards import PlayButton
+from core.artwork_urls import resolve_artwork_url
 
 class ClickableSlider(QSlider):
     def mousePressEvent(self, event):
@@ -315,7 +316,7 @@ class PlayerBar(QFrame):
 
     def _fetch_artwork(self, url):
         if url:
-            small_url = url.replace('{w}', '80').replace('{h}', '80')
+            small_url = resolve_artwork_url(url, self.art_label.width(), self.devicePixelRatioF())
             self.worker = ImageFetcher(small_url).auto_cancel_on(self)
             self.worker.signals.image_loaded.connect(self._set_artwork)
             QThreadPool.globalInstance().start(self.worker)
@@ -323,9 +324,8 @@ class PlayerBar(QFrame):
             self.art_label.clear()
             self.art_label.setStyleSheet("border-radius: 4px; background-color: #333;")
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        pixmap = QPixmap.fromImage(image)
         scaled = pixmap.scaled(self.art_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
         self.art_label.setPixmap(round_pixmap(scaled, 4))
\ No newline at end of file
@@ -20,6 +20,8 @@ from ..queue_panel import QueuePanel
 from ..view_select import SelectionDropdown
 from .dialogs import RestartDialog, StorefrontRequiredDialog
 from ..video_preview_dialog import VideoPreviewDialog
+from ..artwork_cache import artwork_cache
+from ..pixmap_cache import pixmap_cache
 from .mixins.ui_setup_features import UiSetupFeatures
 from .mixins.layout_animation_features import LayoutAnimationFeatures
 from .mixins.search_features import SearchFeatures
@@ -64,6 +66,7 @@ class MainWindow(QMainWindow, UiSetupFeatures, LayoutAnimationFeatures, SearchFe
         self.is_loading_more = {}
         self.is_initial_loading = {}
         self.no_more_results = {}
+        self.prefetched_offsets = {}
         self.scroll_areas = {}
         self.tab_containers = {}
         self.albums_tab_searched = False
@@ -146,6 +149,9 @@ class MainWindow(QMainWindow, UiSetupFeatures, LayoutAnimationFeatures, SearchFe
     @pyqtSlot()
     def on_force_clear_all_jobs(self):
         logging.info("MainWindow force clearing all job queues.")
+        if self._disco_batch:
+            # Queued releases were dropped; release the artist page's batch buttons.
+            self.discography_batch_finished.emit(self._disco_batch['done'])
         self._disco_batch = None
 
     def _restart_application(self):
@@ -263,6 +269,8 @@ class MainWindow(QMainWindow, UiSetupFeatures, LayoutAnimationFeatures, SearchFe
                 logging.warning("Global thread pool timeout on shutdown.")
             self._force_terminate_subprocesses()
             self._safe_cleanup_widgets()
+            logging.info(f"Artwork cache stats: {artwork_cache().stats()}")
+            logging.info(f"Pixmap cache stats: {pixmap_cache().stats()}")
             logging.info("Shutdown sequence complete. Scheduling application quit.")
             QTimer.singleShot(0, QApplication.instance().quit)
         except Exception as e:
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QPixmap
+
+from .artwork_cache import normalize_artwork_url
+
+PIXMAP_BUDGET_BYTES = 48 * 1024 * 1024
+
+
+def pixmap_cost(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class PixmapCache:
+    """Byte-budgeted LRU of delegate-ready pixmaps, shared by every view.
+
+    Entries are keyed by (url, style) and remember the size they were rendered
+    at. Storing a new size for the same key replaces the old one, so resizing a
+    view keeps one pixmap per cover instead of one per width it passed through.
+    Pixmaps are GUI-thread objects; only use this from the GUI thread.
+    """
+
+    def __init__(self, budget: int = PIXMAP_BUDGET_BYTES):
+        self.budget = budget
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resized = 0
+
+    def get(self, url: str, style: tuple, size: QSize) -> QPixmap | None:
+        key = (normalize_artwork_url(url), style)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != (size.width(), size.height()):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, url: str, style: tuple, size: QSize, pixmap: QPixmap):
+        if pixmap is None or pixmap.isNull():
+            return
+        key = (normalize_artwork_url(url), style)
+        cost = pixmap_cost(pixmap)
+        if cost > self.budget:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[2]
+            if old[0] != (size.width(), size.height()):
+                self.resized += 1
+        self._entries[key] = ((size.width(), size.height()), pixmap, cost)
+        self._bytes += cost
+        while self._bytes > self.budget and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted[2]
+            self.evictions += 1
+
+    def set_budget(self, budget: int):
+        self.budget = max(0, int(budget))
+        while self._bytes > self.budget and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted[2]
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def memory_usage(self) -> int:
+        return self._bytes
+
+    def stats(self) -> dict:
+        return {
+            'items': len(self._entries),
+            'bytes': self._bytes,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'resized': self.resized,
+        }
+
+
+_PIXMAP_CACHE = None
+
+
+def pixmap_cache() -> PixmapCache:
+    global _PIXMAP_CACHE
+    if _PIXMAP_CACHE is None:
+        _PIXMAP_CACHE = PixmapCache()
+    return _PIXMAP_CACHE
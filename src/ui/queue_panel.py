@@ -199,6 +199,11 @@ class QueuePanel(QFrame):
         """)
         title_layout.addWidget(title_label, 1)
 
+        self.throughput_label = QLabel()
+        self.throughput_label.setStyleSheet("color: #888; font-size: 8pt;")
+        self.throughput_label.setVisible(False)
+        title_layout.addWidget(self.throughput_label)
+
         self.clear_finished_button = QPushButton("Clear Finished")
         self.clear_finished_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.clear_finished_button.setStyleSheet("""
@@ -381,6 +386,15 @@ class QueuePanel(QFrame):
         if job_id in self.jobs:
             self.jobs[job_id].update_progress(status_text, track_percent, overall_percent)
 
+    @pyqtSlot(int, float)
+    def update_throughput(self, active_jobs, bytes_per_sec):
+        """Shows how many downloads are running and their combined speed."""
+        if active_jobs <= 0:
+            self.throughput_label.setVisible(False)
+            return
+        self.throughput_label.setText(f"{active_jobs} active • {bytes_per_sec / 1024 / 1024:.1f} MB/s")
+        self.throughput_label.setVisible(True)
+
     @pyqtSlot(int, str)
     def update_stream_label(self, jobid, label):
         print(f"DEBUG PYTHON: update_stream_label called - jobid={jobid}, label='{label}'")
@@ -5,9 +5,11 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSizePolicy, QApplication, QMenu
 )
 from PyQt6.QtCore import pyqtSignal, pyqtSlot, QThreadPool, QSize, Qt, QPointF, QEvent, QRectF, QRect
-from PyQt6.QtGui import QPixmap, QMouseEvent, QBitmap, QPainter, QColor, QPen, QFontMetrics, QIcon, QPainterPath, QAction
+from PyQt6.QtGui import QPixmap, QMouseEvent, QPainter, QColor, QPen, QFontMetrics, QIcon, QPainterPath, QAction, QImage
 from PyQt6.QtSvg import QSvgRenderer
 from .search_widgets import LoadingSpinner, ImageFetcher, MarqueeLabel, round_pixmap, CustomCheckBox
+from core.artwork_urls import resolve_artwork_url
+from .image_scheduler import image_scheduler
 from enum import Enum
 
 def resource_path(relative_path):
@@ -746,36 +748,21 @@ class SearchResultCard(QWidget):
         self.active_button = None
 
     def _fetch_artwork(self):
-        artwork_url = self.result_data.get('artworkUrl')
+        artwork_url = resolve_artwork_url(self.result_data.get('artworkUrl'), self.artwork_label.width(), self.devicePixelRatioF())
         if artwork_url:
-            self.worker = ImageFetcher(artwork_url).auto_cancel_on(self)
+            is_artist = self.result_data.get('type') == 'artists'
+            self.worker = (ImageFetcher(artwork_url)
+                           .rendered(self.artwork_label.size(), self.devicePixelRatioF(), radius=12, ellipse=is_artist)
+                           .auto_cancel_on(self))
             self.worker.signals.image_loaded.connect(self._set_artwork)
             self.worker.signals.error.connect(self._on_load_error)
-            self.thread_pool.start(self.worker)
+            image_scheduler().submit(self.worker, self, self.thread_pool)
         else:
             self.artwork_label.setText("No Image")
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
-        
-        scaled_pixmap = pixmap.scaled(self.artwork_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        
-        if self.result_data.get('type') == 'artists':
-            mask = QBitmap(scaled_pixmap.size())
-            mask.fill(Qt.GlobalColor.white)
-            painter = QPainter(mask)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            painter.setBrush(Qt.GlobalColor.black)
-            painter.drawEllipse(scaled_pixmap.rect())
-            painter.end()
-            scaled_pixmap.setMask(mask)
-            final_pixmap = scaled_pixmap
-        else:
-            final_pixmap = round_pixmap(scaled_pixmap, 12)
-        
-        self.artwork_label.setPixmap(final_pixmap)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        self.artwork_label.setPixmap(QPixmap.fromImage(image))
 
     @pyqtSlot(str)
     def _on_load_error(self, error_str: str):
@@ -886,24 +873,20 @@ class BaseListCard(QWidget):
         pass
 
     def _fetch_artwork(self):
-        artwork_url = self.result_data.get('artworkUrl')
+        artwork_url = resolve_artwork_url(self.result_data.get('artworkUrl'), self.artwork_label.width(), self.devicePixelRatioF())
         if artwork_url:
-            self.worker = ImageFetcher(artwork_url).auto_cancel_on(self)
+            self.worker = (ImageFetcher(artwork_url)
+                           .rendered(self.artwork_label.size(), self.devicePixelRatioF(), radius=4)
+                           .auto_cancel_on(self))
             self.worker.signals.image_loaded.connect(self._set_artwork)
             self.worker.signals.error.connect(self._on_load_error)
-            self.thread_pool.start(self.worker)
+            image_scheduler().submit(self.worker, self, self.thread_pool)
         else:
             self.artwork_label.setText("No Art")
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
-        
-        scaled = pixmap.scaled(self.artwork_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        rounded = round_pixmap(scaled, 4)
-        
-        self.artwork_label.setPixmap(rounded)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        self.artwork_label.setPixmap(QPixmap.fromImage(image))
 
     @pyqtSlot(str)
     def _on_load_error(self, error_str: str):
@@ -1298,19 +1281,18 @@ class SongTableCard(QWidget):
         self._fetch_artwork()
 
     def _fetch_artwork(self):
-        artwork_url = self.result_data.get('artworkUrl')
+        artwork_url = resolve_artwork_url(self.result_data.get('artworkUrl'), self.artwork_label.width(), self.devicePixelRatioF())
         if artwork_url:
             self.worker = ImageFetcher(artwork_url).auto_cancel_on(self)
             self.worker.signals.image_loaded.connect(self._set_artwork)
             self.worker.signals.error.connect(self._on_load_error)
-            self.thread_pool.start(self.worker)
+            image_scheduler().submit(self.worker, self, self.thread_pool)
         else:
             self.artwork_label.setText("No Image")
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        pixmap = QPixmap.fromImage(image)
         
         scaled = pixmap.scaled(self.artwork_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
         rounded = round_pixmap(scaled, 4)
@@ -1591,22 +1573,18 @@ class DiscographyCellWidget(QWidget):
             self.artwork_label.setText("No Image")
             return
         
-        formatted_url = artwork_url.replace('{w}', '128').replace('{h}', '128')
+        formatted_url = resolve_artwork_url(artwork_url, self.artwork_label.width(), self.devicePixelRatioF())
             
-        self.worker = ImageFetcher(formatted_url).auto_cancel_on(self)
+        self.worker = (ImageFetcher(formatted_url)
+                       .rendered(self.artwork_label.size(), self.devicePixelRatioF(), radius=4)
+                       .auto_cancel_on(self))
         self.worker.signals.image_loaded.connect(self._set_artwork)
         self.worker.signals.error.connect(self._on_load_error)
-        self.thread_pool.start(self.worker)
-
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
-        
-        scaled = pixmap.scaled(self.artwork_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        rounded = round_pixmap(scaled, 4)
+        image_scheduler().submit(self.worker, self, self.thread_pool)
 
-        self.artwork_label.setPixmap(rounded)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        self.artwork_label.setPixmap(QPixmap.fromImage(image))
 
     @pyqtSlot(str)
     def _on_load_error(self, error_msg: str):
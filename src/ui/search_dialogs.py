@@ -5,10 +5,11 @@ from PyQt6.QtWidgets import (
     QGraphicsDropShadowEffect, QBoxLayout, QGraphicsOpacityEffect, QLayout
 )
 from PyQt6.QtCore import pyqtSignal, pyqtSlot, QThreadPool, Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect, QRectF, QObject, QEvent
-from PyQt6.QtGui import QPixmap, QBitmap, QPainter, QColor, QLinearGradient, QFontMetrics
+from PyQt6.QtGui import QPixmap, QBitmap, QPainter, QColor, QLinearGradient, QFontMetrics, QImage
 import logging
 from .search_widgets import LoadingSpinner, ImageFetcher, round_pixmap, ClickableLabel
 from .search_cards import TrackItemWidget, DiscographyCellWidget, TracklistButton
+from core.artwork_urls import resolve_artwork_url
 
 class _ElideOnResizeFilter(QObject):
     def __init__(self, label: QLabel, full_text: str, parent=None):
@@ -259,16 +260,15 @@ class ArtistHeroWidget(QWidget):
     def _fetch_image(self):
         artist_url = self.artist_data.get('artworkUrl', '')
         if artist_url:
-            bg_url = artist_url.replace('{w}', '800').replace('{h}', '800')
+            bg_url = resolve_artwork_url(artist_url, 800)
             artist_worker = ImageFetcher(bg_url).auto_cancel_on(self)
             artist_worker.signals.image_loaded.connect(self._set_artist_image)
             self.thread_pool.start(artist_worker)
 
-    @pyqtSlot(bytes)
-    def _set_artist_image(self, image_data):
-        if image_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artist_image(self, image):
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
             
             self.background_pixmap = pixmap.copy()
             
@@ -416,17 +416,16 @@ class TrackSelectionDialog(QDialog):
         return header_widget
 
     def _fetch_artwork(self, album_attrs):
-        artwork_url = album_attrs.get('artwork', {}).get('url', '').replace('{w}', '120').replace('{h}', '120')
+        artwork_url = resolve_artwork_url(album_attrs.get('artwork', {}).get('url', ''), self.art_label.width(), self.devicePixelRatioF())
         if artwork_url:
             self.worker = ImageFetcher(artwork_url).auto_cancel_on(self)
             self.worker.signals.image_loaded.connect(self._set_artwork)
             QThreadPool.globalInstance().start(self.worker)
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        if image_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
             
             scaled = pixmap.scaled(self.art_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             rounded = round_pixmap(scaled, 6)
@@ -846,17 +845,16 @@ class TrackListingDialog(QDialog):
         return header_widget
 
     def _fetch_artwork(self, album_attrs):
-        artwork_url = album_attrs.get('artwork', {}).get('url', '').replace('{w}', '240').replace('{h}', '240')
+        artwork_url = resolve_artwork_url(album_attrs.get('artwork', {}).get('url', ''), self.art_label.width(), self.devicePixelRatioF())
         if artwork_url:
             self.worker = ImageFetcher(artwork_url).auto_cancel_on(self)
             self.worker.signals.image_loaded.connect(self._set_artwork)
             QThreadPool.globalInstance().start(self.worker)
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        if image_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
 
             scaled = pixmap.scaled(self.art_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             rounded = round_pixmap(scaled, 8)
@@ -1365,17 +1363,16 @@ class InfoDialog(QDialog):
                 t.start(1500)
 
     def _fetch_artwork(self):
-        artwork_url = self.item_data.get('artworkUrl', '').replace('600x600', '160x160')
+        artwork_url = resolve_artwork_url(self.item_data.get('artworkUrl', ''), self.art_label.width(), self.devicePixelRatioF())
         if artwork_url:
             worker = ImageFetcher(artwork_url).auto_cancel_on(self)
             worker.signals.image_loaded.connect(self._set_artwork)
             QThreadPool.globalInstance().start(worker)
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        if image_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
             scaled = pixmap.scaled(self.art_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             self.art_label.setPixmap(round_pixmap(scaled, 6))
 
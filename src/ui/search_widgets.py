@@ -1,15 +1,17 @@
 import logging
 import os
 import sys
-import urllib.request
 import weakref
+import threading
 import socket
 import math
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QCheckBox, QStyleOptionButton, QStyle, QApplication
 )
-from PyQt6.QtCore import pyqtSignal, pyqtSlot, QRunnable, QObject, Qt, QPointF, QEvent, QTimer, QRect
-from PyQt6.QtGui import QPixmap, QBitmap, QPainter, QColor, QPen, QPainterPath
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QRunnable, QObject, Qt, QPointF, QEvent, QTimer, QRect, QRectF, QSize
+from PyQt6.QtGui import QPixmap, QBitmap, QPainter, QColor, QPen, QPainterPath, QImage
+from core.image_http import image_http
+from .artwork_cache import artwork_cache, normalize_artwork_url
 
 def round_pixmap(pixmap, radius):
     if pixmap.isNull():
@@ -28,6 +30,33 @@ def round_pixmap(pixmap, radius):
     pixmap.setMask(mask)
     return pixmap
 
+def render_artwork(image: QImage, size: QSize, dpr: float = 1.0, radius: float = 0, ellipse: bool = False) -> QImage:
+    if image.isNull():
+        return image
+    target_w = max(1, round(size.width() * dpr))
+    target_h = max(1, round(size.height() * dpr))
+    scaled = image.scaled(target_w, target_h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+    if not radius and not ellipse:
+        out = scaled.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    else:
+        out = QImage(scaled.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        out.fill(Qt.GlobalColor.transparent)
+        path = QPainterPath()
+        rect = QRectF(out.rect())
+        if ellipse:
+            path.addEllipse(rect)
+        else:
+            path.addRoundedRect(rect, radius * dpr, radius * dpr)
+        painter = QPainter(out)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setClipPath(path)
+        painter.drawImage(0, 0, scaled)
+        painter.end()
+
+    out.setDevicePixelRatio(dpr)
+    return out
+
 def resource_path(relative_path):
     
     try:
@@ -90,22 +119,41 @@ class LoadingSpinner(QWidget):
         self.hide()
 
 class ImageFetcherSignals(QObject):
-    image_loaded = pyqtSignal(bytes)
+    image_loaded = pyqtSignal(QImage)
     error = pyqtSignal(str)
 
 _IN_FLIGHT_FETCHERS = weakref.WeakSet()
 
+class _FetchGroup:
+    """One network fetch shared by every ImageFetcher asking for the same URL."""
+
+    def __init__(self, leader):
+        self.subscribers = [leader]
+
+    def abandoned(self):
+        return all(sub._cancel for sub in self.subscribers)
+
+_FETCH_GROUPS = {}
+_FETCH_GROUPS_LOCK = threading.Lock()
+
 class ImageFetcher(QRunnable):
     def __init__(self, url: str):
         super().__init__()
         self.url = url
         self.signals = ImageFetcherSignals()
         self._cancel = False
+        self._started = False
+        self._render = None
         _IN_FLIGHT_FETCHERS.add(self)
 
     def cancel(self):
         self._cancel = True
 
+    def rendered(self, size: QSize, dpr: float = 1.0, radius: float = 0, ellipse: bool = False):
+        """Deliver the image already scaled and masked for the target label instead of the source."""
+        self._render = (size, dpr, radius, ellipse)
+        return self
+
     def auto_cancel_on(self, obj: QObject):
         try:
             obj.destroyed.connect(self.cancel)
@@ -113,26 +161,88 @@ class ImageFetcher(QRunnable):
             pass
         return self
 
+    def _emit_image(self, image):
+        if self._cancel:
+            return
+        if self._render is not None:
+            image = render_artwork(image, *self._render)
+        try:
+            self.signals.image_loaded.emit(image)
+        except RuntimeError:
+            pass
+
+    def _emit_error(self, message):
+        if self._cancel:
+            return
+        try:
+            self.signals.error.emit(message)
+        except RuntimeError:
+            pass
+
+    def _join_or_lead(self, key):
+        with _FETCH_GROUPS_LOCK:
+            group = _FETCH_GROUPS.get(key)
+            # An abandoned group's download is returning None; start a fresh one instead.
+            if group is not None and not group.abandoned():
+                group.subscribers.append(self)
+                return None
+            group = _FetchGroup(self)
+            _FETCH_GROUPS[key] = group
+            return group
+
+    def _download(self, group):
+        return image_http().fetch(self.url, should_abort=group.abandoned)
+
     @pyqtSlot()
     def run(self):
+        self._started = True
         try:
             if self._cancel:
                 return
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-            req = urllib.request.Request(self.url, headers=headers)
-            with urllib.request.urlopen(req, timeout=8) as response:
-                if self._cancel:
-                    return
-                image_data = response.read()
-            if self._cancel:
+            cache = artwork_cache()
+            image = cache.get_image(self.url)
+            if image is not None:
+                self._emit_image(image)
+                return
+
+            key = normalize_artwork_url(self.url)
+            group = self._join_or_lead(key)
+            if group is None:
+                # Another fetcher is already downloading this URL and will deliver to us.
+                cache.record_coalesced()
                 return
-            self.signals.image_loaded.emit(image_data)
+
+            image, error = None, None
+            try:
+                image_data = cache.get_bytes(self.url)
+                from_disk = image_data is not None
+                if not from_disk:
+                    cache.record_miss()
+                    image_data = self._download(group)
+                if image_data is not None:
+                    image = QImage.fromData(image_data)
+                    if image.isNull():
+                        image = None
+                        error = f"Could not decode image from {self.url}"
+                    else:
+                        if not from_disk:
+                            cache.put_bytes(self.url, image_data)
+                        cache.put_image(self.url, image)
+            except (socket.timeout, Exception) as e:
+                error = str(e)
+            finally:
+                with _FETCH_GROUPS_LOCK:
+                    if _FETCH_GROUPS.get(key) is group:
+                        del _FETCH_GROUPS[key]
+                    subscribers = list(group.subscribers)
+
+            for sub in subscribers:
+                if image is not None:
+                    sub._emit_image(image)
+                else:
+                    sub._emit_error(error or f"Download of {self.url} was abandoned")
         except (socket.timeout, Exception) as e:
-            if not self._cancel:
-                try:
-                    self.signals.error.emit(str(e))
-                except RuntimeError:
-                    pass
+            self._emit_error(str(e))
         finally:
             try:
                 _IN_FLIGHT_FETCHERS.discard(self)
@@ -6,9 +6,10 @@ from PyQt6.QtWidgets import (
     QGridLayout
 )
 from PyQt6.QtCore import pyqtSlot, QThreadPool, Qt, QTimer, pyqtSignal, QObject, QEvent, QRect, QSize
-from PyQt6.QtGui import QPixmap, QFontMetrics, QFont, QPainter, QColor, QPaintEvent
+from PyQt6.QtGui import QPixmap, QFontMetrics, QFont, QPainter, QColor, QPaintEvent, QImage
 
 from .search_widgets import ImageFetcher, round_pixmap
+from core.artwork_urls import resolve_artwork_url
 from .search_cards import PlayButton, resource_path, render_svg_tinted
 from .info_dialog import _ElideOnResizeFilter, ShimmerTag
 from PyQt6 import sip
@@ -340,6 +341,7 @@ class TrackSelectionDialog(QDialog):
         super().__init__(parent)
         self.album_data = album_data
         self.track_widgets = []
+        self._quality_applied = set()
         album_attrs = self.album_data.get('albumData', {}).get('attributes', {})
         self.setWindowTitle(f"Select Tracks from '{album_attrs.get('name', 'Album')}'")
         self.setMinimumSize(560, 320)
@@ -382,6 +384,7 @@ class TrackSelectionDialog(QDialog):
     def _on_check_qualities(self):
         self.check_qualities_button.setEnabled(False)
         self.check_qualities_button.setText("Checking...")
+        self._quality_applied.clear()
         tracks_to_probe = [w.track_data.get('trackData') for w in self.track_widgets if w.track_data.get('trackData')]
         self.check_qualities_requested.emit(tracks_to_probe)
 
@@ -390,52 +393,66 @@ class TrackSelectionDialog(QDialog):
         self.check_qualities_button.setText("Check Qualities")
         self.check_qualities_button.setEnabled(True)
         for i, track_widget in enumerate(self.track_widgets):
-            if i < len(updated_tracks):
-                attrs = updated_tracks[i].get('attributes', {})
-                if (layout := track_widget.quality_widget_container.layout()) is not None:
-                    while layout.count():
-                        item = layout.takeAt(0)
-                        if item.widget():
-                            item.widget().deleteLater()
-                else:
-                    layout = QVBoxLayout(track_widget.quality_widget_container)
-                    layout.setContentsMargins(0, 0, 0, 0)
-                    layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-                
-                traits = set(attrs.get('audioTraits', []))
-                sr = attrs.get('sampleRateHz')
-                bd = attrs.get('bitDepth')
-                if not bd:
-                    if 'hi-res-lossless' in traits: bd = 24
-                    elif 'lossless' in traits: bd = 16
-                
-                parts = []
-                if isinstance(bd, int) and bd > 0: parts.append(f"{bd}B")
-                if isinstance(sr, int) and sr > 0:
-                    khz = sr / 1000.0
-                    khz_text = f"{khz:.1f}" if abs(khz - int(khz)) > 1e-3 else f"{int(khz)}"
-                    parts.append(f"{khz_text}kHz")
-
-                if parts:
-                    is_hires = (isinstance(bd, int) and bd >= 24 and isinstance(sr, int) and sr >= 96000)
-                    quality_text = " . ".join(parts)
-                    is_atmos = 'atmos' in traits
-                    
-                    quality_widget = _create_track_quality_widget(
-                        quality_text,
-                        is_hires=is_hires,
-                        is_atmos=is_atmos
-                    )
-                    
-                    if not is_hires:
-                        q_layout = quality_widget.layout()
-                        if q_layout and q_layout.count() > 1:
-                            text_widget_item = q_layout.itemAt(1)
-                            if text_widget_item and isinstance(text_widget_item.widget(), QLabel):
-                                text_widget_item.widget().setProperty("low_res_quality", True)
-
-                    _enable_label_wordwrap(quality_widget)
-                    layout.addWidget(quality_widget)
+            if i < len(updated_tracks) and i not in self._quality_applied:
+                self._apply_track_quality(track_widget, updated_tracks[i].get('attributes', {}))
+                self._quality_applied.add(i)
+
+    @pyqtSlot(int, dict)
+    def update_track_quality(self, index: int, track: dict):
+        if 0 <= index < len(self.track_widgets):
+            self._apply_track_quality(self.track_widgets[index], track.get('attributes', {}))
+            self._quality_applied.add(index)
+
+    @pyqtSlot(int, int)
+    def update_quality_progress(self, done: int, total: int):
+        if total:
+            self.check_qualities_button.setText(f"Checking {done}/{total}")
+
+    def _apply_track_quality(self, track_widget, attrs: dict):
+        if (layout := track_widget.quality_widget_container.layout()) is not None:
+            while layout.count():
+                item = layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+        else:
+            layout = QVBoxLayout(track_widget.quality_widget_container)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+
+        traits = set(attrs.get('audioTraits', []))
+        sr = attrs.get('sampleRateHz')
+        bd = attrs.get('bitDepth')
+        if not bd:
+            if 'hi-res-lossless' in traits: bd = 24
+            elif 'lossless' in traits: bd = 16
+
+        parts = []
+        if isinstance(bd, int) and bd > 0: parts.append(f"{bd}B")
+        if isinstance(sr, int) and sr > 0:
+            khz = sr / 1000.0
+            khz_text = f"{khz:.1f}" if abs(khz - int(khz)) > 1e-3 else f"{int(khz)}"
+            parts.append(f"{khz_text}kHz")
+
+        if parts:
+            is_hires = (isinstance(bd, int) and bd >= 24 and isinstance(sr, int) and sr >= 96000)
+            quality_text = " . ".join(parts)
+            is_atmos = 'atmos' in traits
+
+            quality_widget = _create_track_quality_widget(
+                quality_text,
+                is_hires=is_hires,
+                is_atmos=is_atmos
+            )
+
+            if not is_hires:
+                q_layout = quality_widget.layout()
+                if q_layout and q_layout.count() > 1:
+                    text_widget_item = q_layout.itemAt(1)
+                    if text_widget_item and isinstance(text_widget_item.widget(), QLabel):
+                        text_widget_item.widget().setProperty("low_res_quality", True)
+
+            _enable_label_wordwrap(quality_widget)
+            layout.addWidget(quality_widget)
 
     def update_playback_state(self, state, song_url):
         for widget in self.track_widgets:
@@ -538,18 +555,17 @@ class TrackSelectionDialog(QDialog):
         return header_widget
 
     def _fetch_artwork(self, album_attrs):
-        artwork_url = album_attrs.get('artwork', {}).get('url', '').replace('{w}', '120').replace('{h}', '120')
+        artwork_url = resolve_artwork_url(album_attrs.get('artwork', {}).get('url', ''), self.art_label.width(), self.devicePixelRatioF())
         if artwork_url:
             self.worker = ImageFetcher(artwork_url).auto_cancel_on(self)
             self.worker.signals.image_loaded.connect(self._set_artwork)
             self.worker.signals.error.connect(self._on_artwork_error)
             QThreadPool.globalInstance().start(self.worker)
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        if image_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
             scaled = pixmap.scaled(self.art_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             rounded = round_pixmap(scaled, 6)
             self.art_label.setPixmap(rounded)
@@ -679,18 +695,17 @@ class TrackListingDialog(QDialog):
         return header_widget
 
     def _fetch_artwork(self, album_attrs):
-        artwork_url = album_attrs.get('artwork', {}).get('url', '').replace('{w}', '240').replace('{h}', '240')
+        artwork_url = resolve_artwork_url(album_attrs.get('artwork', {}).get('url', ''), self.art_label.width(), self.devicePixelRatioF())
         if artwork_url:
             self.worker = ImageFetcher(artwork_url).auto_cancel_on(self)
             self.worker.signals.image_loaded.connect(self._set_artwork)
             self.worker.signals.error.connect(self._on_artwork_error)
             QThreadPool.globalInstance().start(self.worker)
 
-    @pyqtSlot(bytes)
-    def _set_artwork(self, image_data):
-        if image_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
+    @pyqtSlot(QImage)
+    def _set_artwork(self, image):
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
             scaled = pixmap.scaled(self.art_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             rounded = round_pixmap(scaled, 8)
             self.art_label.setPixmap(rounded)